@@ -0,0 +1,223 @@
+import heapq
+import random
+import sys
+import time
+from array import array
+
+from snake_engine import DIED, WON, SnakeEngine
+
+# =================================================================
+#                     🤖 A* AUTOPILOT
+# =================================================================
+# Steers a SnakeEngine to the apple: A* over the board's cells with the
+# walls, the body and the fire as blocked cells. A black hole is an edge:
+# stepping onto one puts the head on the other, so a cell next to a hole is
+# also next to the hole's partner. The heuristic is the Manhattan distance,
+# or the distance to a hole plus its partner's distance to the apple when
+# that is shorter, which keeps it admissible with the teleports in.
+#
+# Nothing is allocated per search. dist / parent / move are arrays sized to
+# the board; `stamp` marks which entries belong to the current search (a
+# generation counter, so they never need clearing), and the heap is one
+# reused list of ints: f-score in the high bits, then cells - g so that
+# ties go to the deeper node (an open board has no end of equal-f cells),
+# then the cell.
+#
+# A plan holds until the apple or the holes move, or the head is not where
+# the plan says it should be (restart, turn by a human), so most ticks
+# just pop the next move. A search that runs past budget_us gives up and
+# the tick falls back to a safe move: a free cell with the most free
+# neighbours, closest to the apple on a tie. No path to the apple gives the
+# same fallback.
+
+class Autopilot:
+    def __init__(self, grid_size, budget_us=1000):
+        cells = grid_size * grid_size
+        self.grid_size = grid_size
+        self.budget_ns = int(budget_us * 1000)
+        self.stamp = array("I", bytes(4 * cells))
+        self.dist = array("i", bytes(4 * cells))
+        self.parent = array("i", bytes(4 * cells))
+        self.move = array("b", bytes(cells))      # code that entered the cell
+        self.xs = array("H", [i % grid_size for i in range(cells)])
+        self.ys = array("H", [i // grid_size for i in range(cells)])
+        self.heap = []
+        self.gen = 0
+        self.cells = cells
+        self.shift = cells.bit_length()
+        self.node_mask = (1 << self.shift) - 1
+
+        # plan: moves and the head cell each one starts from, next one last
+        self.plan_moves = array("b")
+        self.plan_cells = array("i")
+        self.plan_key = None
+
+        self.decisions = 0
+        self.searches = 0
+        self.timeouts = 0
+        self.fallbacks = 0
+
+    def decide(self, engine):
+        # Direction code for the next step.
+        self.decisions += 1
+        key = (engine.apple_i, engine.bh1_i, engine.bh2_i)
+        if self.plan_moves and key == self.plan_key and self.plan_cells[-1] == engine.head:
+            self.plan_cells.pop()
+            return self.plan_moves.pop()
+        self.plan_key = key
+        if self._search(engine):
+            self.plan_cells.pop()
+            return self.plan_moves.pop()
+        return self._safe_move(engine)
+
+    def _search(self, e):
+        self.searches += 1
+        del self.plan_moves[:]
+        del self.plan_cells[:]
+        start, goal = e.head, e.apple_i
+        if goal < 0 or e.occupied[goal]:
+            return False            # no apple, or (first draw) under the body
+        self.gen += 1
+        if self.gen > 0xFFFFFFFF:
+            self.stamp = array("I", bytes(len(self.stamp) * 4))
+            self.gen = 1
+        gen = self.gen
+        stamp, dist, parent, move = self.stamp, self.dist, self.parent, self.move
+        xs, ys = self.xs, self.ys
+        table, occupied, fire = e.neighbours, e.occupied, e.obstacle_i
+        bh1, bh2 = e.bh1_i, e.bh2_i
+        cells, node_mask, shift = self.cells, self.node_mask, self.shift
+        f_shift = 2 * shift
+        gx, gy = xs[goal], ys[goal]
+        holes = bh1 >= 0
+        if holes:
+            x1, y1, x2, y2 = xs[bh1], ys[bh1], xs[bh2], ys[bh2]
+            via1 = abs(x2 - gx) + abs(y2 - gy)      # enter hole 1, leave by hole 2
+            via2 = abs(x1 - gx) + abs(y1 - gy)
+
+        heap = self.heap
+        heap.clear()
+        push, pop = heapq.heappush, heapq.heappop
+        stamp[start] = gen
+        dist[start] = 0
+        push(heap, (cells << shift) | start)     # f of the start doesn't matter
+        back = e.heading ^ 1
+        clock = time.perf_counter_ns
+        deadline = clock() + self.budget_ns
+        pops = 0
+        while heap:
+            item = pop(heap)
+            cur = item & node_mask
+            g = dist[cur]
+            if cells - ((item >> shift) & node_mask) != g:
+                continue            # stale entry, cur was reached cheaper since
+            if cur == goal:
+                while cur != start:
+                    self.plan_moves.append(move[cur])
+                    cur = parent[cur]
+                    self.plan_cells.append(cur)
+                return True
+            pops += 1
+            if not pops & 7 and clock() > deadline:
+                self.timeouts += 1
+                return False
+            g += 1
+            base = 4 * cur
+            for code in range(4):
+                n = table[base + code]
+                if n < 0 or occupied[n] or n == fire or (cur == start and code == back):
+                    continue
+                if holes:
+                    if n == bh1:
+                        n = bh2
+                    elif n == bh2:
+                        n = bh1
+                if stamp[n] == gen and dist[n] <= g:
+                    continue
+                stamp[n] = gen
+                dist[n] = g
+                parent[n] = cur
+                move[n] = code
+                x, y = xs[n], ys[n]
+                d = abs(x - gx) + abs(y - gy)
+                if holes:
+                    d = min(d, abs(x - x1) + abs(y - y1) + via1, abs(x - x2) + abs(y - y2) + via2)
+                push(heap, ((g + d) << f_shift) | ((cells - g) << shift) | n)
+        return False
+
+    def _safe_move(self, e):
+        self.fallbacks += 1
+        table, occupied, fire = e.neighbours, e.occupied, e.obstacle_i
+        size = self.grid_size
+        head = e.head
+        apple = e.apple_i if e.apple_i >= 0 else head
+        ax, ay = apple % size, apple // size
+        best, best_score = e.heading, None
+        for code in range(4):
+            if code == e.heading ^ 1:
+                continue
+            n = table[4 * head + code]
+            if n < 0 or occupied[n] or n == fire:
+                continue
+            if n == e.bh1_i:
+                n = e.bh2_i
+            elif n == e.bh2_i:
+                n = e.bh1_i
+            free = 0
+            for c in range(4):
+                m = table[4 * n + c]
+                if m >= 0 and not occupied[m] and m != fire:
+                    free += 1
+            score = (free, -(abs(n % size - ax) + abs(n // size - ay)))
+            if best_score is None or score > best_score:
+                best, best_score = code, score
+        return best
+
+# =================================================================
+#                     ⏱️ AUTOPILOT BENCHMARK
+# =================================================================
+# Back-to-back autopilot games on each board size until `decisions` moves
+# have been made. Decisions/s counts every tick (plan pops included);
+# searches/s only the ticks that ran A*.
+
+def benchmark(grid_size, decisions=20_000, budget_us=1000, seed=0):
+    engine = SnakeEngine(grid_size, seed=seed)
+    pilot = Autopilot(grid_size, budget_us)
+    scores = []
+    spent = search_time = 0.0
+    searches = 0
+    for _ in range(decisions):
+        start = time.perf_counter()
+        before = pilot.searches
+        code = pilot.decide(engine)
+        elapsed = time.perf_counter() - start
+        spent += elapsed
+        if pilot.searches != before:
+            search_time += elapsed
+            searches += 1
+        if engine.step(code) & (DIED | WON):
+            scores.append(engine.score)
+            engine.reset(seed + len(scores))
+    scores.append(engine.score)
+    return {
+        "decisions/s": decisions / spent,
+        "searches/s": searches / search_time if search_time else 0.0,
+        "us/search": search_time / max(searches, 1) * 1e6,
+        "searches": searches,
+        "timeouts": pilot.timeouts,
+        "fallbacks": pilot.fallbacks,
+        "games": len(scores),
+        "mean score": sum(scores) / len(scores),
+        "best score": max(scores),
+    }
+
+if __name__ == "__main__":
+    budget_us = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    random.seed(0)
+    print(f"budget {budget_us} us per tick")
+    for grid_size in (20, 200):
+        r = benchmark(grid_size, budget_us=budget_us)
+        print(f"{grid_size:4d}x{grid_size:<4d} {r['decisions/s']:10,.0f} decisions/s  "
+              f"{r['searches/s']:8,.0f} searches/s ({r['us/search']:6.1f} us, {r['searches']} searches)  "
+              f"timeouts {r['timeouts']}  fallbacks {r['fallbacks']}  "
+              f"games {r['games']}  mean score {r['mean score']:.1f}  best {r['best score']}")
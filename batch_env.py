@@ -0,0 +1,299 @@
+import sys
+import time
+
+import numpy as np
+
+from snake_engine import ATE_APPLE, BOOST_TICKS, DIED, GOT_STAR, HOLE_DISTANCE, TELEPORTED, WON
+
+# =================================================================
+#                     🧮 BATCHED SNAKE ENVIRONMENT
+# =================================================================
+# N games of SnakeEngine rules held as NumPy arrays and stepped in
+# lockstep: every rule is a masked array operation over the games it
+# applies to, so one step() costs a few dozen NumPy calls whatever N is.
+#
+# Cells are flat indices (y * grid_size + x). Directions use the order of
+# snake_engine.DIRECTIONS (0 up, 1 down, 2 left, 3 right); an action of -1
+# keeps the current direction and reversals are ignored, as in the engine.
+#
+#   body      (N, cells) int32  ring buffer of body cells, head at head_ptr
+#   occupied  (N, cells) uint8  segments per cell
+#   apple / obstacle / star / bh1 / bh2   (N,) int32 cells, -1 for none
+#
+# Spawning draws random interior cells for every game that needs one and
+# keeps the ones that are free; games still unserved after SPAWN_ROUNDS
+# draws fall back to an exact pick over their free-cell mask. Boosts are
+# counted in steps (boost_ticks), as in the engine.
+#
+# Finished games (DIED or WON) report their events and final score and are
+# reset in the same call.
+
+DX = np.array([0, 0, -1, 1], dtype=np.int32)
+DY = np.array([-1, 1, 0, 0], dtype=np.int32)
+OPPOSITE = np.array([1, 0, 3, 2], dtype=np.int8)
+RIGHT = 3
+
+SPAWN_ROUNDS = 4
+
+# ---- board() cell codes ----
+EMPTY, BODY, HEAD, APPLE, FIRE, STAR, HOLE = range(7)
+
+class BatchSnakeEnv:
+    def __init__(self, num_games, grid_size=20, boost_ticks=BOOST_TICKS, seed=None):
+        self.num_games = num_games
+        self.grid_size = grid_size
+        self.cells = grid_size * grid_size
+        self.boost_ticks = boost_ticks
+
+        cells = np.arange(self.cells, dtype=np.int32)
+        self.cell_x = cells % grid_size
+        self.cell_y = cells // grid_size
+        self.interior = ((self.cell_x > 0) & (self.cell_x < grid_size - 1) &
+                         (self.cell_y > 0) & (self.cell_y < grid_size - 1))
+        self.rows = np.arange(num_games, dtype=np.int64) * self.cells
+
+        n = num_games
+        self.body = np.zeros((n, self.cells), dtype=np.int32)
+        self.head_ptr = np.zeros(n, dtype=np.int32)
+        self.length = np.zeros(n, dtype=np.int32)
+        self.occupied = np.zeros((n, self.cells), dtype=np.uint8)
+        self.apple = np.zeros(n, dtype=np.int32)
+        self.obstacle = np.zeros(n, dtype=np.int32)
+        self.star = np.zeros(n, dtype=np.int32)
+        self.bh1 = np.full(n, -1, dtype=np.int32)
+        self.bh2 = np.full(n, -1, dtype=np.int32)
+        self.direction = np.zeros(n, dtype=np.int8)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.boosted = np.zeros(n, dtype=bool)
+        self.boost_end = np.zeros(n, dtype=np.int64)
+        self.ticks = np.zeros(n, dtype=np.int64)
+        self.final_score = np.zeros(n, dtype=np.int32)
+        self.episodes = 0
+        self.reset(seed)
+
+    # ---- setup ----
+    def reset(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self._reset_games(np.arange(self.num_games))
+        return self
+
+    def _reset_games(self, games):
+        if len(games) == 0:
+            return
+        size = self.grid_size
+        mid = size // 2
+        start = np.array([mid * size + mid, mid * size + mid - 1, mid * size + mid - 2], dtype=np.int32)
+
+        self.occupied[games] = 0
+        self.body[games, :3] = start
+        self.head_ptr[games] = 0
+        self.length[games] = 3
+        self.occupied.reshape(-1)[(self.rows[games, None] + start).reshape(-1)] = 1
+
+        # Like the engine, the opening items are plain interior draws.
+        items = self.rng.integers(1, size - 1, size=(3, 2, len(games)), dtype=np.int32)
+        cells = items[:, 1] * size + items[:, 0]
+        self.apple[games], self.obstacle[games], self.star[games] = cells
+        self.bh1[games] = -1
+        self.bh2[games] = -1
+        self.direction[games] = RIGHT
+        self.score[games] = 0
+        self.boosted[games] = False
+        self.boost_end[games] = 0
+        self.ticks[games] = 0
+
+    # ---- spawning ----
+    def _spawn(self, games, taken, far_from=None):
+        # One free interior cell per game in `games`, avoiding the cells in
+        # `taken` (arrays aligned with games, -1 = nothing) and, with
+        # far_from, anything closer than HOLE_DISTANCE to that cell.
+        # Returns -1 where a game has no such cell.
+        size = self.grid_size
+        occupied = self.occupied.reshape(-1)
+        result = np.full(len(games), -1, dtype=np.int32)
+        pending = np.arange(len(games))
+
+        for _ in range(SPAWN_ROUNDS):
+            if len(pending) == 0:
+                return result
+            xy = self.rng.integers(1, size - 1, size=(2, len(pending)), dtype=np.int32)
+            cand = xy[1] * size + xy[0]
+            ok = occupied[self.rows[games[pending]] + cand] == 0
+            for t in taken:
+                ok &= cand != t[pending]
+            if far_from is not None:
+                f = far_from[pending]
+                ok &= (np.abs(xy[0] - self.cell_x[f]) + np.abs(xy[1] - self.cell_y[f])) >= HOLE_DISTANCE
+            result[pending[ok]] = cand[ok]
+            pending = pending[~ok]
+
+        if len(pending):
+            # Crowded boards: exact uniform pick over each game's free mask.
+            sub = games[pending]
+            free = (self.occupied[sub] == 0) & self.interior
+            lanes = np.arange(len(pending))
+            for t in taken:
+                cells = t[pending]
+                has = cells >= 0
+                free[lanes[has], cells[has]] = False
+            if far_from is not None:
+                f = far_from[pending]
+                dist = (np.abs(self.cell_x - self.cell_x[f][:, None]) +
+                        np.abs(self.cell_y - self.cell_y[f][:, None]))
+                free &= dist >= HOLE_DISTANCE
+            counts = free.sum(axis=1)
+            k = (self.rng.random(len(pending)) * counts).astype(np.int64)
+            pick = (np.cumsum(free, axis=1) > k[:, None]).argmax(axis=1)
+            result[pending] = np.where(counts > 0, pick, -1)
+        return result
+
+    def _place_holes(self, games):
+        taken = (self.apple[games], self.obstacle[games], self.star[games])
+        b1 = self._spawn(games, taken)
+        b2 = np.full(len(games), -1, dtype=np.int32)
+        has = b1 >= 0
+        if has.any():
+            sub = games[has]
+            b2[has] = self._spawn(sub, (b1[has],) + tuple(t[has] for t in taken), far_from=b1[has])
+        pair = b2 >= 0
+        self.bh1[games] = np.where(pair, b1, -1)
+        self.bh2[games] = np.where(pair, b2, -1)
+
+    # ---- rules ----
+    def step(self, actions=None):
+        # actions: (N,) directions or -1. Returns (N,) uint8 event flags.
+        size = self.grid_size
+        occupied = self.occupied.reshape(-1)
+        body = self.body.reshape(-1)
+        rows = self.rows
+
+        if actions is not None:
+            actions = np.asarray(actions, dtype=np.int8)
+            turn = (actions >= 0) & (actions != OPPOSITE[self.direction])
+            self.direction = np.where(turn, actions, self.direction)
+
+        head = body[rows + self.head_ptr]
+        d = self.direction
+        nx = self.cell_x[head] + DX[d]
+        ny = self.cell_y[head] + DY[d]
+        new_head = ny * size + nx
+        inside = (nx >= 0) & (ny >= 0) & (nx < size) & (ny < size)
+        events = np.zeros(self.num_games, dtype=np.uint8)
+        self.ticks += 1
+
+        # ---- walls and body (the tail is still on the board) ----
+        alive = inside.copy()
+        alive[inside] = occupied[rows[inside] + new_head[inside]] == 0
+        events[~alive] = DIED
+        live = np.flatnonzero(alive)
+
+        # ---- push the head ----
+        hp = (self.head_ptr[live] - 1) % self.cells
+        self.head_ptr[live] = hp
+        cell = new_head[live]
+        body[rows[live] + hp] = cell
+        occupied[rows[live] + cell] += 1
+        self.length[live] += 1
+
+        # ---- apple / star / fire ----
+        ate = cell == self.apple[live]
+        got_star = ~ate & (cell == self.star[live])
+        fire = ~ate & ~got_star & (cell == self.obstacle[live])
+
+        g = live[ate]
+        if len(g):
+            events[g] |= ATE_APPLE
+            self.score[g] += 1
+            self.apple[g] = self._spawn(g, (self.obstacle[g], self.star[g]))
+        g = live[got_star]
+        if len(g):
+            events[g] |= GOT_STAR
+            self.star[g] = self._spawn(g, (self.apple[g], self.obstacle[g]))
+            self.boosted[g] = True
+            self.boost_end[g] = self.ticks[g] + self.boost_ticks
+        events[live[fire]] |= DIED
+        won = (self.apple < 0) | (self.star < 0)
+        events[won] |= WON
+
+        on = live[~fire]
+        on = on[~won[on]]
+        cell = new_head[on]
+
+        # ---- black holes: first pair at score 2, teleport, re-spawn ----
+        need = on[(self.score[on] >= 2) & (self.bh1[on] < 0)]
+        if len(need):
+            self._place_holes(need)
+        at1 = (self.bh1[on] >= 0) & (cell == self.bh1[on])
+        at2 = (self.bh2[on] >= 0) & (cell == self.bh2[on])
+        jump = at1 | at2
+        if jump.any():
+            g = on[jump]
+            out = np.where(at1[jump], self.bh2[g], self.bh1[g])
+            occupied[rows[g] + cell[jump]] -= 1
+            body[rows[g] + self.head_ptr[g]] = out
+            occupied[rows[g] + out] += 1
+            events[g] |= TELEPORTED
+            self._place_holes(g)
+
+        # ---- pop the tail unless the snake grew ----
+        g = on[(events[on] & ATE_APPLE) == 0]
+        tail_ptr = (self.head_ptr[g] + self.length[g] - 1) % self.cells
+        occupied[rows[g] + body[rows[g] + tail_ptr]] -= 1
+        self.length[g] -= 1
+
+        self.boosted &= self.ticks <= self.boost_end
+
+        # ---- auto-reset finished games ----
+        done = np.flatnonzero(events & (DIED | WON))
+        if len(done):
+            self.final_score[done] = self.score[done]
+            self.episodes += len(done)
+            self._reset_games(done)
+        return events
+
+    # ---- views ----
+    def snake(self, game):
+        # Body of one game as [x, y] cells, head first (for drawing/tests).
+        ptr, length = self.head_ptr[game], self.length[game]
+        cells = np.roll(self.body[game], -ptr)[:length]
+        return [[int(c % self.grid_size), int(c // self.grid_size)] for c in cells]
+
+    def board(self, out=None, games=slice(None)):
+        # (n, grid_size, grid_size) uint8 grid of the cell codes above for
+        # the selected games, written into `out` when given.
+        occupied = self.occupied[games]
+        n = len(occupied)
+        if out is None:
+            out = np.empty((n, self.grid_size, self.grid_size), dtype=np.uint8)
+        flat = out.reshape(n, self.cells)
+        np.minimum(occupied, BODY, out=flat)
+        lanes = np.arange(n)
+        flat[lanes, self.obstacle[games]] = FIRE
+        flat[lanes, self.star[games]] = STAR
+        flat[lanes, self.apple[games]] = APPLE
+        for holes in (self.bh1[games], self.bh2[games]):
+            has = holes >= 0
+            flat[lanes[has], holes[has]] = HOLE
+        flat[lanes, self.body[games][lanes, self.head_ptr[games]]] = HEAD
+        return out
+
+# =================================================================
+#                     ⏱️ BATCH BENCHMARK
+# =================================================================
+
+def benchmark(num_games=4096, steps=500, grid_size=20, seed=0):
+    env = BatchSnakeEnv(num_games, grid_size, seed=seed)
+    rng = np.random.default_rng(seed)
+    actions = rng.integers(-1, 4, size=(steps, num_games), dtype=np.int8)
+    actions[rng.random((steps, num_games)) < 0.7] = -1
+    start = time.perf_counter()
+    for t in range(steps):
+        env.step(actions[t])
+    elapsed = time.perf_counter() - start
+    return num_games * steps / elapsed, env.episodes
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [256, 1024, 4096, 16384]
+    for n in sizes:
+        rate, episodes = benchmark(n)
+        print(f"{n:6d} games x 500 steps: {rate:12,.0f} steps/s ({episodes} episodes)")
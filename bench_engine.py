@@ -0,0 +1,264 @@
+import copy
+import math
+import sys
+import time
+import tracemalloc
+
+from snake_engine import DIED, SnakeEngine
+
+# =================================================================
+#                     ⏱️ ENGINE STEP BENCHMARK
+# =================================================================
+# Lays a snake of a given length out in serpentine rows at the top of a
+# board big enough to hold it, then times straight moves down into the
+# free half. "list scan" is what one step used to cost (membership test
+# over a list of cells, insert at the front, pop the tail); "engine" is
+# SnakeEngine.step() on the array('I') ring + occupancy grid.
+
+def serpentine_body(grid_size, length):
+    cells = []
+    for y in range(grid_size):
+        xs = range(grid_size) if y % 2 == 0 else range(grid_size - 1, -1, -1)
+        for x in xs:
+            cells.append([x, y])
+            if len(cells) == length:
+                return cells[::-1]    # head is the last cell laid
+    return cells[::-1]
+
+def board_for(length):
+    return max(20, math.isqrt(2 * length) + 2)
+
+def legacy_step(snake, direction, grid_size):
+    head = snake[0]
+    new_head = [head[0] + direction[0], head[1] + direction[1]]
+    if new_head in snake or new_head[0] < 0 or new_head[1] < 0 or new_head[0] >= grid_size or new_head[1] >= grid_size:
+        return False
+    snake.insert(0, new_head)
+    snake.pop()
+    return True
+
+def bench_length(length, min_steps):
+    grid_size = board_for(length)
+    body = serpentine_body(grid_size, length)
+    run = grid_size - 2 - body[0][1]     # free rows below the head
+
+    legacy = engine = 0.0
+    steps = 0
+    while steps < min_steps:
+        snake = [cell.copy() for cell in body]
+        start = time.perf_counter()
+        for _ in range(run):
+            legacy_step(snake, [0, 1], grid_size)
+        legacy += time.perf_counter() - start
+
+        game = SnakeEngine(grid_size)
+        game.set_snake(body)
+        game.direction = [0, 1]
+        game.apple = game.obstacle = game.star = [-1, -1]   # keep items out of the way
+        start = time.perf_counter()
+        for _ in range(run):
+            if game.step() & DIED:
+                raise RuntimeError("benchmark snake died")
+        engine += time.perf_counter() - start
+        steps += run
+    return grid_size, legacy / steps * 1e6, engine / steps * 1e6
+
+# =================================================================
+#                     ⏱️ SPAWN BENCHMARK
+# =================================================================
+# Covers a 100x100 board until only a given number of interior cells are
+# free and times picking an apple cell: the old randint-until-free loop
+# (O(1) per try thanks to the occupancy grid, but the number of tries grows
+# with the fill) against one draw from the free-cell index.
+
+def body_leaving(grid_size, free):
+    cells = serpentine_body(grid_size, grid_size * grid_size)[::-1]
+    left = (grid_size - 2) ** 2
+    for n, (x, y) in enumerate(cells):
+        if left == free:
+            return cells[:n][::-1]
+        if 0 < x < grid_size - 1 and 0 < y < grid_size - 1:
+            left -= 1
+    return cells[::-1]
+
+def legacy_spawn(game, rng, *taken):
+    size = game.grid_size
+    while True:
+        cand = [rng.randint(1, size - 2), rng.randint(1, size - 2)]
+        if not game.is_occupied(cand) and cand not in taken:
+            return cand
+
+def bench_spawn(free, grid_size=100, picks=2000):
+    game = SnakeEngine(grid_size, seed=0)
+    game.set_snake(body_leaving(grid_size, free))
+    game.obstacle = game.star = [-1, -1]
+    rng = game.rng
+
+    start = time.perf_counter()
+    for _ in range(picks):
+        legacy_spawn(game, rng, game.obstacle, game.star)
+    legacy = (time.perf_counter() - start) / picks * 1e6
+
+    start = time.perf_counter()
+    for _ in range(picks):
+        game._free_cell(game.obstacle_i, game.star_i)
+    indexed = (time.perf_counter() - start) / picks * 1e6
+    return len(game.snake), legacy, indexed
+
+# =================================================================
+#                     ⏱️ BLACK-HOLE PLACEMENT BENCHMARK
+# =================================================================
+# Times place_black_holes() on boards of different sizes and fill levels.
+# The old pair loop is shown for reference; it ignored the body and items,
+# so on a crowded board most of its pairs were invalid.
+
+def legacy_holes(rng, grid_size):
+    hi = grid_size - 2
+    while True:
+        b1 = [rng.randint(1, hi), rng.randint(1, hi)]
+        b2 = [rng.randint(1, hi), rng.randint(1, hi)]
+        if abs(b1[0]-b2[0]) + abs(b1[1]-b2[1]) >= 5:
+            return b1, b2
+
+def bench_holes(grid_size, free, picks=2000):
+    game = SnakeEngine(grid_size, seed=0)
+    if free is not None:
+        game.set_snake(body_leaving(grid_size, free))
+    game.apple = game.obstacle = game.star = [-1, -1]
+    game.place_black_holes()    # build the offset ring outside the timing
+    rng = game.rng
+
+    start = time.perf_counter()
+    bad = 0
+    for _ in range(picks):
+        for b in legacy_holes(rng, grid_size):
+            bad += game.is_occupied(b)
+    legacy = (time.perf_counter() - start) / picks * 1e6
+
+    start = time.perf_counter()
+    for _ in range(picks):
+        game.place_black_holes()
+    placed = (time.perf_counter() - start) / picks * 1e6
+    return legacy, bad / (2 * picks), placed
+
+# =================================================================
+#                     ⏱️ CLONE BENCHMARK
+# =================================================================
+# Copying a game for search: deepcopy of the ten values game() used to
+# keep in locals, against snapshot() (with and without the RNG state) and
+# restore() into an existing engine.
+
+def bench_clone(length, clones=2000):
+    grid_size = board_for(length)
+    game = SnakeEngine(grid_size, seed=0)
+    game.set_snake(serpentine_body(grid_size, length))
+    locals_ = (list(map(list, game.snake)), game.apple, game.obstacle, game.star,
+               game.direction, game.score, game.boosted, game.boost_end, game.bh1, game.bh2)
+
+    def per_clone(fn):
+        start = time.perf_counter()
+        for _ in range(clones):
+            fn()
+        return (time.perf_counter() - start) / clones * 1e6
+
+    deep = per_clone(lambda: copy.deepcopy(locals_))
+    snap = per_clone(game.snapshot)
+    bare = per_clone(lambda: game.snapshot(rng=False))
+    saved = game.snapshot()
+    restore = per_clone(lambda: game.restore(saved))
+    return deep, snap, bare, restore
+
+# =================================================================
+#                     ⏱️ RESTORE BENCHMARK
+# =================================================================
+# restore() alone, the way a search uses it: restore a snapshot, play a
+# few steps, restore again. "board copy" is the first restore into an
+# engine (slice copies of the board-sized buffers), "touched cells" the
+# later ones, which put back only what the steps in between changed.
+
+def bench_restore(grid_size, length, steps=20, restores=500):
+    game = SnakeEngine(grid_size, seed=0)
+    game.set_snake(serpentine_body(grid_size, length))
+    game.heading = 1                    # down, into the free half
+    saved = game.snapshot(rng=False)
+    copied = touched = 0.0
+    for _ in range(restores):
+        game.touched = None             # forget the log: the next restore copies
+        start = time.perf_counter()
+        game.restore(saved)
+        copied += time.perf_counter() - start
+        for _ in range(steps):
+            game.step()
+        start = time.perf_counter()
+        game.restore(saved)
+        touched += time.perf_counter() - start
+    return copied / restores * 1e6, touched / restores * 1e6
+
+# =================================================================
+#                     📏 BODY MEMORY
+# =================================================================
+# Bytes the body itself holds, per segment: the list of fresh [x, y] lists
+# game() used to build (tracemalloc, so the coordinate ints past the small
+# int cache count too) against the engine's array('I') ring, which is
+# allocated once at the board's capacity.
+
+def list_body_bytes(grid_size, length):
+    indices = [cell[1] * grid_size + cell[0] for cell in serpentine_body(grid_size, length)]
+    tracemalloc.start()
+    body = [[i % grid_size, i // grid_size] for i in indices]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del body
+    return size / length
+
+def ring_body_bytes(grid_size, length):
+    game = SnakeEngine(grid_size)
+    game.set_snake(serpentine_body(grid_size, length))
+    ring = len(game.body) * game.body.itemsize
+    return ring / length, ring
+
+def main():
+    lengths = [int(a) for a in sys.argv[1:]] or [10, 1_000, 100_000]
+    print("snake length   board        list scan      engine       speedup")
+    for length in lengths:
+        min_steps = 20_000 if length <= 1_000 else 500
+        grid_size, legacy, engine = bench_length(length, min_steps)
+        print(f"{length:8d}   {grid_size:4d}x{grid_size:<4d}  {legacy:9.2f} us   {engine:7.2f} us   "
+              f"{legacy / engine:7.1f}x")
+
+    print()
+    print("spawn on 100x100   snake length   free cells   randint loop   free index")
+    for free in (5000, 500, 50, 5, 1):
+        length, legacy, indexed = bench_spawn(free)
+        print(f"                   {length:8d}     {free:8d}   {legacy:9.2f} us   {indexed:7.2f} us")
+
+    print()
+    print("black holes          free cells   old loop (holes on body)   placement")
+    for grid_size, free in ((20, None), (100, None), (1000, None), (100, 500), (100, 20)):
+        legacy, bad, placed = bench_holes(grid_size, free)
+        label = "empty" if free is None else f"{free}"
+        print(f"{grid_size:4d}x{grid_size:<4d}          {label:>8s}   {legacy:7.2f} us ({bad:4.0%})         {placed:7.2f} us")
+
+    print()
+    print("body memory      board        list of [x, y]   array('I') ring")
+    for length in lengths:
+        grid_size = board_for(length)
+        listed = list_body_bytes(grid_size, length)
+        per_segment, ring = ring_body_bytes(grid_size, length)
+        print(f"length {length:7d}  {grid_size:4d}x{grid_size:<4d}  {listed:8.1f} B/seg     "
+              f"{per_segment:8.1f} B/seg ({ring / 1024:,.0f} KiB)")
+
+    print()
+    print("clone          deepcopy     snapshot   snapshot(rng=False)   restore")
+    for length in (10, 100, 1_000):
+        deep, snap, bare, restore = bench_clone(length)
+        print(f"length {length:5d}  {deep:8.2f} us  {snap:8.2f} us  {bare:8.2f} us            {restore:8.2f} us")
+
+    print()
+    print("restore after 20 steps   board copy   touched cells")
+    for grid_size, length in ((20, 10), (20, 200), (100, 10), (100, 1_000), (300, 10), (300, 10_000)):
+        copied, touched = bench_restore(grid_size, length)
+        print(f"{grid_size:4d}x{grid_size:<4d} length {length:6d}  {copied:8.2f} us  {touched:8.2f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import os
+import sys
+import time
+
+# Run without a real window.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import startmenudone as game
+
+# =================================================================
+#                     ⏱️ MENU CPU BENCHMARK
+# =================================================================
+# Leaves each menu screen idle for a few seconds (a timer presses ENTER
+# at the end) and reports how much CPU the process burned meanwhile.
+
+def key_event(key, unicode=""):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0, scancode=0)
+
+def idle_cpu(run, seconds):
+    pygame.event.clear()
+    pygame.time.set_timer(key_event(pygame.K_RETURN), int(seconds * 1000), 1)
+    wall, cpu = time.perf_counter(), time.process_time()
+    run()
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    return cpu / wall * 100.0, wall
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+
+    def username():
+        pygame.event.post(key_event(pygame.K_a, "a"))
+        game.ask_username()
+
+    screens = [("ask_username", username),
+               ("start_menu", lambda: game.start_menu("bench")),
+               ("quit_confirm", game.quit_confirm)]
+
+    for name, run in screens:
+        cpu, wall = idle_cpu(run, seconds)
+        print(f"{name:13s} {cpu:6.1f}% CPU over {wall:.1f} s")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import os
+import sys
+import time
+
+# Run without a real window.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import startmenudone as game
+from renderer import BackgroundLayer, ChunkedRenderer, DirtyRenderer, draw_snake_head
+from sprite_atlas import SpriteAtlas
+
+# =================================================================
+#                     ⏱️ ITEM RENDER BENCHMARK
+# =================================================================
+# Fills the board with apples / fire / stars / black holes and times one
+# frame of item drawing, before (font render + scale per item) and after
+# (one blit per item from the sprite atlas).
+
+def legacy_draw_items(items):
+    screen, cs = game.screen, game.CELL_SIZE
+    for kind, pos in items:
+        if kind == "apple":
+            surf, rect = game.apple_font.render("🍎", game.RED)
+            rect.topleft = (pos[0]*cs, pos[1]*cs)
+        elif kind == "fire":
+            surf, rect = game.fire_font.render("🔥", game.ORANGE)
+            rect.center = (pos[0]*cs + cs//2, pos[1]*cs + cs//2)
+        elif kind == "star":
+            surf, rect = game.star_font.render("⭐", game.YELLOW)
+            surf = pygame.transform.scale(surf, (cs, cs))
+            rect.topleft = (pos[0]*cs, pos[1]*cs)
+        else:
+            surf, rect = game.hole_font.render("⚫", game.BLACK)
+            surf = pygame.transform.scale(surf, (cs, cs))
+            rect.topleft = (pos[0]*cs, pos[1]*cs)
+        game.screen.blit(surf, rect)
+
+def atlas_draw_items(items):
+    for kind, pos in items:
+        game.atlas.draw(game.screen, kind, pos)
+
+def time_frames(draw, items, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.screen.fill(game.WHITE)
+        draw(items)
+    return (time.perf_counter() - start) / frames * 1000.0
+
+# ---- background: fill + line grid vs one baked blit ----
+def legacy_background(target, grid_size, cell_size):
+    width = height = grid_size * cell_size
+    target.fill(game.WHITE)
+    for x in range(0, width, cell_size):
+        pygame.draw.line(target, game.GRAY, (x, 0), (x, height))
+    for y in range(0, height, cell_size):
+        pygame.draw.line(target, game.GRAY, (0, y), (width, y))
+
+def bench_background(grid_size, cell_size, frames):
+    target = pygame.Surface((grid_size * cell_size, grid_size * cell_size)).convert()
+    layer = BackgroundLayer(grid_size, cell_size, game.WHITE, game.GRAY)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        legacy_background(target, grid_size, cell_size)
+    before = (time.perf_counter() - start) / frames * 1000.0
+
+    layer.get()
+    start = time.perf_counter()
+    for _ in range(frames):
+        layer.draw(target)
+    after = (time.perf_counter() - start) / frames * 1000.0
+    return before, after
+
+# ---- full redraw vs dirty rectangles on a moving snake ----
+def serpentine(grid_size):
+    path = []
+    for y in range(grid_size):
+        xs = range(grid_size) if y % 2 == 0 else range(grid_size - 1, -1, -1)
+        path.extend([x, y] for x in xs)
+    return path
+
+def bench_dirty(grid_size, cell_size, frames, length=None):
+    target = pygame.Surface((grid_size * cell_size, grid_size * cell_size)).convert()
+    layer = BackgroundLayer(grid_size, cell_size, game.WHITE, game.GRAY)
+    atlas = SpriteAtlas(cell_size)
+    atlas.add("apple", game.apple_font, "🍎", game.RED)
+    atlas.add("star", game.star_font, "⭐", game.YELLOW, scale=True)
+
+    def draw_hud(score):
+        s, _ = game.score_font.render(f"Score: {score}", game.BLACK)
+        target.blit(s, (8, 6))
+
+    def hud_rects(score):
+        r = game.score_font.get_rect(f"Score: {score}")
+        return [pygame.Rect(8, 6, r.width, r.height).inflate(4, 4)]
+
+    path = serpentine(grid_size)
+    length = length or len(path) // 4
+    path += path[:frames + 200]
+
+    def state(t):
+        snake = path[t + length:t:-1]
+        apple = path[(t // 50) * 50 + length + 60]
+        star = path[(t // 50) * 50 + length + 90]
+        return snake, [("apple", apple), ("star", star)], t // 50
+
+    def full(t):
+        snake, items, score = state(t)
+        layer.draw(target)
+        for seg in snake[1:]:
+            pygame.draw.rect(target, game.GREEN,
+                             pygame.Rect(seg[0]*cell_size, seg[1]*cell_size, cell_size, cell_size))
+        draw_snake_head(target, snake[0], [1, 0], game.GREEN, cell_size)
+        for name, pos in items:
+            atlas.draw(target, name, pos)
+        draw_hud(score)
+
+    renderer = DirtyRenderer(target, cell_size, layer, atlas, draw_hud, hud_rects)
+
+    def dirty(t):
+        snake, items, score = state(t)
+        renderer.render(snake, [1, 0], game.GREEN, items, (score,))
+
+    results = []
+    for draw in (full, dirty):
+        wall, cpu = time.perf_counter(), time.process_time()
+        for t in range(frames):
+            draw(t)
+        results.append(((time.perf_counter() - wall) / frames * 1000.0,
+                        (time.process_time() - cpu) / frames * 1000.0))
+    return length, results
+
+# ---- snake drawing: full redraw with draw.rect per segment ----
+def bench_snake(grid_size, cell_size, length, frames):
+    target = pygame.Surface((grid_size * cell_size, grid_size * cell_size)).convert()
+    snake = serpentine(grid_size)[length - 1::-1]
+    start = time.perf_counter()
+    for _ in range(frames):
+        for seg in snake[1:]:
+            pygame.draw.rect(target, game.GREEN,
+                             pygame.Rect(seg[0]*cell_size, seg[1]*cell_size, cell_size, cell_size))
+        draw_snake_head(target, snake[0], [1, 0], game.GREEN, cell_size)
+    return (time.perf_counter() - start) / frames * 1000.0
+
+# ---- large boards: camera view over cached chunks ----
+def bench_camera(grid_size, frames, length=40, substeps=4):
+    cell_size = game.CELL_SIZE
+    renderer = ChunkedRenderer(game.screen, grid_size, cell_size, game.WHITE, game.GRAY,
+                               game.atlas, lambda *hud: None, tiles=game.snake_tiles)
+    row = grid_size // 2
+    start = time.perf_counter()
+    for t in range(frames):
+        step = t // substeps
+        snake = [[x, row] for x in range(step + length, step, -1)]
+        items = [("apple", [step + length + 40, row + 2]), ("star", [step + length + 70, row - 3])]
+        renderer.render(snake, [1, 0], game.GREEN, items, (),
+                        progress=(t % substeps) / substeps)
+    return (time.perf_counter() - start) / frames * 1000.0, renderer.builds / frames
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    kinds = ["apple", "fire", "star", "hole"]
+    items = [(kinds[(x + y) % 4], [x, y])
+             for y in range(game.GRID_SIZE) for x in range(game.GRID_SIZE)]
+
+    before = time_frames(legacy_draw_items, items, frames)
+    after = time_frames(atlas_draw_items, items, frames)
+
+    print(f"items per frame : {len(items)}")
+    print(f"before (render) : {before:8.3f} ms/frame")
+    print(f"after  (atlas)  : {after:8.3f} ms/frame")
+    print(f"speedup         : {before / after:8.1f}x")
+
+    print()
+    print("background         grid draw     baked blit")
+    for grid_size, cell_size in ((20, 30), (100, 8), (200, 4)):
+        before, after = bench_background(grid_size, cell_size, frames)
+        print(f"{grid_size:3d}x{grid_size:<3d} @ {cell_size:2d}px  "
+              f"{before:8.3f} ms   {after:8.3f} ms")
+
+    print()
+    print("moving snake       full redraw (wall/cpu)     dirty rects (wall/cpu)")
+    for grid_size, cell_size in ((20, 30), (200, 4)):
+        length, ((fw, fc), (dw, dc)) = bench_dirty(grid_size, cell_size, frames)
+        print(f"{grid_size:3d}x{grid_size:<3d} len {length:5d}  "
+              f"{fw:8.3f} / {fc:8.3f} ms     {dw:8.3f} / {dc:8.3f} ms")
+
+    print()
+    print("snake on 100x100 @ 8px   draw.rect full redraw   dirty frame")
+    for length in (100, 2500, 5000, 9000):
+        legacy = bench_snake(100, 8, length, frames)
+        _, (_, (dirty, _)) = bench_dirty(100, 8, frames, length)
+        print(f"length {length:5d}              {legacy:8.3f} ms          {dirty:8.3f} ms")
+
+    print()
+    print("camera view (600x600 window)   ms/frame   chunk builds/frame")
+    for grid_size in (100, 1000, 5000):
+        ms, builds = bench_camera(grid_size, frames * 4)
+        print(f"{grid_size:5d}x{grid_size:<5d} board             {ms:8.3f}   {builds:8.2f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,596 @@
+import random
+import sys
+import time
+from array import array
+
+from autopilot import Autopilot
+from snake_engine import DIED, NONE, WON, SnakeEngine
+
+# =================================================================
+#                     🔁 HAMILTONIAN CYCLE
+# =================================================================
+# A closed tour of the board that a snake can follow forever: every
+# interior cell except the fire, plus whichever border cells fit. Items
+# only spawn on interior cells, so a snake that has covered the tour has
+# covered everything an apple could land on, and the game is won - on a
+# board without black holes (see the follower below).
+#
+# The fire is fixed for a game and kills, so it has to be left out. On an
+# even board that cannot be the only cell left out: the board is a
+# chessboard, a cycle alternates colours, and dropping one cell leaves one
+# colour a cell short. A border cell of the other colour goes too, which
+# costs nothing since nothing spawns there.
+#
+# Layout, on an even square (an odd board uses the even square in one
+# corner; its last row and column are border and stay off the tour):
+#
+#   - the right column is the return lane, bottom to top;
+#   - the other columns are 2-row bands, each a U: right to left along its
+#     top row, back along its bottom row, turning at the left wall;
+#   - the band holding the fire and the band next to it become two
+#     vertical zigzags instead, one going left, one coming back. A zigzag
+#     visits both cells of each column, so losing a cell (the fire, or the
+#     dropped wall cell at the turn) swaps which row it carries on along.
+#     With both gone it ends up on the row it would have anyway.
+#
+# Which band pairs with the fire's depends on the fire's colour. Near a
+# corner the pairing may not exist, so the layout is tried under the 8
+# rotations and flips of the square and the first closed tour wins. Tours
+# are cached per board size and fire cell: a game builds its tour once.
+
+_CYCLES = {}
+
+# (to board, from board) coordinate maps on a side x side square
+_SYMMETRIES = [
+    (lambda x, y, s: (x, y), lambda x, y, s: (x, y)),
+    (lambda x, y, s: (x, s - 1 - y), lambda x, y, s: (x, s - 1 - y)),
+    (lambda x, y, s: (s - 1 - x, y), lambda x, y, s: (s - 1 - x, y)),
+    (lambda x, y, s: (s - 1 - x, s - 1 - y), lambda x, y, s: (s - 1 - x, s - 1 - y)),
+    (lambda x, y, s: (y, x), lambda x, y, s: (y, x)),
+    (lambda x, y, s: (s - 1 - y, s - 1 - x), lambda x, y, s: (s - 1 - y, s - 1 - x)),
+    (lambda x, y, s: (s - 1 - y, x), lambda x, y, s: (y, s - 1 - x)),
+    (lambda x, y, s: (y, s - 1 - x), lambda x, y, s: (s - 1 - y, x)),
+]
+
+def _layout(side, fire=None, band=0, top=True):
+    # The tour on a side x side square as (x, y) cells. With a fire, bands
+    # `band` and `band` + 1 are zigzags and the fire is in the first of
+    # them (top=True) or the second; the wall cell at that band's turn is
+    # the one dropped.
+    order = []
+    skip = ()
+    if fire is not None:
+        y0 = 2 * band
+        skip = (fire, (0, y0) if top else (0, y0 + 3))
+    b = 0
+    while b < side // 2:
+        y0 = 2 * b
+        if fire is not None and b == band:
+            for first, x_range in ((y0, range(side - 2, -1, -1)), (y0 + 2, range(side - 1))):
+                row = first
+                for x in x_range:
+                    for cell in ((x, row), (x, 2 * first + 1 - row)):
+                        if cell not in skip:
+                            order.append(cell)
+                    row = order[-1][1]
+            b += 2
+        else:
+            order.extend((x, y0) for x in range(side - 2, -1, -1))
+            order.extend((x, y0 + 1) for x in range(side - 1))
+            b += 1
+    order.extend((side - 1, y) for y in range(side - 1, -1, -1))
+    return order
+
+def _closed(order, size, fire):
+    # A tour of distinct on-board cells, each next to the one before, the
+    # last next to the first, covering the interior and avoiding the fire.
+    seen = bytearray(size * size)
+    px, py = order[-1]
+    for x, y in order:
+        if abs(x - px) + abs(y - py) != 1 or not (0 <= x < size and 0 <= y < size):
+            return False
+        i = y * size + x
+        if seen[i]:
+            return False
+        seen[i] = 1
+        px, py = x, y
+    if fire is not None and seen[fire[1] * size + fire[0]]:
+        return False
+    missing = (size - 2) ** 2 - (fire is not None)
+    for y in range(1, size - 1):
+        missing -= sum(seen[y * size + 1:(y + 1) * size - 1])
+    return missing == 0
+
+def _tour(size, fire):
+    side = size - size % 2
+    if side < 4:
+        return None
+    if fire is None:
+        return _layout(side)
+    for offset in ((0, 1) if size % 2 else (0,)):
+        fx, fy = fire[0] - offset, fire[1] - offset
+        if not (0 <= fx < side and 0 <= fy < side):
+            continue
+        for to_board, from_board in _SYMMETRIES:
+            cx, cy = from_board(fx, fy, side)
+            band = cy // 2
+            for b, top in ((band, True), (band - 1, False)):
+                if not 0 <= b < side // 2 - 1:
+                    continue
+                order = [to_board(x, y, side) for x, y in _layout(side, (cx, cy), b, top)]
+                order = [(x + offset, y + offset) for x, y in order]
+                if _closed(order, size, fire):
+                    return order
+    return None
+
+def hamiltonian_cycle(size, fire=NONE):
+    # (order, pos) for a board with the fire on cell index `fire` (NONE for
+    # no fire): order[k] is the k-th cell of the tour, pos[i] the place of
+    # cell i in it or -1 for cells off the tour.
+    key = (size, fire)
+    if key not in _CYCLES:
+        order = _tour(size, None if fire < 0 else (fire % size, fire // size))
+        if order is None:
+            raise ValueError(f"no Hamiltonian tour for a {size}x{size} board with fire at {fire}")
+        order = array("i", [y * size + x for x, y in order])
+        pos = array("i", [-1]) * (size * size)
+        for k, i in enumerate(order):
+            pos[i] = k
+        _CYCLES[key] = (order, pos)
+    return _CYCLES[key]
+
+# =================================================================
+#                     🧭 TOUR FOLLOWER
+# =================================================================
+# Follows the tour, cutting corners while the snake is short. The rule
+# that keeps it alive: going from tail to head, the body's places on the
+# tour only ever increase (around the cycle, spanning less than one lap).
+# Then every cell on the tour strictly between the head and the tail is
+# free, and the head may step to any neighbour whose place lies in that
+# stretch: the rule still holds afterwards, and the next cell along the
+# tour is always such a neighbour. A neighbour further along than the next
+# cell is a shortcut; the cells it jumps are gaps, left for the next lap.
+#
+# Shortcuts only go as far as the apple and leave `margin` cells before the
+# tail, so the apples eaten before the tail moves on (each one stops it for
+# a step) cannot close the gap. They stop once the snake is `share` of the
+# tour long, or after a lap without an apple (it is going round in
+# circles): from there it follows the tour, which is what clears the board.
+#
+# A black hole is a neighbour whose place is its partner's (stepping on it
+# puts the head there), so a teleport is a shortcut like any other. The
+# head keeps its heading through it, so the way on from the partner can be
+# straight back, which is no way on. The first hole ahead is a wall when
+# that happens or when the partner lies behind the head (in a gap), and a
+# shortcut past it is taken as soon as there is one, margin or not.
+#
+# Holes only move when the head goes through one, so a wall stays where it
+# is until the snake gets past it. A short snake cuts round it; a long one
+# has no free cell beside the tour to cut through, so it meets the same
+# wall on every lap. After three laps' worth of steps without an apple it
+# goes into the wall anyway, comes out wherever the partner is, and carries
+# on out of order (below).
+#
+# So the follower alone is not a full-board solver under the game's rules.
+# A hole is never a body cell and only goes away when re-placing it fails
+# on a crowded board, which the follower does not plan for. It clears a
+# board with no holes; with them it plays long games (about twice the A*
+# autopilot's length) and usually dies with 60-75% of the board filled.
+# The pilot further down looks ahead at the holes.
+#
+# Out of order (the opening body lies across the tour, a teleport landed
+# behind, a human at the keys) a move needs slack: walking on from it one
+# cell at a time, every body cell ahead has to be gone before the head gets
+# there. The order is checked by walking the body only when the last step
+# wasn't the one decided here. A tick with no move allowed falls back to
+# the most slack, then the most room to move, then the nearest along the
+# tour.
+
+SHORTCUT_MARGIN = 4
+SHORTCUT_SHARE = 0.1
+
+class TourFollower:
+    def __init__(self, grid_size, margin=SHORTCUT_MARGIN, share=SHORTCUT_SHARE):
+        self.grid_size = grid_size
+        self.margin = margin
+        self.share = share
+        self.fire = None
+        self.order = self.pos = None
+        self.expect = None          # (steps, head) after the last in-order move
+        self.score = self.fed = 0   # score and step of the last apple seen
+        self.seen = None            # flood-fill stamps for the fallback
+        self.gen = 0
+
+        self.decisions = 0
+        self.shortcuts = 0
+        self.teleports = 0
+        self.checks = 0
+        self.fallbacks = 0
+
+    def decide(self, engine):
+        # Direction code for the next step.
+        e = engine
+        self.decisions += 1
+        if e.obstacle_i != self.fire:
+            self.fire = e.obstacle_i
+            self.order, self.pos = hamiltonian_cycle(self.grid_size, self.fire)
+            self.expect = None
+        pos, order = self.pos, self.order
+        n = len(order)
+        head = e.head
+        here = pos[head]
+        if e.score != self.score or e.steps < self.fed:
+            self.score, self.fed = e.score, e.steps
+
+        ordered = here >= 0 and (self.expect == (e.steps, head) or self._ordered(e, here, n))
+        self.expect = None
+        room = (pos[e.body[(e.head_ptr + e.length - 1) & e.mask]] - here) % n or n
+        apple = e.apple_i
+        reach = n
+        if apple >= 0 and pos[apple] >= 0:
+            reach = (pos[apple] - here) % n
+        fed = e.steps - self.fed < n
+        starved = e.steps - self.fed >= 3 * n
+        cut = ordered and fed and e.length < self.share * n
+        succ = order[(here + 1) % n]
+
+        table, occupied, fire = e.neighbours, e.occupied, e.obstacle_i
+        if apple == fire:
+            # The opening apple can be on the fire, which is off the tour;
+            # the apple comes first, so it is eaten from the cell beside.
+            for code in range(4):
+                if code != e.heading ^ 1 and table[4 * head + code] == fire:
+                    return code
+        bh1, bh2 = e.bh1_i, e.bh2_i
+        wall = self._wall(e, here, room, n) if ordered and bh1 >= 0 else n
+        if reach < wall:
+            wall = n            # the apple comes first
+        back = e.heading ^ 1
+        moves = []
+        best = NONE
+        best_key = -n
+        for code in range(4):
+            if code == back:
+                continue
+            c = table[4 * head + code]
+            if c < 0 or occupied[c] or c == fire:
+                continue
+            hole = c == bh1 or c == bh2
+            land = (bh2 if c == bh1 else bh1) if hole else c
+            moves.append((code, land, hole))
+            p = pos[land]
+            if p < 0 or here < 0:
+                continue
+            d = (p - here) % n
+            if d == 0:
+                continue
+            if hole and not self._onward(e, land, code, p, (room - d) if ordered else n, n):
+                if starved and c == succ:   # into the wall, see above
+                    best, best_key, best_land, best_d, best_hole = code, 3 * n, land, d, hole
+                continue
+            if ordered:
+                # inside the free stretch; a hole on the next cell is the
+                # way on, not a shortcut, and so is a way past a wall: they
+                # skip the margin (but hungry, a way past doesn't jump the
+                # apple, or it goes round the same loop for ever)
+                if d >= room or d > 1 and not (hole and c == succ) \
+                        and not (cut and d < room - self.margin) \
+                        and not (wall < d < room - 1 and (fed or d <= reach)):
+                    continue
+            else:
+                slack = self._slack(e, land, n)
+                if slack < 0 or d > 1 and not (hole and c == succ) and slack < self.margin:
+                    continue
+            # Furthest short of the apple. Overshooting only happens with a
+            # hole on the next cell; going through it moves the holes, so
+            # it beats a jump that could come round to the same spot.
+            key = d if d <= reach else (-1 if hole else -d)
+            if d > wall:
+                key += 2 * n
+            if key > best_key:
+                best, best_key, best_land, best_d, best_hole = code, key, land, d, hole
+
+        if best < 0:
+            return self._fallback(e, moves, n)
+        if best_hole:
+            self.teleports += 1
+        elif best_d > 1:
+            self.shortcuts += 1
+        if ordered and best_key < 3 * n:
+            self.expect = (e.steps + 1, best_land)
+        return best
+
+    def _wall(self, e, here, room, n):
+        # Distance to the first hole ahead if it is a dead end: its partner
+        # is behind the head, or the head would come out of it facing back
+        # the way the tour goes on. Else n.
+        pos, order, table = self.pos, self.order, e.neighbours
+        h, q = e.bh1_i, e.bh2_i
+        if pos[h] < 0 or pos[q] < 0:
+            return n
+        if (pos[q] - here) % n < (pos[h] - here) % n:
+            h, q = q, h
+        dh = (pos[h] - here) % n
+        if dh >= room:
+            return n
+        if (pos[q] - here) % n >= room:
+            return dh
+        before = order[pos[h] - 1]
+        for code in range(4):
+            if table[4 * before + code] == h:
+                return n if self._onward(e, q, code, pos[q], room - (pos[q] - here) % n, n) else dh
+        return n
+
+    def _ordered(self, e, here, n):
+        # The rule, checked by walking the body head to tail.
+        self.checks += 1
+        pos, body, mask, ptr = self.pos, e.body, e.mask, e.head_ptr
+        span = 0
+        prev = here
+        for k in range(1, e.length):
+            p = pos[body[(ptr + k) & mask]]
+            if p < 0 or p == prev:
+                return False
+            span += (prev - p) % n
+            prev = p
+        return span < n
+
+    def _slack(self, e, land, n):
+        # Out of order: how many steps to spare if the head goes to `land`
+        # and walks on one cell at a time. Each body cell ahead of it has to
+        # be gone before the head gets there, and goes when the tail has
+        # moved past it; an apple eaten on the way holds the tail a step.
+        self.checks += 1
+        pos, body, mask, ptr = self.pos, e.body, e.mask, e.head_ptr
+        length = e.length
+        start = pos[land]
+        grow = land == e.apple_i
+        last = length if grow else length - 1   # the tail leaves this step unless it grows
+        slack = n
+        for k in range(last):
+            p = pos[body[(ptr + k) & mask]]
+            if p >= 0:
+                slack = min(slack, (p - start) % n - length + k - grow)
+        return slack
+
+    def _onward(self, e, land, code, p, limit, n):
+        # After a teleport the head is on `land` still heading `code`, and
+        # the holes have moved: it needs a free neighbour further along the
+        # tour that is not straight back.
+        table, occupied, fire, pos = e.neighbours, e.occupied, e.obstacle_i, self.pos
+        for k in range(4):
+            m = table[4 * land + k]
+            if k != code ^ 1 and m >= 0 and not occupied[m] and m != fire and pos[m] >= 0 \
+                    and 0 < (pos[m] - p) % n < limit:
+                return True
+        return False
+
+    def _fallback(self, e, moves, n):
+        # No move keeps the rule: the one with the most slack (off the tour
+        # counts as none), then the most room (free cells reachable from it,
+        # counted up to the body's length), then the nearest along the tour.
+        self.fallbacks += 1
+        pos = self.pos
+        here = pos[e.head]
+        best, best_key = e.heading, None
+        for code, land, hole in moves:
+            if pos[land] < 0:
+                key = (-n, self._region(e, land, e.length), -n)
+            else:
+                ahead = (pos[land] - here) % n if here >= 0 else n
+                key = (min(self._slack(e, land, n), 0), self._region(e, land, e.length), -ahead)
+            if best_key is None or key > best_key:
+                best, best_key = code, key
+        return best
+
+    def _region(self, e, start, cap):
+        if self.seen is None or len(self.seen) != len(e.occupied):
+            self.seen = array("I", bytes(4 * len(e.occupied)))
+            self.gen = 0
+        self.gen += 1
+        gen, seen = self.gen, self.seen
+        table, occupied, fire = e.neighbours, e.occupied, e.obstacle_i
+        seen[start] = gen
+        queue = [start]
+        for cur in queue:
+            if len(queue) >= cap:
+                break
+            base = 4 * cur
+            for k in range(4):
+                m = table[base + k]
+                if m >= 0 and seen[m] != gen and not occupied[m] and m != fire:
+                    seen[m] = gen
+                    queue.append(m)
+        return min(len(queue), cap)
+
+# =================================================================
+#                     🔭 TOUR PILOT
+# =================================================================
+# The follower with a look ahead where it goes wrong: next to a hole, and
+# near the end. A hole only goes away when re-placing it after a teleport
+# finds no two free cells HOLE_DISTANCE apart, so a clear needs a last
+# teleport that leaves the free cells bunched up, and a snake that keeps
+# them bunched up to the last apple. Whether a teleport does that depends
+# on where the next apple and holes land, which the follower can't know.
+#
+# So with a hole within LOOK_NEAR cells of the head, or ENDGAME_FREE free
+# cells or fewer left, each move that isn't fatal is played out ROLLOUTS
+# times: a scratch engine restores a snapshot(rng=False), its RNG is
+# reseeded (the same seeds for every move, so they all meet the same
+# futures; the game's own RNG is never read), and the follower plays on
+# for ROLLOUT_DEPTH steps. A clear counts 1 and a death -1, and the best
+# total wins. A tie keeps the follower's move: going for apples instead
+# takes the body off the tour and costs more than it gains, except after
+# a lap without an apple (teleports can keep throwing a short snake past
+# it), when the apples the playouts ate break the tie. Only when every
+# playout of every move dies does the A* autopilot pick the move.
+#
+# This is no guarantee: apples and holes are random, and a last teleport
+# that leaves the free cells bunched up needs the tail right by the
+# partner hole at the moment the head goes in. Over seeded games it
+# cleared 59 of 60 6x6 boards with holes, 2 of 10 8x8 ones and 1 of 6
+# 12x12 ones (the follower alone: 4 of 20, 0 of 20, none). On bigger
+# boards teleports landing behind the head still leave the body across
+# the tour, and the snake dies before the end comes near.
+
+LOOK_NEAR = 2
+ENDGAME_FREE = 9
+ROLLOUTS = 10
+ROLLOUT_DEPTH = 40
+
+class TourPilot:
+    def __init__(self, grid_size, margin=SHORTCUT_MARGIN, share=SHORTCUT_SHARE, seed=None):
+        self.grid_size = grid_size
+        self.follower = TourFollower(grid_size, margin, share)
+        self.scout = TourFollower(grid_size, margin, share)     # plays the rollouts
+        self.engine = SnakeEngine(grid_size, seed=0)
+        self.rng = random.Random(seed)
+        self.autopilot = None
+        self.eaten = 0      # apples the rollouts of one move ate
+
+        self.decisions = 0
+        self.lookaheads = 0
+        self.rollouts = 0
+        self.fallbacks = 0
+
+    def decide(self, engine):
+        # Direction code for the next step.
+        e = engine
+        self.decisions += 1
+        code = self.follower.decide(e)
+        size = self.grid_size
+        near = False
+        if e.bh1_i >= 0:
+            hx, hy = e.head % size, e.head // size
+            for hole in (e.bh1_i, e.bh2_i):
+                if abs(hole % size - hx) + abs(hole // size - hy) <= LOOK_NEAR:
+                    near = True
+        endgame = len(e.free) <= ENDGAME_FREE
+        if not near and not endgame:
+            return code
+
+        self.lookaheads += 1
+        table, occupied, fire = e.neighbours, e.occupied, e.obstacle_i
+        moves = []
+        for k in range(4):
+            m = table[4 * e.head + k]
+            if k != e.heading ^ 1 and m >= 0 and not occupied[m] and (m != fire or m == e.apple_i):
+                moves.append(k)
+        if not moves:
+            return code
+        if code in moves:
+            moves.remove(code)
+            moves.insert(0, code)       # first, so a tie keeps it
+        # a lap without an apple: the apples eaten break ties
+        hungry = e.steps - self.follower.fed >= len(self.follower.order)
+        snap = e.snapshot(rng=False)
+        seeds = [self.rng.randrange(1 << 30) for _ in range(ROLLOUTS)]
+        best, best_key, alive = code, None, False
+        for k in moves:
+            total = 0
+            self.eaten = 0
+            for j, seed in enumerate(seeds):
+                value = self._rollout(snap, k, seed)
+                total += value
+                alive = alive or value > -1
+                if best_key is not None and not hungry and total + ROLLOUTS - 1 - j <= best_key[0]:
+                    break               # can't beat the best any more
+            key = (total, self.eaten if hungry else 0)
+            if best_key is None or key > best_key:
+                best, best_key = k, key
+            if k == code and key == (0, 0) and not endgame:
+                break                   # never dies, and no clear this far out
+        if not alive:
+            self.fallbacks += 1
+            if self.autopilot is None:
+                self.autopilot = Autopilot(size)
+            best = self.autopilot.decide(e)
+        if best != code:
+            self.follower.expect = None
+        return best
+
+    def _rollout(self, snap, code, seed):
+        self.rollouts += 1
+        sim, scout, follower = self.engine, self.scout, self.follower
+        sim.restore(snap)
+        sim.rng.seed(seed)
+        scout.fire, scout.order, scout.pos = follower.fire, follower.order, follower.pos
+        scout.score, scout.fed, scout.expect = follower.score, follower.fed, None
+        score = sim.score
+        for _ in range(ROLLOUT_DEPTH):
+            events = sim.step(code)
+            if events & WON:
+                return 1
+            if events & DIED:
+                return -1
+            code = scout.decide(sim)
+        self.eaten += sim.score - score
+        return 0
+
+# =================================================================
+#                     ⏱️ TOUR FOLLOWER BENCHMARK
+# =================================================================
+# Games to the end on each board size under the full rules, with the
+# follower alone or with the pilot's look ahead: how many end in a clear,
+# the moves a clear takes, how much of the interior the snake covered
+# when the game ended, and the time per decision (the tour is built on the
+# first decision of a game and that tick is reported apart).
+
+def benchmark(grid_size, games=10, seed=0, margin=SHORTCUT_MARGIN, share=SHORTCUT_SHARE,
+              lookahead=False):
+    if lookahead:
+        player = TourPilot(grid_size, margin, share, seed)
+        follower = player.follower
+    else:
+        player = follower = TourFollower(grid_size, margin, share)
+    engine = SnakeEngine(grid_size)
+    cap = 4 * grid_size ** 4       # a game going round for ever ends here
+    clears, moves, fills, latencies, builds = 0, [], [], [], []
+    interior = (grid_size - 2) ** 2 - 1        # less the fire
+    clock = time.perf_counter_ns
+    for g in range(games):
+        engine.reset(seed + g)
+        _CYCLES.clear()
+        start = clock()
+        code = player.decide(engine)
+        builds.append(clock() - start)
+        while True:
+            if engine.step(code) & (DIED | WON) or engine.steps >= cap:
+                break
+            start = clock()
+            code = player.decide(engine)
+            latencies.append(clock() - start)
+        if engine.won:
+            clears += 1
+            moves.append(engine.steps)
+        fills.append(1 - len(engine.free) / interior)
+    latencies.sort()
+    return {
+        "clears": clears,
+        "games": games,
+        "moves": sum(moves) / len(moves) if moves else 0.0,
+        "fill": sum(fills) / len(fills),
+        "us/decision": sum(latencies) / len(latencies) / 1000,
+        "p99 us": latencies[len(latencies) * 99 // 100] / 1000,
+        "max us": latencies[-1] / 1000,
+        "build ms": sum(builds) / len(builds) / 1e6,
+        "shortcuts": follower.shortcuts,
+        "teleports": follower.teleports,
+        "fallbacks": follower.fallbacks,
+        "lookaheads": player.lookaheads if lookahead else 0,
+        "A* moves": player.fallbacks if lookahead else 0,
+    }
+
+if __name__ == "__main__":
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    random.seed(0)
+    # the look ahead is slow and only clears small boards
+    for grid_size, lookahead in ((8, False), (12, False), (20, False), (30, False),
+                                 (6, True), (8, True)):
+        r = benchmark(grid_size, games, lookahead=lookahead)
+        print(f"{grid_size:3d}x{grid_size:<3d} {'pilot   ' if lookahead else 'follower'} "
+              f"clears {r['clears']}/{r['games']}  {r['moves']:10,.0f} moves/clear  "
+              f"fill {r['fill']:4.0%}  {r['us/decision']:8.2f} us/decision "
+              f"(p99 {r['p99 us']:9.2f}, max {r['max us']:9.1f})  tour {r['build ms']:6.2f} ms")
+        print(f"{'':18}shortcuts {r['shortcuts']}  teleports {r['teleports']}  "
+              f"fallbacks {r['fallbacks']}  lookaheads {r['lookaheads']}  A* moves {r['A* moves']}")
@@ -0,0 +1,51 @@
+import time
+
+# =================================================================
+#                     ⌨️ BUFFERED TURN QUEUE
+# =================================================================
+# Key presses arrive at display rate but the snake only turns once per
+# simulation step. Turns are queued (up to max_turns), each one checked
+# against the direction queued just before it, and handed out one per
+# step. The time every turn spent waiting is kept for latency reports.
+
+class TurnQueue:
+    def __init__(self, max_turns=3, clock=time.perf_counter):
+        self.max_turns = max_turns
+        self.clock = clock
+        self.pending = []      # [(direction, timestamp)]
+        self.waits = []        # seconds between key press and the step that used it
+        self.dropped = 0
+
+    def clear(self):
+        self.pending = []
+
+    def next_direction(self, current):
+        # Direction the snake will take on the next step.
+        return self.pending[0][0] if self.pending else current
+
+    def push(self, direction, current):
+        last = self.pending[-1][0] if self.pending else current
+        if direction == last or direction == [-last[0], -last[1]]:
+            return False
+        if len(self.pending) >= self.max_turns:
+            self.dropped += 1
+            return False
+        self.pending.append((direction, self.clock()))
+        return True
+
+    def pop(self, current):
+        if not self.pending:
+            return current
+        direction, stamp = self.pending.pop(0)
+        self.waits.append(self.clock() - stamp)
+        return direction
+
+    def summary(self):
+        if not self.waits:
+            return "input latency: no turns"
+        waits = sorted(self.waits)
+        mean = sum(waits) / len(waits)
+        p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))]
+        return (f"input latency: {len(waits)} turns, "
+                f"mean {mean*1000:.1f} ms, p95 {p95*1000:.1f} ms, "
+                f"max {waits[-1]*1000:.1f} ms, dropped {self.dropped}")
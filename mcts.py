@@ -0,0 +1,298 @@
+import math
+import multiprocessing as mp
+import os
+import random
+import sys
+import time
+
+from autopilot import Autopilot
+from snake_engine import ATE_APPLE, DIED, WON, SnakeEngine
+
+# =================================================================
+#                     🌳 MONTE CARLO TREE SEARCH
+# =================================================================
+# UCT over the rules of game(), run on a SnakeEngine: apple, star, fire and
+# black holes that jump somewhere new after every teleport. The engine's
+# random draws are the future (where the next apple lands, where the holes
+# go), so one tree searches one draw of it: the engine's RNG is reseeded
+# with the tree's own seed and everything below the root follows from that.
+#
+# Each node keeps its position as a snapshot(rng=False), plus the seed the
+# RNG restarts from there, instead of the RNG state itself (a few dozen
+# bytes of position instead of ~20 KB of Mersenne Twister per node). Expanding
+# a node is restore() + seed + one step(); a rollout goes on from the new
+# child with plain step() calls, no copies.
+#
+# Rollouts are a light policy: a free cell that isn't straight back, the
+# one nearest the apple GREEDY of the time, else any. They run ROLLOUT_DEPTH
+# steps. An apple is worth 1, a death -1 (it ends the rollout), discounted
+# by DISCOUNT per step so sooner counts for more. The star only speeds the
+# game up, so it is worth nothing here.
+
+EXPLORATION = 1.0
+ROLLOUT_DEPTH = 40
+DISCOUNT = 0.97
+GREEDY = 0.5
+
+class Node:
+    __slots__ = ("snap", "seed", "reward", "done", "untried", "children", "visits", "total")
+
+    def __init__(self, snap, seed, reward, done, heading):
+        self.snap = snap
+        self.seed = seed
+        self.reward = reward        # for the step that led here
+        self.done = done
+        self.untried = [code for code in range(4) if code != heading ^ 1]
+        self.children = {}
+        self.visits = 0
+        self.total = 0.0
+
+def _reward(events):
+    return (1.0 if events & ATE_APPLE else 0.0) - (1.0 if events & DIED else 0.0)
+
+class TreeSearch:
+    def __init__(self, grid_size, seed=None):
+        self.engine = SnakeEngine(grid_size, seed=0)
+        self.rng = random.Random(seed)
+        self.rollouts = 0
+
+    def search(self, snap, budget_s, seed):
+        # Root statistics {code: (visits, total value)} after budget_s
+        # seconds (at least one iteration) from `snap`, with the future
+        # drawn from `seed`.
+        e = self.engine
+        e.restore(snap)
+        root = Node(snap, seed, 0.0, False, e.heading)
+        clock = time.perf_counter
+        deadline = clock() + budget_s
+        while True:
+            self._iterate(root)
+            if clock() >= deadline:
+                break
+        return {code: (child.visits, child.total) for code, child in root.children.items()}
+
+    def _iterate(self, root):
+        e = self.engine
+        path = [root]
+        node = root
+        while not node.done and not node.untried:
+            node = self._select(node)
+            path.append(node)
+        value = 0.0
+        if not node.done:
+            e.restore(node.snap)
+            e.rng.seed(node.seed)
+            code = node.untried.pop(self.rng.randrange(len(node.untried)))
+            events = e.step(code)
+            done = bool(events & (DIED | WON))
+            child = Node(e.snapshot(rng=False), self.rng.randrange(1 << 32), _reward(events), done, e.heading)
+            node.children[code] = child
+            path.append(child)
+            if not done:
+                e.rng.seed(child.seed)
+                value = self._rollout()
+        for node in reversed(path):
+            value = node.reward + DISCOUNT * value
+            node.visits += 1
+            node.total += value
+
+    def _select(self, node):
+        log_n = math.log(node.visits)
+        best, best_score = None, -math.inf
+        for child in node.children.values():
+            score = child.total / child.visits + EXPLORATION * math.sqrt(log_n / child.visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _rollout(self):
+        # Discounted reward of one playout from the engine's position.
+        self.rollouts += 1
+        e = self.engine
+        rand, randrange = self.rng.random, self.rng.randrange
+        table, occupied = e.neighbours, e.occupied
+        size = e.grid_size
+        value, scale = 0.0, 1.0
+        safe = [0] * 4
+        for _ in range(ROLLOUT_DEPTH):
+            head, back, fire = e.head, e.heading ^ 1, e.obstacle_i
+            count = 0
+            for code in range(4):
+                if code != back:
+                    m = table[4 * head + code]
+                    if m >= 0 and not occupied[m] and m != fire:
+                        safe[count] = code
+                        count += 1
+            if not count:
+                return value - scale        # every way on is fatal
+            apple = e.apple_i
+            if count > 1 and apple >= 0 and rand() < GREEDY:
+                ax, ay = apple % size, apple // size
+                best = None
+                for k in range(count):
+                    m = table[4 * head + safe[k]]
+                    d = abs(m % size - ax) + abs(m // size - ay)
+                    if best is None or d < best:
+                        code, best = safe[k], d
+            else:
+                code = safe[randrange(count)]
+            events = e.step(code)
+            if events & ATE_APPLE:
+                value += scale
+            if events & (DIED | WON):
+                if events & DIED:
+                    value -= scale
+                break
+            scale *= DISCOUNT
+        return value
+
+# =================================================================
+#                     🧵 ROOT-PARALLEL PLAYER
+# =================================================================
+# One TreeSearch per worker process, each searching the same position
+# with its own draw of the future for the whole per-move budget. The
+# root's visit counts are summed over the workers and the most visited
+# move is played (best mean value on a tie). The trees share nothing, so
+# the pipes carry one snapshot out and three (visits, value) pairs back
+# per worker per move, and rollouts/s grows with the number of workers as
+# long as each one has a core. Different draws also average out the luck
+# of one tree's apple and hole spawns.
+#
+# num_workers=0 searches in this process instead (one tree).
+
+def _worker(conn, grid_size, seed):
+    search = TreeSearch(grid_size, seed)
+    try:
+        while True:
+            msg = conn.recv()
+            if msg is None:
+                break
+            snap, budget_s, draw = msg
+            before = search.rollouts
+            stats = search.search(snap, budget_s, draw)
+            conn.send((stats, search.rollouts - before))
+    finally:
+        conn.close()
+
+class MCTSPlayer:
+    def __init__(self, grid_size, num_workers=None, budget_ms=50, seed=None):
+        self.grid_size = grid_size
+        self.num_workers = (os.cpu_count() or 1) if num_workers is None else num_workers
+        self.budget_s = budget_ms / 1000
+        self.rng = random.Random(seed)
+        self.local = TreeSearch(grid_size, self.rng.randrange(1 << 32)) if self.num_workers == 0 else None
+        self.conns = []
+        self.procs = []
+        for _ in range(self.num_workers):
+            parent, child = mp.Pipe()
+            proc = mp.Process(target=_worker, daemon=True,
+                              args=(child, grid_size, self.rng.randrange(1 << 32)))
+            proc.start()
+            child.close()
+            self.conns.append(parent)
+            self.procs.append(proc)
+        self.closed = False
+
+        self.decisions = 0
+        self.rollouts = 0
+
+    def decide(self, engine):
+        # Direction code for the next step.
+        self.decisions += 1
+        snap = engine.snapshot(rng=False)
+        if self.local is not None:
+            before = self.local.rollouts
+            stats = self.local.search(snap, self.budget_s, self.rng.randrange(1 << 32))
+            results = [(stats, self.local.rollouts - before)]
+        else:
+            for conn in self.conns:
+                conn.send((snap, self.budget_s, self.rng.randrange(1 << 32)))
+            results = [conn.recv() for conn in self.conns]
+
+        visits = {}
+        for stats, rollouts in results:
+            self.rollouts += rollouts
+            for code, (n, total) in stats.items():
+                merged = visits.setdefault(code, [0, 0.0])
+                merged[0] += n
+                merged[1] += total
+        if not visits:
+            return engine.heading
+        return max(visits, key=lambda code: (visits[code][0], visits[code][1] / visits[code][0]))
+
+    def close(self):
+        if self.closed:
+            return
+        for conn in self.conns:
+            conn.send(None)
+        for proc in self.procs:
+            proc.join()
+        for conn in self.conns:
+            conn.close()
+        self.closed = True
+
+# =================================================================
+#                     ⏱️ MCTS BENCHMARK
+# =================================================================
+# Throughput: rollouts/s from the opening position of a game for each
+# worker count (on W free cores it should come close to W times the
+# one-worker rate). Quality: games at a fixed time per move, up to
+# max_moves moves each, against the A* autopilot over the same seeds and
+# move cap.
+
+def bench_throughput(num_workers, grid_size=20, budget_ms=200, moves=10, seed=0):
+    player = MCTSPlayer(grid_size, num_workers, budget_ms, seed)
+    engine = SnakeEngine(grid_size, seed=seed)
+    try:
+        start = time.perf_counter()
+        for _ in range(moves):
+            if engine.step(player.decide(engine)) & (DIED | WON):
+                engine.reset(seed)
+        elapsed = time.perf_counter() - start
+    finally:
+        player.close()
+    return player.rollouts / elapsed
+
+def play(decide, grid_size, games, max_moves, seed):
+    # (mean score, deaths) over `games` games of at most max_moves moves.
+    engine = SnakeEngine(grid_size)
+    scores, deaths = [], 0
+    for g in range(games):
+        engine.reset(seed + g)
+        for _ in range(max_moves):
+            if engine.step(decide(engine)) & (DIED | WON):
+                break
+        deaths += not engine.alive and not engine.won
+        scores.append(engine.score)
+    return sum(scores) / games, deaths
+
+def bench_quality(budget_ms, num_workers=None, grid_size=20, games=4, max_moves=200, seed=0):
+    player = MCTSPlayer(grid_size, num_workers, budget_ms, seed)
+    try:
+        score, deaths = play(player.decide, grid_size, games, max_moves, seed)
+    finally:
+        player.close()
+    return score, deaths, player.rollouts / max(player.decisions, 1)
+
+if __name__ == "__main__":
+    cores = os.cpu_count() or 1
+    counts = [int(a) for a in sys.argv[1:]] or sorted({1, 2, 4, 8, 16, 32, cores} & set(range(1, cores + 1)))
+    random.seed(0)
+    print(f"{cores} cores, 20x20, 200 ms per move")
+    print("workers      rollouts/s   scaling")
+    base = None
+    for workers in counts:
+        rate = bench_throughput(workers)
+        base = base or rate
+        print(f"{workers:7d}   {rate:12,.0f}   {rate / base:6.2f}x")
+
+    print()
+    games, max_moves = 4, 200
+    pilot = Autopilot(20)
+    score, deaths = play(pilot.decide, 20, games, max_moves, 0)
+    print(f"{games} games of up to {max_moves} moves, {cores} workers  (A* autopilot: mean score {score:.1f}, "
+          f"{deaths} deaths)")
+    print("budget      mean score   deaths   rollouts/move")
+    for budget_ms in (10, 40, 160):
+        score, deaths, per_move = bench_quality(budget_ms, cores, games=games, max_moves=max_moves)
+        print(f"{budget_ms:4d} ms   {score:12.1f}   {deaths:6d}   {per_move:13,.0f}")
@@ -0,0 +1,146 @@
+import os
+import random
+import sys
+import time
+
+# Render without a window unless the caller already picked a video driver.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+import startmenudone as game
+from renderer import BackgroundLayer, head_rect
+from snake_engine import DIED, DIRECTIONS, WON, SnakeEngine
+
+# =================================================================
+#                     📸 HEADLESS PIXEL FRAMES
+# =================================================================
+# Draws a SnakeEngine's state with the game's own art (the draw_snake /
+# draw_apple / draw_specials of startmenudone, aimed at an offscreen target)
+# and hands the frame out as a NumPy array, for pixel-based agents.
+#
+# The frame memory is a NumPy array and the offscreen Surface is built on
+# top of it with pygame.image.frombuffer, so the array *is* the pixels: no
+# copy per frame. (surfarray.pixels3d gives the same kind of view, but it
+# locks the Surface while the view is alive and every blit onto a locked
+# Surface fails, so an agent holding on to last frame's observation would
+# break the next render.)
+#
+# Optional post-processing writes into buffers allocated once:
+#   size=(w, h)      nearest-neighbour (or smooth=True) downscale
+#   grayscale=True   8-bit luma, (77 R + 150 G + 29 B) >> 8
+#
+# A frame is not cleared wholesale: the background is put back only under
+# what the previous frame drew (body cells, head tile, item sprites), which
+# on a 600x600 frame is a few small blits instead of a 1.4 MB copy.
+#
+# render() returns the last stage, (H, W, 3) RGB or (H, W) gray. Like the
+# SnakeEnv views it is overwritten by the next render(): copy it to keep it.
+
+class PixelRenderer:
+    def __init__(self, grid_size=game.GRID_SIZE, size=None, grayscale=False, smooth=False):
+        cs = game.CELL_SIZE
+        side = grid_size * cs
+        self.grid_size = grid_size
+        self.pixels = np.zeros((side, side, 4), dtype=np.uint8)
+        self.surface = pygame.image.frombuffer(self.pixels, (side, side), "RGBX")
+        self.frame = self.pixels[..., :3]
+
+        # Same baked board as the game, converted once to the frame's format
+        # so putting it back under a sprite is a straight copy.
+        self.backdrop = BackgroundLayer(grid_size, cs, game.WHITE, game.GRAY).get().convert(self.surface)
+        self.surface.blit(self.backdrop, (0, 0))
+        self.drawn = []     # rects covered by the previous frame
+
+        self.size = None
+        self.small = None
+        self.smooth = smooth
+        out = self.frame
+        if size is not None:
+            width, height = (size, size) if isinstance(size, int) else size
+            self.size = (width, height)
+            self.small_pixels = np.zeros((height, width, 4), dtype=np.uint8)
+            self.small_surface = pygame.image.frombuffer(self.small_pixels, (width, height), "RGBX")
+            self.small = self.small_pixels[..., :3]
+            out = self.small
+
+        self.gray = None
+        if grayscale:
+            shape = out.shape[:2]
+            self.gray = np.zeros(shape, dtype=np.uint8)
+            self._luma = np.zeros(shape, dtype=np.uint16)
+            self._term = np.zeros(shape, dtype=np.uint16)
+            out = self.gray
+        self.obs = out
+
+    def _covered(self, engine):
+        cs = game.CELL_SIZE
+        rects = [pygame.Rect(x * cs, y * cs, cs, cs) for x, y in engine.snake]
+        rects.append(head_rect(engine.snake[0], cs))
+        atlas = game.atlas
+        for name, pos in (("apple", engine.apple), ("fire", engine.obstacle), ("star", engine.star),
+                          ("hole", engine.bh1), ("hole", engine.bh2)):
+            if pos:
+                rects.append(atlas.rect(name, pos))
+        return rects
+
+    def draw(self, engine):
+        target = self.surface
+        backdrop = self.backdrop
+        target.blits([(backdrop, r, r) for r in self.drawn], doreturn=False)
+        self.drawn = self._covered(engine)
+        game.draw_snake(engine.snake, engine.direction, engine.boosted, target)
+        if engine.apple:
+            game.draw_apple(engine.apple, target)
+        game.draw_specials(engine.obstacle, engine.star, engine.bh1, engine.bh2, target)
+
+    def render(self, engine):
+        self.draw(engine)
+        src = self.frame
+        if self.size is not None:
+            scale = pygame.transform.smoothscale if self.smooth else pygame.transform.scale
+            scale(self.surface, self.size, self.small_surface)
+            src = self.small
+        if self.gray is not None:
+            luma, term = self._luma, self._term
+            np.multiply(src[..., 0], 77, out=luma, dtype=np.uint16)
+            np.multiply(src[..., 1], 150, out=term, dtype=np.uint16)
+            luma += term
+            np.multiply(src[..., 2], 29, out=term, dtype=np.uint16)
+            luma += term
+            luma >>= 8
+            np.copyto(self.gray, luma, casting="unsafe")
+        return self.obs
+
+# =================================================================
+#                     ⏱️ FRAME RATE BENCHMARK
+# =================================================================
+# One game with random turns (reset on death), one render per step. The
+# engine step is timed apart so the numbers are frames per second of
+# rendering alone.
+
+def benchmark(frames=2000, grid_size=game.GRID_SIZE, seed=0, **options):
+    renderer = PixelRenderer(grid_size, **options)
+    engine = SnakeEngine(grid_size, seed=seed)
+    rng = random.Random(seed)
+    spent = 0.0
+    for _ in range(frames):
+        if engine.step(DIRECTIONS[rng.randrange(4)]) & (DIED | WON):
+            engine.reset()
+        start = time.perf_counter()
+        renderer.render(engine)
+        spent += time.perf_counter() - start
+    return frames / spent, renderer.obs.shape
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"video driver: {pygame.display.get_driver()}, {game.GRID_SIZE}x{game.GRID_SIZE} board, "
+          f"{game.CELL_SIZE}px cells")
+    for label, options in (("full frame", {}),
+                           ("84x84", {"size": 84}),
+                           ("84x84 smooth", {"size": 84, "smooth": True}),
+                           ("84x84 gray", {"size": 84, "grayscale": True}),
+                           ("full gray", {"grayscale": True})):
+        fps, shape = benchmark(frames, **options)
+        print(f"{label:14s} {str(shape):15s} {fps:9,.0f} frames/s")
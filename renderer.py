@@ -0,0 +1,515 @@
+from collections import OrderedDict, deque
+from itertools import islice
+
+import pygame
+
+# =================================================================
+#                     🖼️ LAYERED BOARD RENDERER
+# =================================================================
+
+# ---- static background (fill + grid lines) ----
+# The background only depends on the board size, the cell size and the
+# theme colors, so it is baked once into a surface and each frame starts
+# with a single blit instead of 2*GRID_SIZE line draws.
+
+class BackgroundLayer:
+    def __init__(self, grid_size, cell_size, fill, line):
+        self.grid_size = grid_size
+        self.cell_size = cell_size
+        self.fill = fill
+        self.line = line
+        self.surface = None
+        self._key = None
+
+    def resize(self, grid_size, cell_size):
+        self.grid_size = grid_size
+        self.cell_size = cell_size
+
+    def set_theme(self, fill, line):
+        self.fill = fill
+        self.line = line
+
+    def _bake(self):
+        width = height = self.grid_size * self.cell_size
+        surf = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        surf.fill(self.fill)
+        for x in range(0, width, self.cell_size):
+            pygame.draw.line(surf, self.line, (x, 0), (x, height))
+        for y in range(0, height, self.cell_size):
+            pygame.draw.line(surf, self.line, (0, y), (width, y))
+        return surf
+
+    def get(self):
+        key = (self.grid_size, self.cell_size, tuple(self.fill), tuple(self.line))
+        if key != self._key:
+            self.surface = self._bake()
+            self._key = key
+        return self.surface
+
+    def draw(self, target, area=None):
+        if area is None:
+            target.blit(self.get(), (0, 0))
+        else:
+            target.blit(self.get(), area, area)
+
+
+# ---- snake head (rounded nose + eyes) ----
+def draw_snake_head(surface, head, direction, body_color, cell_size, eye_color=(0, 0, 0), offset=(0, 0)):
+    x = head[0] * cell_size + offset[0]
+    y = head[1] * cell_size + offset[1]
+    radius = cell_size // 2
+
+    pygame.draw.rect(surface, body_color, pygame.Rect(x, y, cell_size, cell_size))
+
+    if direction == [1, 0]:
+        pygame.draw.circle(surface, body_color, (x + cell_size, y + cell_size // 2), radius)
+        left_eye = (x + 3 * cell_size // 4, y + cell_size // 3)
+        right_eye = (x + 3 * cell_size // 4, y + 2 * cell_size // 3)
+    elif direction == [-1, 0]:
+        pygame.draw.circle(surface, body_color, (x, y + cell_size // 2), radius)
+        left_eye = (x + cell_size // 4, y + cell_size // 3)
+        right_eye = (x + cell_size // 4, y + 2 * cell_size // 3)
+    elif direction == [0, 1]:
+        pygame.draw.circle(surface, body_color, (x + cell_size // 2, y + cell_size), radius)
+        left_eye = (x + cell_size // 3, y + 3 * cell_size // 4)
+        right_eye = (x + 2 * cell_size // 3, y + 3 * cell_size // 4)
+    else:
+        pygame.draw.circle(surface, body_color, (x + cell_size // 2, y), radius)
+        left_eye = (x + cell_size // 3, y + cell_size // 4)
+        right_eye = (x + 2 * cell_size // 3, y + cell_size // 4)
+
+    pygame.draw.circle(surface, eye_color, left_eye, cell_size // 8)
+    pygame.draw.circle(surface, eye_color, right_eye, cell_size // 8)
+
+def head_rect(head, cell_size, offset=(0, 0)):
+    # The nose circle pokes half a cell out of the head cell on any side.
+    pad = cell_size // 2 + 1
+    return pygame.Rect(head[0] * cell_size - pad + offset[0], head[1] * cell_size - pad + offset[1],
+                       cell_size + 2 * pad, cell_size + 2 * pad)
+
+# ---- pre-rendered snake tiles ----
+# One opaque body tile per color and one head tile (nose + eyes, padded by
+# half a cell on every side) per direction and color. The current art uses
+# the same square for straight, corner and tail pieces, so they share the
+# body tile. The renderers below paint from them. Tiles alone don't make a
+# long snake cheap: a full redraw of 9000 tiles takes about as long as
+# 9000 draw.rect calls (~8 ms on 100x100 @ 8px). The frame time stays flat
+# with length because DirtyRenderer only repaints the cells that changed.
+
+class SnakeTiles:
+    def __init__(self, cell_size, eye_color=(0, 0, 0)):
+        self.cell_size = cell_size
+        self.eye_color = eye_color
+        self.tiles = {}
+
+    def body(self, color):
+        key = ("body", tuple(color))
+        tile = self.tiles.get(key)
+        if tile is None:
+            tile = pygame.Surface((self.cell_size, self.cell_size))
+            if pygame.display.get_surface() is not None:
+                tile = tile.convert()
+            tile.fill(color)
+            self.tiles[key] = tile
+        return tile
+
+    def head(self, direction, color):
+        key = ("head", tuple(direction), tuple(color))
+        tile = self.tiles.get(key)
+        if tile is None:
+            area = head_rect((0, 0), self.cell_size)
+            tile = pygame.Surface(area.size, pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                tile = tile.convert_alpha()
+            tile.fill((0, 0, 0, 0))
+            draw_snake_head(tile, (0, 0), list(direction), color, self.cell_size,
+                            self.eye_color, offset=(-area.x, -area.y))
+            self.tiles[key] = tile
+        return tile
+
+
+# ---- sub-cell motion between simulation steps ----
+# progress is how far (0..1) we are towards the next simulation step. The
+# head slides that far along its direction and, unless the snake is about
+# to grow, the tail retracts towards the segment in front of it.
+
+def motion_offsets(snake, direction, progress, growing, cell_size):
+    shift = int(progress * cell_size)
+    head_offset = (direction[0] * shift, direction[1] * shift)
+
+    tail = snake[-1]
+    x, y = tail[0] * cell_size, tail[1] * cell_size
+    tail_area = pygame.Rect(x, y, cell_size, cell_size)
+    if growing or not shift or len(snake) < 2:
+        return head_offset, tail_area
+
+    dx, dy = snake[-2][0] - tail[0], snake[-2][1] - tail[1]
+    if (dx, dy) == (1, 0):
+        tail_area = pygame.Rect(x + shift, y, cell_size - shift, cell_size)
+    elif (dx, dy) == (-1, 0):
+        tail_area = pygame.Rect(x, y, cell_size - shift, cell_size)
+    elif (dx, dy) == (0, 1):
+        tail_area = pygame.Rect(x, y + shift, cell_size, cell_size - shift)
+    elif (dx, dy) == (0, -1):
+        tail_area = pygame.Rect(x, y, cell_size, cell_size - shift)
+    return head_offset, tail_area
+
+
+# ---- body bookkeeping shared by the renderers ----
+# Renderers keep their own copy of the drawn body (a deque of cells plus a
+# per-cell count) and update it from the ends, so a frame costs O(changed
+# cells) instead of O(length).
+
+class BodyTracker:
+    def __init__(self):
+        self.body = deque()
+        self.counts = {}
+        self.steps = None
+
+    def sync(self, snake, steps=None):
+        # Body only changes at its ends: take the cells in front of the head
+        # we drew last time, then drop however many tail cells vanished.
+        # Returns the changed cells, or None if the snake can't be diffed.
+        # `steps` is the engine's step count: one new head cell per step
+        # since the last sync. Without it the new cells run up to the first
+        # one equal to the old head, which is wrong once several steps per
+        # frame (turbo) have taken the head back over that cell.
+        body = self.body
+        old_head = body[0]
+        if steps is not None:
+            moved = -1 if self.steps is None else steps - self.steps
+            self.steps = steps
+            if not 0 <= moved < len(snake):
+                return None
+            seg = snake[moved]
+            if (seg[0], seg[1]) != old_head:
+                return None
+            pushed = [(seg[0], seg[1]) for seg in islice(snake, moved)]
+        else:
+            self.steps = None
+            pushed = []
+            for seg in snake:
+                cell = (seg[0], seg[1])
+                if cell == old_head:
+                    break
+                pushed.append(cell)
+            else:
+                return None
+
+        popped = len(body) + len(pushed) - len(snake)
+        if popped < 0 or popped > len(body):
+            return None
+
+        changed = []
+        for _ in range(popped):
+            cell = body.pop()
+            self.remove(cell)
+            changed.append(cell)
+        for cell in reversed(pushed):
+            body.appendleft(cell)
+            self.counts[cell] = self.counts.get(cell, 0) + 1
+            changed.append(cell)
+        return changed
+
+    def remove(self, cell):
+        n = self.counts[cell] - 1
+        if n:
+            self.counts[cell] = n
+        else:
+            del self.counts[cell]
+
+    def reset(self, snake, steps=None):
+        self.steps = steps
+        self.body = deque((seg[0], seg[1]) for seg in snake)
+        self.counts = {}
+        for cell in self.body:
+            self.counts[cell] = self.counts.get(cell, 0) + 1
+
+
+# ---- dirty-rectangle renderer ----
+# Each tick only a handful of cells change: the new head, the old head, the
+# vacated tail, respawned items and the HUD. The renderer keeps its own copy
+# of what is on screen, works out which rectangles differ, repaints just
+# those (clipped, in the same layer order as a full redraw) and hands them
+# to pygame.display.update(). Overlays call invalidate() to force a full
+# redraw on the next frame.
+
+class DirtyRenderer:
+    def __init__(self, target, cell_size, background, atlas, draw_hud, hud_rects, tiles=None):
+        self.target = target
+        self.cell_size = cell_size
+        self.tiles = tiles or SnakeTiles(cell_size)
+        self.background = background
+        self.atlas = atlas
+        self.draw_hud = draw_hud      # (*hud) -> None, draws onto target
+        self.hud_rects = hud_rects    # (*hud) -> [Rect], where draw_hud will draw
+        self.track = BodyTracker()
+        self.invalidate()
+
+    def invalidate(self):
+        self.full = True
+
+    def _cell_rect(self, cell):
+        cs = self.cell_size
+        return pygame.Rect(cell[0] * cs, cell[1] * cs, cs, cs)
+
+    def _paint(self, area, head, direction, color, items, hud, hud_rects):
+        target = self.target
+        cs = self.cell_size
+        target.set_clip(area)
+        self.background.draw(target, area)
+
+        counts = self.track.counts
+        tail = self.track.body[-1]
+        body_tile = self.tiles.body(color)
+        x0, x1 = area.left // cs, (area.right - 1) // cs
+        y0, y1 = area.top // cs, (area.bottom - 1) // cs
+        if (x1 - x0 + 1) * (y1 - y0 + 1) <= len(counts):
+            cells = [(cx, cy) for cy in range(y0, y1 + 1) for cx in range(x0, x1 + 1)
+                     if (cx, cy) in counts]
+        else:
+            cells = [c for c in counts if x0 <= c[0] <= x1 and y0 <= c[1] <= y1]
+
+        batch = []
+        for cell in cells:
+            if cell == tail and counts[cell] == 1:
+                t = self.tail_area
+                batch.append((body_tile, t.topleft, (0, 0, t.width, t.height)))
+            else:
+                batch.append((body_tile, (cell[0] * cs, cell[1] * cs)))
+        target.blits(batch, doreturn=False)
+
+        if self.head_area.colliderect(area):
+            target.blit(self.tiles.head(direction, color), self.head_area.topleft)
+        for (name, pos), rect in zip(items, self.item_areas):
+            if rect.colliderect(area):
+                self.atlas.draw(target, name, pos)
+        if area.collidelist(hud_rects) != -1:
+            self.draw_hud(*hud)
+        target.set_clip(None)
+
+    def render(self, snake, direction, color, items, hud, progress=0.0, growing=False, steps=None):
+        # Returns the list of rectangles that changed, or None when the whole
+        # target was redrawn. Pass the engine's step count as `steps` when
+        # more than one step can happen between frames.
+        head = snake[0]
+        head_offset, tail_area = motion_offsets(snake, direction, progress, growing, self.cell_size)
+        items = [(name, (pos[0], pos[1])) for name, pos in items]
+        hud = tuple(hud)
+        dirty = []
+
+        changed = None
+        if not self.full and color == self.color:
+            changed = self.track.sync(snake, steps)
+
+        if changed is None:
+            self.track.reset(snake, steps)
+            self.color = color
+            self.direction = list(direction)
+            self.head = (head[0], head[1])
+            self.head_offset = head_offset
+            self.head_area = head_rect(head, self.cell_size, head_offset)
+            self.tail_area = tail_area
+            self.items = items
+            self.item_areas = [self.atlas.rect(n, p) for n, p in items]
+            self.hud = hud
+            self.hud_area = self.hud_rects(*hud)
+
+            area = self.target.get_rect()
+            self.full = False
+            self._paint(area, head, direction, color, items, hud, self.hud_area)
+            return None
+
+        for cell in changed:
+            dirty.append(self._cell_rect(cell))
+
+        if (list(direction) != self.direction or (head[0], head[1]) != self.head
+                or head_offset != self.head_offset):
+            dirty.append(self.head_area)
+            self.head_area = head_rect(head, self.cell_size, head_offset)
+            dirty.append(self.head_area)
+            self.direction = list(direction)
+            self.head = (head[0], head[1])
+            self.head_offset = head_offset
+
+        if tail_area != self.tail_area:
+            dirty.append(self.tail_area)
+            dirty.append(self._cell_rect(snake[-1]))
+            self.tail_area = tail_area
+
+        if items != self.items:
+            new_areas = [self.atlas.rect(n, p) for n, p in items]
+            if len(items) != len(self.items):
+                dirty.extend(self.item_areas)
+                dirty.extend(new_areas)
+            else:
+                for old, new, old_rect, new_rect in zip(self.items, items, self.item_areas, new_areas):
+                    if old != new:
+                        dirty.append(old_rect)
+                        dirty.append(new_rect)
+            self.items = items
+            self.item_areas = new_areas
+
+        hud_area = self.hud_area
+        if hud != self.hud:
+            hud_area = self.hud_rects(*hud)
+            dirty.extend(self.hud_area)
+            dirty.extend(hud_area)
+            self.hud = hud
+            self.hud_area = hud_area
+
+        bounds = self.target.get_rect()
+        dirty = [r.clip(bounds) for r in dirty]
+        dirty = [r for r in dirty if r.width and r.height]
+        for area in dirty:
+            self._paint(area, head, direction, color, items, hud, hud_area)
+        return dirty
+
+    def present(self, rects):
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+
+# ---- large boards: camera viewport over cached chunks ----
+# When the board is bigger than the window, the world is cut into square
+# chunks of chunk_cells x chunk_cells. Each chunk caches background, body
+# squares and items as one surface; a chunk is rebuilt only after something
+# inside it changed, and only chunks under the camera are ever built. The
+# cache is an LRU, so memory stays bounded on 1000x1000+ boards. The moving
+# parts (head, retracting tail) and the HUD are drawn on top every frame.
+
+class ChunkedRenderer:
+    def __init__(self, target, grid_size, cell_size, fill, line, atlas, draw_hud,
+                 tiles=None, chunk_cells=16, max_chunks=64):
+        self.target = target
+        self.grid_size = grid_size
+        self.cell_size = cell_size
+        self.chunk_cells = chunk_cells
+        self.chunk_px = chunk_cells * cell_size
+        # never evict chunks that are still on screen
+        w, h = target.get_size()
+        visible = (w // self.chunk_px + 2) * (h // self.chunk_px + 2)
+        self.max_chunks = max(max_chunks, 2 * visible)
+        self.background = BackgroundLayer(chunk_cells, cell_size, fill, line)
+        self.atlas = atlas
+        self.draw_hud = draw_hud
+        self.tiles = tiles or SnakeTiles(cell_size)
+        self.track = BodyTracker()
+        self.chunks = OrderedDict()    # (cx, cy) -> Surface
+        self.color = None
+        self.tail = None
+        self.items = []
+        self.item_areas = []
+        self.camera = pygame.Rect((0, 0), target.get_size())
+        self.builds = 0
+
+    def invalidate(self):
+        # Chunks are off-screen caches of the board, so an overlay on the
+        # window doesn't touch them; the next render repaints the view anyway.
+        pass
+
+    def _stale(self, area):
+        cp = self.chunk_px
+        for cy in range(max(area.top, 0) // cp, max(area.bottom - 1, 0) // cp + 1):
+            for cx in range(max(area.left, 0) // cp, max(area.right - 1, 0) // cp + 1):
+                self.chunks.pop((cx, cy), None)
+
+    def _build(self, key):
+        cs, cc, cp = self.cell_size, self.chunk_cells, self.chunk_px
+        ox, oy = key[0] * cp, key[1] * cp
+        surf = self.background.get().copy()
+
+        counts = self.track.counts
+        tail = self.track.body[-1]
+        body_tile = self.tiles.body(self.color)
+        batch = []
+        for y in range(key[1] * cc, min((key[1] + 1) * cc, self.grid_size)):
+            for x in range(key[0] * cc, min((key[0] + 1) * cc, self.grid_size)):
+                cell = (x, y)
+                if cell in counts and (cell != tail or counts[cell] > 1):
+                    batch.append((body_tile, (x * cs - ox, y * cs - oy)))
+        surf.blits(batch, doreturn=False)
+
+        area = pygame.Rect(ox, oy, cp, cp)
+        for (name, pos), rect in zip(self.items, self.item_areas):
+            if rect.colliderect(area):
+                self.atlas.draw(surf, name, pos, origin=(ox, oy))
+        self.builds += 1
+        return surf
+
+    def _chunk(self, key):
+        surf = self.chunks.get(key)
+        if surf is None:
+            surf = self._build(key)
+            self.chunks[key] = surf
+            if len(self.chunks) > self.max_chunks:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(key)
+        return surf
+
+    def render(self, snake, direction, color, items, hud, progress=0.0, growing=False, steps=None):
+        cs = self.cell_size
+        track = self.track
+        items = [(name, (pos[0], pos[1])) for name, pos in items]
+
+        changed = None
+        if track.body and color == self.color:
+            changed = track.sync(snake, steps)
+        if changed is None:
+            track.reset(snake, steps)
+            self.color = color
+            self.chunks.clear()
+        else:
+            for cell in changed:
+                self._stale(pygame.Rect(cell[0] * cs, cell[1] * cs, cs, cs))
+            # the tail cell is left out of chunks, so a new tail must rebuild too
+            tail = track.body[-1]
+            if tail != self.tail:
+                self._stale(pygame.Rect(tail[0] * cs, tail[1] * cs, cs, cs))
+        self.tail = track.body[-1]
+
+        if items != self.items:
+            new_areas = [self.atlas.rect(n, p) for n, p in items]
+            for old, new, old_rect, new_rect in zip(self.items, items, self.item_areas, new_areas):
+                if old != new:
+                    self._stale(old_rect)
+                    self._stale(new_rect)
+            for rect in self.item_areas[len(items):] + new_areas[len(self.item_areas):]:
+                self._stale(rect)
+            self.items = items
+            self.item_areas = new_areas
+
+        # camera: keep the (sliding) head centred, clamped to the board
+        head = snake[0]
+        head_offset, tail_area = motion_offsets(snake, direction, progress, growing, cs)
+        world = self.grid_size * cs
+        view = self.camera
+        view.centerx = head[0] * cs + cs // 2 + head_offset[0]
+        view.centery = head[1] * cs + cs // 2 + head_offset[1]
+        view.clamp_ip(pygame.Rect(0, 0, max(world, view.width), max(world, view.height)))
+
+        target = self.target
+        cp = self.chunk_px
+        target.fill(self.background.fill)
+        blits = []
+        for cy in range(view.top // cp, (view.bottom - 1) // cp + 1):
+            for cx in range(view.left // cp, (view.right - 1) // cp + 1):
+                if cx * cp < world and cy * cp < world:
+                    blits.append((self._chunk((cx, cy)), (cx * cp - view.x, cy * cp - view.y)))
+        target.blits(blits, doreturn=False)
+
+        body_tile = self.tiles.body(color)
+        target.blit(body_tile, tail_area.move(-view.x, -view.y),
+                    (0, 0, tail_area.width, tail_area.height))
+        target.blit(self.tiles.head(direction, color),
+                    head_rect(head, cs, head_offset).move(-view.x, -view.y))
+        self.draw_hud(*hud)
+        return None
+
+    def present(self, rects):
+        pygame.display.flip()
@@ -0,0 +1,651 @@
+import random
+import struct
+import sys
+import time
+from array import array
+from itertools import accumulate
+
+# =================================================================
+#                     🐍 HEADLESS SNAKE ENGINE
+# =================================================================
+# The rules of game() without pygame: movement, walls, self collision,
+# apple / star / fire, black-hole teleports and the star boost. Front-ends
+# feed it one direction per simulation step and draw whatever it holds;
+# bots and tests can drive it as fast as Python allows.
+#
+# Cells are plain ints, y * grid_size + x. The body is a fixed-capacity
+# array('I') ring of cell indices (head at head_ptr, `length` cells going
+# forward from it) mirrored by an occupancy grid, one byte per cell
+# counting the segments on it. A step writes the new head one slot before
+# head_ptr and drops the tail by shortening `length`: O(1) whatever the
+# length, no per-step allocation, 4 bytes per segment (5 with the link
+# byte snapshots need, see below). The capacity is a power of two at
+# least the board size, so a body (which never covers a cell twice)
+# always fits and wrapping is a mask. Moving is a lookup in a
+# per-board-size neighbour table, -1 past the walls.
+#
+# Items and holes are cell indices too (apple_i, obstacle_i, star_i, bh1_i,
+# bh2_i; NONE when absent) and the heading is a direction code. They are
+# still readable and settable as [x, y] lists through properties (apple,
+# obstacle, star, bh1, bh2, direction), and the body through the `snake`
+# view, for the renderers and anything else that thinks in coordinates.
+#
+# Items spawn on interior cells (1 .. grid_size-2) that the body doesn't
+# cover. Those cells are kept in an indexable set: a list of free cell
+# indices plus each cell's position in it, updated with swap-remove as the
+# snake moves. Picking a spawn cell is one randrange, at any fill level,
+# and an empty set means the board is full: the game is won.
+#
+# A game is a pure function of its seed and the actions fed to step():
+# every random draw comes from the engine's own Random(seed) and the star
+# boost lasts a number of steps, not seconds. Replaying the same actions
+# with the same seed gives the same game at any simulation speed.
+#
+# snapshot() / restore() clone a game for search and rewind. Next to the
+# body ring the engine keeps one byte per segment saying how the head got
+# there: its heading, or GAP for a teleport. A snapshot is the scalars
+# packed with struct, the body as links of two bits each (the direction
+# from a segment to the next older one, four to a byte) and the rare
+# teleport gaps as (link, cell) pairs. Packing is four byte translations
+# and extended slices, no Python loop over the body. restore() runs the
+# links back into cells, O(length). The first restore puts the occupancy
+# grid and free index back with slice assignments from the empty board's
+# copies. From then on the engine logs the cells it touches and the next
+# restore resets just those, so a search that restores every few steps
+# pays for its steps, not for the board. A log longer than an eighth of
+# the board is dropped and the next restore copies again.
+#
+# Black holes come in pairs at least HOLE_DISTANCE apart (Manhattan). Both
+# go on free cells away from the items, so a teleport never drops the head
+# onto the body. The first hole is one draw from the free index; the
+# second is a few free-index draws checked against the distance, then a
+# scan of the precomputed ring of valid offsets around the first one. Each
+# placement is bounded by HOLE_TRIES * (HOLE_TRIES + ring size) probes, and
+# gives no holes when the board has no room for a pair.
+
+UP = [0, -1]
+DOWN = [0, 1]
+LEFT = [-1, 0]
+RIGHT = [1, 0]
+DIRECTIONS = [UP, DOWN, LEFT, RIGHT]
+
+BOOST_TICKS = 30     # star boost: 3 s at the boosted 10 steps/s
+
+# Direction codes (index into DIRECTIONS); code ^ 1 is the reverse.
+DX = [d[0] for d in DIRECTIONS]
+DY = [d[1] for d in DIRECTIONS]
+CODE = {tuple(d): i for i, d in enumerate(DIRECTIONS)}
+
+NONE = -1            # "no cell" for items, holes and neighbours past a wall
+
+# ---- step() result flags ----
+ATE_APPLE = 1
+GOT_STAR = 2
+TELEPORTED = 4
+DIED = 8
+WON = 16
+
+# ---- per board size: interior mask and the empty board's free-cell index ----
+_INTERIOR = {}
+
+def interior_cells(size):
+    if size not in _INTERIOR:
+        interior = bytearray(size * size)
+        free = []
+        free_pos = [-1] * (size * size)
+        for y in range(1, size - 1):
+            for x in range(1, size - 1):
+                i = y * size + x
+                interior[i] = 1
+                free_pos[i] = len(free)
+                free.append(i)
+        _INTERIOR[size] = (interior, free, free_pos, bytes(size * size))
+    return _INTERIOR[size]
+
+# ---- per board size: neighbours[4 * i + code], NONE past the wall ----
+_NEIGHBOURS = {}
+
+def neighbours(size):
+    # One strided copy per direction, so a 1000x1000 board takes a fraction
+    # of a second instead of a Python loop over 4M entries.
+    if size not in _NEIGHBOURS:
+        cells = size * size
+        wall = array("i", [NONE])
+        up = array("i", range(-size, cells - size))
+        up[:size] = wall * size
+        down = array("i", range(size, cells + size))
+        down[cells - size:] = wall * size
+        left = array("i", range(-1, cells - 1))
+        left[::size] = wall * size
+        right = array("i", range(1, cells + 1))
+        right[size - 1::size] = wall * size
+        table = wall * (4 * cells)
+        for code, column in enumerate((up, down, left, right)):
+            table[code::4] = column
+        _NEIGHBOURS[size] = table
+    return _NEIGHBOURS[size]
+
+# ---- per board size: offsets at HOLE_DISTANCE .. HOLE_DISTANCE+HOLE_RING-1 ----
+HOLE_DISTANCE = 5
+HOLE_RING = 8
+HOLE_TRIES = 4
+_HOLE_OFFSETS = {}
+
+def hole_offsets(size):
+    if size not in _HOLE_OFFSETS:
+        reach = size - 3     # largest coordinate gap between interior cells
+        offsets = []
+        for d in range(HOLE_DISTANCE, HOLE_DISTANCE + HOLE_RING):
+            for dx in range(-d, d + 1):
+                for dy in {d - abs(dx), abs(dx) - d}:
+                    if abs(dx) <= reach and abs(dy) <= reach:
+                        offsets.append((dx, dy))
+        _HOLE_OFFSETS[size] = offsets
+    return _HOLE_OFFSETS[size]
+
+# ---- snapshots ----
+# grid, head, length, apple, fire, star, hole 1, hole 2, direction, score,
+# boosted, boost_end, steps, alive, won
+_SCALARS = struct.Struct("<H" + "i" * 7 + "BI?II??")
+
+# Link ring bytes: the heading a segment was reached with, or GAP. Packed,
+# each becomes the 2-bit code back to the older segment (0 for a gap) at
+# one of the four positions of a byte, and back again.
+GAP = 4
+_PACK = [bytes((v ^ 1) << s if v < GAP else 0 for v in range(256)) for s in (0, 2, 4, 6)]
+_UNPACK = [bytes((b >> s & 3) ^ 1 for b in range(256)) for s in (0, 2, 4, 6)]
+
+class Snapshot:
+    # Hashable, comparable game state. Equality and hash cover the board,
+    # body, items and counters but not the RNG state (two positions that
+    # look the same are the same for search), which rides along in `rng`
+    # so restore() can also replay future spawns exactly.
+    __slots__ = ("key", "rng", "seed")
+
+    def __init__(self, key, rng, seed):
+        self.key = key
+        self.rng = rng
+        self.seed = seed
+
+    def __eq__(self, other):
+        return isinstance(other, Snapshot) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"Snapshot({self.key[0].hex()}, links={self.key[1].hex()}, gaps={self.key[2]})"
+
+def _ring_capacity(n):
+    capacity = 1
+    while capacity < n:
+        capacity <<= 1
+    return capacity
+
+class Body:
+    # The body as [x, y] cells, head first: len(), indexing (negative too)
+    # and lazy iteration over the live ring. Every access builds a small
+    # list, so hot loops should read engine.head / engine.body instead.
+    __slots__ = ("engine",)
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def __len__(self):
+        return self.engine.length
+
+    def __getitem__(self, k):
+        e = self.engine
+        if k < 0:
+            k += e.length
+        if not 0 <= k < e.length:
+            raise IndexError("snake index out of range")
+        i = e.body[(e.head_ptr + k) & e.mask]
+        return [i % e.grid_size, i // e.grid_size]
+
+    def __iter__(self):
+        e = self.engine
+        size, body, mask, ptr = e.grid_size, e.body, e.mask, e.head_ptr
+        for k in range(e.length):
+            i = body[(ptr + k) & mask]
+            yield [i % size, i // size]
+
+    def __repr__(self):
+        return f"Body({list(self)})"
+
+class SnakeEngine:
+    def __init__(self, grid_size=20, boost_ticks=BOOST_TICKS, seed=None):
+        self.grid_size = grid_size
+        self.boost_ticks = boost_ticks
+        self.neighbours = neighbours(grid_size)
+        self.snake = Body(self)
+        self.mask = None
+        self.reset(seed)
+
+    # ---- cells ----
+    def index(self, cell):
+        # [x, y] -> cell index; None and off-board cells give NONE.
+        if cell is None:
+            return NONE
+        x, y = cell
+        size = self.grid_size
+        return y * size + x if 0 <= x < size and 0 <= y < size else NONE
+
+    def cell(self, i):
+        return None if i < 0 else [i % self.grid_size, i // self.grid_size]
+
+    apple = property(lambda self: self.cell(self.apple_i),
+                     lambda self, cell: setattr(self, "apple_i", self.index(cell)))
+    obstacle = property(lambda self: self.cell(self.obstacle_i),
+                        lambda self, cell: setattr(self, "obstacle_i", self.index(cell)))
+    star = property(lambda self: self.cell(self.star_i),
+                    lambda self, cell: setattr(self, "star_i", self.index(cell)))
+    bh1 = property(lambda self: self.cell(self.bh1_i),
+                   lambda self, cell: setattr(self, "bh1_i", self.index(cell)))
+    bh2 = property(lambda self: self.cell(self.bh2_i),
+                   lambda self, cell: setattr(self, "bh2_i", self.index(cell)))
+
+    @property
+    def direction(self):
+        return DIRECTIONS[self.heading]
+
+    @direction.setter
+    def direction(self, d):
+        self.heading = CODE[(d[0], d[1])]
+
+    # ---- setup ----
+    def reset(self, seed=None):
+        # Without a seed one is drawn (and kept in self.seed) so the game
+        # can still be replayed.
+        if seed is None:
+            seed = random.randrange(1 << 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        rand = self.rng.randint
+        hi = self.grid_size - 2
+        mid = self.grid_size // 2
+        self.set_snake([[mid, mid], [mid - 1, mid], [mid - 2, mid]])
+        self.apple = [rand(1, hi), rand(1, hi)]
+        self.obstacle = [rand(1, hi), rand(1, hi)]
+        self.star = [rand(1, hi), rand(1, hi)]
+        self.heading = CODE[(1, 0)]
+        self.score = 0
+        self.boosted = False
+        self.boost_end = 0
+        self.bh1_i = NONE
+        self.bh2_i = NONE
+        self.alive = True
+        self.won = False
+        self.steps = 0
+        self.popped = NONE
+        return self
+
+    def set_snake(self, cells):
+        # Replace the body (head first, [x, y] cells) and rebuild the
+        # occupancy grid, the free-cell index and the link ring.
+        indices = [y * self.grid_size + x for x, y in cells]
+        table = self.neighbours
+        links = bytearray(len(indices) - 1)
+        for k in range(len(links)):
+            i, older = indices[k], indices[k + 1]
+            for code in range(4):
+                if table[4 * older + code] == i:
+                    break
+            else:
+                code = GAP
+            links[k] = code
+        self._load(indices, links)
+
+    def _load(self, indices, links, reuse=False):
+        # Body (head first) and its link ring bytes. The board-sized buffers
+        # are allocated once and after that copied back from the empty
+        # board's. With reuse (restore()) the engine then logs the cells it
+        # touches, and the next restore puts back only those: the same
+        # buffers, free list order included, without the board-sized copy.
+        # Past touch_limit cells the log is dropped, as copying is cheaper.
+        size = self.grid_size
+        length = len(indices)
+        interior, free, free_pos, empty = interior_cells(size)
+        capacity = _ring_capacity(max(size * size, length + 1))
+        if self.mask != capacity - 1:
+            self.interior = interior
+            self.free = []
+            self.free_pos = []
+            self.occupied = bytearray(size * size)
+            self.body = array("I", bytes(4 * capacity))
+            self.links = bytearray(capacity)
+            self.mask = capacity - 1
+            self.touched = None
+            self.touch_limit = size * size >> 3
+        if reuse and self.touched is not None:
+            mine, mine_pos, occupied = self.free, self.free_pos, self.occupied
+            mine += free[len(mine):]
+            for i in self.touched:
+                occupied[i] = 0
+                pos = free_pos[i]
+                if pos >= 0:
+                    mine[pos] = i
+                    mine_pos[i] = pos
+        else:
+            self.free[:] = free
+            self.free_pos[:] = free_pos
+            self.occupied[:] = empty
+        touched = [] if reuse and 2 * length <= self.touch_limit else None
+        self.body[:length] = array("I", indices)
+        self.links[:len(links)] = links
+        self.head_ptr = 0
+        self.length = length
+        self.head = indices[0]
+        occupied, free, free_pos = self.occupied, self.free, self.free_pos
+        for i in indices:               # _occupy, inlined
+            occupied[i] += 1
+            pos = free_pos[i]
+            if pos >= 0:
+                last = free.pop()
+                if last != i:
+                    free[pos] = last
+                    free_pos[last] = pos
+                    if touched is not None:
+                        touched.append(last)
+                free_pos[i] = -1
+        if touched is not None:
+            touched += indices
+        self.touched = touched
+
+    def _touch(self, *cells):
+        # Log cells whose occupancy or free-list slot changed, for restore().
+        touched = self.touched
+        touched += cells
+        if len(touched) > self.touch_limit:
+            self.touched = None
+
+    def _occupy(self, i):
+        self.occupied[i] += 1
+        pos = self.free_pos[i]
+        if pos >= 0:
+            last = self.free.pop()
+            if last != i:
+                self.free[pos] = last
+                self.free_pos[last] = pos
+            self.free_pos[i] = -1
+            if self.touched is not None:
+                self._touch(i, last)
+        elif self.touched is not None:
+            self._touch(i)
+
+    def _vacate(self, i):
+        self.occupied[i] -= 1
+        if not self.occupied[i] and self.interior[i]:
+            self.free_pos[i] = len(self.free)
+            self.free.append(i)
+        if self.touched is not None:
+            self._touch(i)
+
+    def is_occupied(self, cell):
+        return self.occupied[cell[1] * self.grid_size + cell[0]] != 0
+
+    def place_black_holes(self):
+        # Used for the first pair and for every re-spawn after a teleport.
+        # Returns two cell indices, or (NONE, NONE) if there is no room.
+        size = self.grid_size
+        offsets = hole_offsets(size)
+        if not offsets:
+            return NONE, NONE
+        taken = (self.apple_i, self.obstacle_i, self.star_i)
+        occupied = self.occupied
+        for _ in range(HOLE_TRIES):
+            b1 = self._free_cell(*taken)
+            if b1 < 0:
+                return NONE, NONE
+            x1, y1 = b1 % size, b1 // size
+            for _ in range(HOLE_TRIES):
+                b2 = self._free_cell(b1, *taken)
+                if b2 < 0:
+                    return NONE, NONE
+                if abs(x1 - b2 % size) + abs(y1 - b2 // size) >= HOLE_DISTANCE:
+                    return b1, b2
+
+            # Crowded board: walk the ring from a random offset instead.
+            n = len(offsets)
+            start = self.rng.randrange(n)
+            for k in range(n):
+                dx, dy = offsets[(start + k) % n]
+                x, y = x1 + dx, y1 + dy
+                if 0 < x < size - 1 and 0 < y < size - 1:
+                    b2 = y * size + x
+                    if not occupied[b2] and b2 not in taken:
+                        return b1, b2
+        return NONE, NONE
+
+    def _free_cell(self, *taken):
+        # Uniform pick among free interior cells other than `taken` (cell
+        # indices), or NONE when there is none left. Taken cells are swapped
+        # to the end of the free list and the pick is drawn from the part
+        # before them.
+        free, free_pos = self.free, self.free_pos
+        end = len(free)
+        for i in taken:
+            if i >= 0:
+                pos = free_pos[i]
+                if 0 <= pos < end:
+                    end -= 1
+                    last = free[end]
+                    free[pos], free[end] = last, i
+                    free_pos[last], free_pos[i] = pos, end
+                    if self.touched is not None:
+                        self._touch(i, last)
+        if end == 0:
+            return NONE
+        return free[self.rng.randrange(end)]
+
+    # ---- rules ----
+    def step(self, action=None):
+        # action is a direction to turn to ([dx, dy] or its index in
+        # DIRECTIONS; reversals are ignored) or None to keep going, as does
+        # -1 (the batch env's code for it). Returns a mask of the step()
+        # result flags.
+        if not self.alive:
+            return DIED
+        heading = self.heading
+        if action is not None:
+            if action.__class__ is int:
+                code = action
+            elif isinstance(action, (list, tuple)):
+                code = CODE[(action[0], action[1])]
+            else:
+                code = int(action)      # NumPy integers and the like
+            if not 0 <= code <= 3:
+                if code != -1:
+                    raise ValueError(f"action {action!r} is not a direction code 0..3 or -1")
+            elif code != heading ^ 1:
+                self.heading = heading = code
+
+        i = self.neighbours[4 * self.head + heading]
+        occupied = self.occupied
+        self.steps += 1
+
+        # The tail is still on the board here, so running into it is fatal
+        # (same as the old `new_head in snake` test).
+        if i < 0 or occupied[i]:
+            self.alive = False
+            return DIED
+
+        body = self.body
+        ptr = (self.head_ptr - 1) & self.mask
+        body[ptr] = i
+        self.links[ptr] = heading
+        self.head_ptr = ptr
+        self.length += 1
+        self.head = i
+        self._occupy(i)
+        events = 0
+
+        if i == self.apple_i:
+            events |= ATE_APPLE
+            self.score += 1
+            self.apple_i = self._free_cell(self.obstacle_i, self.star_i)
+            if self.apple_i < 0:
+                return self._win(events)
+
+        elif i == self.star_i:
+            events |= GOT_STAR
+            self.star_i = self._free_cell(self.apple_i, self.obstacle_i)
+            if self.star_i < 0:
+                return self._win(events)
+            self.boosted = True
+            self.boost_end = self.steps + self.boost_ticks
+
+        elif i == self.obstacle_i:
+            self.alive = False
+            return events | DIED
+
+        if self.score >= 2 and self.bh1_i < 0:
+            self.bh1_i, self.bh2_i = self.place_black_holes()
+
+        if self.bh1_i >= 0:
+            out = NONE
+            if i == self.bh1_i:
+                out = self.bh2_i
+            elif i == self.bh2_i:
+                out = self.bh1_i
+            if out >= 0:
+                self._vacate(i)
+                body[ptr] = out
+                self.head = out
+                self._occupy(out)
+                self.links[ptr] = GAP
+                self.bh1_i, self.bh2_i = self.place_black_holes()
+                events |= TELEPORTED
+
+        # popped: the tail cell this step freed (NONE if the snake grew),
+        # so observers can update just the cells that changed.
+        if not events & ATE_APPLE:
+            self.length -= 1
+            tail = body[(ptr + self.length) & self.mask]
+            self.popped = tail
+            self._vacate(tail)
+        else:
+            self.popped = NONE
+
+        if self.boosted and self.steps > self.boost_end:
+            self.boosted = False
+
+        return events
+
+    def _win(self, events):
+        # No free cell left for the item that was just eaten.
+        self.alive = False
+        self.won = True
+        return events | WON
+
+    # ---- cloning ----
+    def indices(self):
+        # The body's cell indices, head first, as a new array('I').
+        ptr, end = self.head_ptr, self.head_ptr + self.length
+        if end <= len(self.body):
+            return self.body[ptr:end]
+        return self.body[ptr:] + self.body[:end - len(self.body)]
+
+    def snapshot(self, rng=True):
+        # O(length), in C: the ring bytes under the body, packed. Pass
+        # rng=False when only the position matters (e.g. transposition keys).
+        length, ptr, ring = self.length, self.head_ptr, self.links
+        count = length - 1
+        end = ptr + count
+        codes = ring[ptr:end] if end <= len(ring) else ring[ptr:] + ring[:end - len(ring)]
+        bits = 0
+        for j in range(4):
+            bits |= int.from_bytes(codes[j::4].translate(_PACK[j]), "little")
+        gaps = []
+        k = codes.find(GAP)
+        while k >= 0:
+            gaps.append((k, self.body[(ptr + k + 1) & self.mask]))
+            k = codes.find(GAP, k + 1)
+        scalars = _SCALARS.pack(
+            self.grid_size, self.head, length,
+            self.apple_i, self.obstacle_i, self.star_i, self.bh1_i, self.bh2_i,
+            self.heading, self.score, self.boosted, self.boost_end, self.steps,
+            self.alive, self.won)
+        links = bits.to_bytes((count + 3) >> 2, "little")
+        return Snapshot((scalars, links, tuple(gaps)), self.rng.getstate() if rng else None, self.seed)
+
+    def restore(self, snap):
+        # O(length): the links run back into cells with running sums. The
+        # first restore copies the board-sized buffers from the empty
+        # board's, later ones only put back the cells touched since.
+        scalars, links, gaps = snap.key
+        (size, head, length, self.apple_i, self.obstacle_i, self.star_i, self.bh1_i, self.bh2_i,
+         self.heading, self.score, self.boosted, self.boost_end, self.steps,
+         self.alive, self.won) = _SCALARS.unpack(scalars)
+        if size != self.grid_size:
+            raise ValueError(f"snapshot is for a {size}x{size} board, not {self.grid_size}x{self.grid_size}")
+        count = length - 1
+        codes = bytearray(count)
+        for j in range(4):
+            codes[j::4] = links[:(count - j + 3) >> 2].translate(_UNPACK[j])
+        for k, cell in gaps:
+            codes[k] = GAP
+        # A segment reached heading `code` is one step against it from the
+        # one before; at a gap the sum restarts from the gap's cell.
+        back = [-(dy * size + dx) for dx, dy in zip(DX, DY)] + [0]
+        steps = list(map(back.__getitem__, codes))
+        indices, start, i = [], 0, head
+        for k, cell in gaps:
+            indices += accumulate(steps[start:k], initial=i)
+            start, i = k + 1, cell
+        indices += accumulate(steps[start:count], initial=i)
+        self._load(indices, codes, reuse=True)
+        self.popped = NONE
+        self.seed = snap.seed
+        if snap.rng is not None:
+            self.rng.setstate(snap.rng)
+        return self
+
+    # ---- observation ----
+    def state(self):
+        return {
+            "snake": list(self.snake),
+            "apple": self.apple,
+            "obstacle": self.obstacle,
+            "star": self.star,
+            "direction": self.direction.copy(),
+            "score": self.score,
+            "boosted": self.boosted,
+            "boost_end": self.boost_end,
+            "seed": self.seed,
+            "black_holes": (self.bh1, self.bh2) if self.bh1_i >= 0 else None,
+            "alive": self.alive,
+            "won": self.won,
+            "steps": self.steps,
+        }
+
+# =================================================================
+#                     ⏱️ BUILT-IN BENCHMARK
+# =================================================================
+# A cheap bot (keep going, turn at random now and then, avoid the obvious
+# wall) plays back-to-back games; restarts are included in the timing.
+
+def benchmark(steps=1_000_000, grid_size=20, seed=0):
+    engine = SnakeEngine(grid_size, seed=seed)
+    rng = random.Random(seed)
+    games = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        action = None
+        if rng.random() < 0.2:
+            action = rng.randrange(4)
+        code = engine.heading if action is None else action
+        if engine.neighbours[4 * engine.head + code] < 0:
+            action = rng.randrange(4)
+        if engine.step(action) & DIED:
+            games += 1
+            engine.reset(seed + games)
+    elapsed = time.perf_counter() - start
+    return steps / elapsed, games
+
+if __name__ == "__main__":
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    grid_size = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rate, games = benchmark(steps, grid_size)
+    print(f"{steps} steps on {grid_size}x{grid_size}: {rate:,.0f} steps/s "
+          f"({rate * 60 / 1e6:.1f}M steps/min, {games} games)")
@@ -0,0 +1,404 @@
+import random
+import struct
+import sys
+import time
+
+import numpy as np
+
+from batch_env import APPLE, BODY, EMPTY, FIRE, HEAD, HOLE, STAR
+from snake_engine import ATE_APPLE, BOOST_TICKS, CODE, DIED, DIRECTIONS, WON, SnakeEngine
+
+try:
+    import gymnasium as gym
+    from gymnasium import spaces
+except ImportError:     # the env works without Gymnasium, minus the spaces
+    gym = None
+    spaces = None
+
+# =================================================================
+#                     🏋️ GYMNASIUM-STYLE ENVIRONMENT
+# =================================================================
+# SnakeEnv wraps one SnakeEngine in the Gymnasium reset()/step() API.
+# Actions are absolute directions (index into DIRECTIONS; reversals are
+# ignored). Reward is +1 per apple and -1 for dying; a full board ends the
+# episode as well (terminated), max_steps truncates it.
+#
+# Observations (obs_type, or a tuple of them for a dict observation):
+#   "features"  float32 (13,)  danger ahead/left/right, heading one-hot,
+#                              apple up/down/left/right, boosted, length
+#   "grid"      uint8 (6, G, G) one plane per cell code BODY .. HOLE
+#   "rgb"       uint8 (G, G, 3) one pixel per cell in the game's colors
+#
+# The grid and rgb buffers are bytearrays that numpy views without
+# copying. A per-cell code array says what each cell shows; after a step
+# only the cells that can have changed are re-coded (old head, new head,
+# old tail, plus the item cells when an event fired or the holes moved),
+# so an observation costs a handful of byte writes however big the board
+# is. reset() and step() hand out copies of those views, as Gymnasium
+# expects; with copy_obs=False they return the live views themselves,
+# which the next step overwrites.
+
+PALETTE = {
+    EMPTY: (255, 255, 255),
+    BODY: (0, 255, 0),
+    HEAD: (0, 160, 0),
+    APPLE: (255, 0, 0),
+    FIRE: (255, 165, 0),
+    STAR: (255, 255, 0),
+    HOLE: (0, 0, 0),
+}
+PIXEL = [bytes(PALETTE[code]) for code in range(len(PALETTE))]
+PALETTE_ARRAY = np.array([PALETTE[code] for code in range(len(PALETTE))], dtype=np.uint8)
+CHANNELS = HOLE          # planes for codes 1 .. HOLE
+FEATURES = 13
+OBS_TYPES = ("features", "grid", "rgb")
+
+# Heading code -> (left, ahead, right) codes.
+TURNS = tuple((CODE[(dy, -dx)], c, CODE[(-dy, dx)])
+              for c, (dx, dy) in enumerate(DIRECTIONS))
+
+# The first twelve features are 0/1, so all their combinations are packed
+# once: bits 0-2 danger ahead/left/right, 3-4 the heading, 5-8 apple
+# up/down/left/right, 9 boosted. A step looks its row up and copies 48
+# bytes; the length (the last float) only changes when an apple is eaten.
+FEATURE_ROWS = [struct.pack("<12f", key & 1, key >> 1 & 1, key >> 2 & 1,
+                            *(float(key >> 3 & 3 == c) for c in range(4)),
+                            key >> 5 & 1, key >> 6 & 1, key >> 7 & 1, key >> 8 & 1, key >> 9 & 1)
+                for key in range(1 << 10)]
+LENGTH_PACK = struct.Struct("<f").pack_into
+
+class SnakeEnv(gym.Env if gym else object):
+    metadata = {"render_modes": ["rgb_array"]}
+
+    def __init__(self, grid_size=20, obs_type="features", max_steps=None,
+                 boost_ticks=BOOST_TICKS, render_mode=None, copy_obs=True):
+        types = (obs_type,) if isinstance(obs_type, str) else tuple(obs_type)
+        for t in types:
+            if t not in OBS_TYPES:
+                raise ValueError(f"unknown obs_type {t!r}, expected one of {OBS_TYPES}")
+        self.obs_type = obs_type
+        self.types = types
+        self.grid_size = grid_size
+        self.max_steps = max_steps
+        self.copy_obs = copy_obs
+        self.render_mode = render_mode
+        self.engine = SnakeEngine(grid_size, boost_ticks=boost_ticks, seed=0)
+        if not gym:
+            self.np_random = np.random.default_rng()
+
+        cells = grid_size * grid_size
+        self.cells = cells
+        self.codes = bytearray(cells)
+        self.marked = bytearray(cells + 1)      # + 1: NONE (-1) lands on a spare byte
+        self.marks = ()
+        self.planes = bytearray(CHANNELS * cells) if "grid" in types else None
+        self.pixels = bytearray(3 * cells) if "rgb" in types else None
+        self.features = bytearray(4 * FEATURES) if "features" in types else None
+
+        views = {}
+        if self.features is not None:
+            views["features"] = np.frombuffer(self.features, dtype=np.float32)
+        if self.planes is not None:
+            views["grid"] = np.frombuffer(self.planes, dtype=np.uint8).reshape(CHANNELS, grid_size, grid_size)
+        if self.pixels is not None:
+            views["rgb"] = np.frombuffer(self.pixels, dtype=np.uint8).reshape(grid_size, grid_size, 3)
+        self.views = views
+        self.cell_coded = self.planes is not None or self.pixels is not None
+        if self.planes is not None and self.pixels is not None:
+            self.put = self._put_both
+        elif self.planes is not None:
+            self.put = self._put_grid
+        elif self.pixels is not None:
+            self.put = self._put_rgb
+        else:
+            self.put = self._put_codes
+        self.obs = views[types[0]] if isinstance(obs_type, str) else views
+
+        self.action_space = spaces.Discrete(4) if spaces else None
+        if spaces:
+            boxes = {
+                "features": spaces.Box(-1.0, 1.0, (FEATURES,), np.float32),
+                "grid": spaces.Box(0, 1, (CHANNELS, grid_size, grid_size), np.uint8),
+                "rgb": spaces.Box(0, 255, (grid_size, grid_size, 3), np.uint8),
+            }
+            self.observation_space = (boxes[obs_type] if isinstance(obs_type, str)
+                                      else spaces.Dict({t: boxes[t] for t in types}))
+
+    # ---- Gymnasium API ----
+    def reset(self, seed=None, options=None):
+        # Without a seed the game's seed comes from np_random, so a run
+        # seeded once at its first reset replays in full.
+        if gym:
+            super().reset(seed=seed)
+        elif seed is not None:
+            self.np_random = np.random.default_rng(seed)
+        if seed is None:
+            seed = int(self.np_random.integers(1 << 32))
+        self.engine.reset(seed)
+        self._rebuild()
+        return self._observe(), {"score": 0, "seed": self.engine.seed}
+
+    def step(self, action):
+        e = self.engine
+        events = e.step(action)
+        if events:
+            return self._step_events(events)
+        if self.cell_coded:
+            self._advance()
+        if self.features is not None:
+            self._update_features()
+        truncated = self.max_steps is not None and e.steps >= self.max_steps
+        obs = self._observe() if self.copy_obs else self.obs
+        return obs, 0.0, False, truncated, {"score": e.score, "events": 0}
+
+    def _step_events(self, events):
+        e = self.engine
+        terminated = bool(events & (DIED | WON))
+        # Even a last step only moves the head, the tail and the items.
+        if self.cell_coded:
+            self._recode_events()
+        if self.features is not None:
+            self._update_length()
+            self._update_features()
+        reward = -1.0 if events & DIED else 1.0 if events & ATE_APPLE else 0.0
+        truncated = self.max_steps is not None and e.steps >= self.max_steps and not terminated
+        return self._observe(), reward, terminated, truncated, {"score": e.score, "events": events}
+
+    def _observe(self):
+        if not self.copy_obs:
+            return self.obs
+        if isinstance(self.obs, dict):
+            return {t: view.copy() for t, view in self.obs.items()}
+        return self.obs.copy()
+
+    def render(self):
+        if self.pixels is not None:
+            return self.views["rgb"].copy()
+        if not self.cell_coded:
+            self._rebuild_codes()
+        rgb = np.empty((self.grid_size, self.grid_size, 3), dtype=np.uint8)
+        codes = np.frombuffer(self.codes, dtype=np.uint8).reshape(self.grid_size, self.grid_size)
+        for code, color in PALETTE.items():
+            rgb[codes == code] = color
+        return rgb
+
+    # ---- cell codes (grid / rgb) ----
+    def _cache_marks(self):
+        # Cell indices of the items and holes, NONE (-1) where there is none,
+        # and a per-cell flag for them.
+        e = self.engine
+        marked = self.marked
+        for i in self.marks:
+            marked[i] = 0
+        self.marks = (e.apple_i, e.star_i, e.obstacle_i, e.bh1_i, e.bh2_i)
+        for i in self.marks:
+            if i >= 0:
+                marked[i] = 1
+
+    def _code(self, i):
+        if i == self.head_i:
+            return HEAD
+        apple, star, fire, bh1, bh2 = self.marks
+        if i == bh1 or i == bh2:
+            return HOLE
+        if i == apple:
+            return APPLE
+        if i == star:
+            return STAR
+        if i == fire:
+            return FIRE
+        return BODY if self.engine.occupied[i] else EMPTY
+
+    def _put_codes(self, i, code):
+        self.codes[i] = code
+
+    def _put_grid(self, i, code):
+        old = self.codes[i]
+        if old != code:
+            self.codes[i] = code
+            if old:
+                self.planes[(old - 1) * self.cells + i] = 0
+            if code:
+                self.planes[(code - 1) * self.cells + i] = 1
+
+    def _put_rgb(self, i, code):
+        self.codes[i] = code
+        self.pixels[3 * i:3 * i + 3] = PIXEL[code]
+
+    def _put_both(self, i, code):
+        self._put_grid(i, code)
+        self.pixels[3 * i:3 * i + 3] = PIXEL[code]
+
+    def _advance(self):
+        # Plain move: new head, old head turns to body, old tail clears.
+        # Unless an item or hole sits on one of those cells, the old codes
+        # are known (EMPTY, HEAD, BODY) and the writes go out directly.
+        e = self.engine
+        marks = self.marks
+        if e.bh1_i != marks[3] or e.bh2_i != marks[4]:
+            # Holes that couldn't be placed after a teleport (crowded board)
+            # get placed on a later step, with no event to say so.
+            self._recode_events()
+            return
+        head_i = self.head_i = e.head
+        old_i = e.body[(e.head_ptr + 1) & e.mask]
+        tail_i = e.popped
+        marked = self.marked
+        if marked[old_i] or marked[tail_i] or e.occupied[tail_i]:
+            put = self.put
+            put(head_i, HEAD)
+            put(old_i, self._code(old_i))
+            put(tail_i, self._code(tail_i))
+            return
+        codes = self.codes
+        codes[head_i] = HEAD
+        codes[old_i] = BODY
+        codes[tail_i] = EMPTY
+        planes = self.planes
+        if planes is not None:
+            head_plane = (HEAD - 1) * self.cells
+            planes[head_plane + head_i] = 1
+            planes[head_plane + old_i] = 0
+            planes[old_i] = 1                   # BODY is plane 0
+            planes[tail_i] = 0
+        pixels = self.pixels
+        if pixels is not None:
+            pixels[3 * head_i:3 * head_i + 3] = PIXEL[HEAD]
+            pixels[3 * old_i:3 * old_i + 3] = PIXEL[BODY]
+            pixels[3 * tail_i:3 * tail_i + 3] = PIXEL[EMPTY]
+
+    def _recode_events(self):
+        # Something was eaten or a teleport happened: items may have moved.
+        e = self.engine
+        self.head_i = e.head
+        changed = list(self.marks)
+        self._cache_marks()
+        changed += self.marks
+        changed += (e.head, e.body[(e.head_ptr + 1) & e.mask], e.popped)
+        for i in changed:
+            if i >= 0:
+                self.put(i, self._code(i))
+
+    def _rebuild_codes(self):
+        self.codes[:] = bytes(self.cells)
+        self.head_i = self.engine.head
+        self._cache_marks()
+        for i in self.engine.indices():
+            self.codes[i] = BODY
+        for i in self.marks + (self.head_i,):
+            if i >= 0:
+                self.codes[i] = self._code(i)
+
+    def _rebuild(self):
+        if self.cell_coded:
+            self._rebuild_codes()
+            if self.planes is not None:
+                planes = np.frombuffer(self.planes, dtype=np.uint8).reshape(CHANNELS, self.cells)
+                codes = np.frombuffer(self.codes, dtype=np.uint8)
+                planes[:] = codes == np.arange(1, CHANNELS + 1, dtype=np.uint8)[:, None]
+            if self.pixels is not None:
+                codes = np.frombuffer(self.codes, dtype=np.uint8)
+                np.frombuffer(self.pixels, dtype=np.uint8).reshape(self.cells, 3)[:] = PALETTE_ARRAY[codes]
+        if self.features is not None:
+            self._update_length()
+            self._update_features()
+
+    # ---- features ----
+    def _update_length(self):
+        LENGTH_PACK(self.features, 4 * (FEATURES - 1), self.engine.length / self.cells)
+
+    def _update_features(self):
+        # One pass: the three cells next to the head from the engine's
+        # neighbour table, the apple's side of the head, then one row copy.
+        e = self.engine
+        head = e.head
+        occupied = e.occupied
+        table = e.neighbours
+        fire = e.obstacle_i
+        heading = e.heading
+        left, ahead, right = TURNS[heading]
+        key = heading << 3 | e.boosted << 9
+        i = table[4 * head + ahead]
+        if i < 0 or i == fire or occupied[i]:
+            key |= 1
+        i = table[4 * head + left]
+        if i < 0 or i == fire or occupied[i]:
+            key |= 2
+        i = table[4 * head + right]
+        if i < 0 or i == fire or occupied[i]:
+            key |= 4
+        apple = e.apple_i
+        if apple >= 0:
+            size = self.grid_size
+            hx, hy = head % size, head // size
+            ax, ay = apple % size, apple // size
+            key |= (ay < hy) << 5 | (ay > hy) << 6 | (ax < hx) << 7 | (ax > hx) << 8
+        self.features[:48] = FEATURE_ROWS[key]
+
+# =================================================================
+#                     ⏱️ OBSERVATION OVERHEAD BENCHMARK
+# =================================================================
+# Same seed and random actions through a bare SnakeEngine and through
+# SnakeEnv with each observation type; the difference is what keeping the
+# observation current costs (live views, so no copy). It should not grow
+# with the board, since only the changed cells are touched; "rebuild"
+# re-encodes the whole grid every step for comparison. Random play ends a
+# game every ~50 steps, so resets are timed apart from the steps: a seeded
+# env.reset() builds a new np_random and re-encodes the board.
+#
+# The target was under 20% over engine.step. It is not met and can't be
+# from Python: a wrapper that only calls engine.step and returns the
+# Gymnasium tuple already adds ~0.4 us, about 20% of a ~2 us step. Medians
+# of 11 interleaved runs, before and after the feature row table and the
+# direct cell writes (20x20; 100x100 is similar):
+#   features  +162% -> +115%    grid  +148% -> +76%    rgb  +241% -> +149%
+
+def benchmark(steps=200_000, grid_size=20, seed=0):
+    rng = random.Random(seed)
+    actions = [rng.randrange(4) for _ in range(steps)]
+
+    engine = SnakeEngine(grid_size, seed=seed)
+    stepping = 0.0
+    start = time.perf_counter()
+    for a in actions:
+        if engine.step(a) & (DIED | WON):
+            stepping += time.perf_counter() - start
+            engine.reset(seed)
+            start = time.perf_counter()
+    raw = (stepping + time.perf_counter() - start) / steps * 1e6
+
+    def run(env, rebuild=False):
+        env.reset(seed=seed)
+        stepping = resetting = 0.0
+        games = 0
+        start = time.perf_counter()
+        for a in actions:
+            _, _, terminated, truncated, _ = env.step(a)
+            if rebuild:
+                env._rebuild()
+            if terminated or truncated:
+                mark = time.perf_counter()
+                env.reset(seed=seed)
+                start, stepping, resetting = (time.perf_counter(), stepping + mark - start,
+                                              resetting + time.perf_counter() - mark)
+                games += 1
+        stepping += time.perf_counter() - start
+        return stepping / steps * 1e6, resetting / max(games, 1) * 1e6
+
+    results = {}
+    for obs_type in OBS_TYPES + (OBS_TYPES,):
+        env = SnakeEnv(grid_size, obs_type, copy_obs=False)
+        results["+".join(env.types)] = run(env)
+    results["grid (rebuild)"] = run(SnakeEnv(grid_size, "grid", copy_obs=False), rebuild=True)
+    return raw, results
+
+if __name__ == "__main__":
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"gymnasium: {'yes' if gym else 'not installed (plain API)'}")
+    for grid_size in (20, 100):
+        raw, results = benchmark(steps, grid_size)
+        print(f"{grid_size}x{grid_size}")
+        print(f"  engine.step                     {raw:6.2f} us")
+        for name, (us, reset) in results.items():
+            print(f"  env.step {name:22s} {us:6.2f} us  (+{us - raw:5.2f} us, {us / raw - 1:4.0%})"
+                  f"   reset {reset:7.1f} us")
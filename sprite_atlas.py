@@ -0,0 +1,86 @@
+import pygame
+
+# =================================================================
+#                     🧩 ITEM SPRITE ATLAS
+# =================================================================
+# Item glyphs (apple, fire, star, black hole) never change between frames,
+# so each one is rasterized once per (glyph, color, cell size), packed into
+# one atlas surface, and drawn afterwards with a plain blit.
+
+class SpriteAtlas:
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.surface = None
+        self.sprites = {}    # name -> (font, glyph, color, scale, anchor)
+        self.keys = {}       # name -> current cache key
+        self.cache = {}      # (glyph, color, cell_size, scale, anchor) -> (area, offset)
+        self._glyphs = {}    # same key -> rasterized surface waiting to be packed
+
+    def add(self, name, font, glyph, color, scale=False, anchor="topleft"):
+        self.sprites[name] = (font, glyph, color, scale, anchor)
+        self._rasterize(name)
+
+    def set_cell_size(self, cell_size):
+        if cell_size == self.cell_size:
+            return
+        self.cell_size = cell_size
+        for name in self.sprites:
+            self._rasterize(name)
+
+    def _key(self, name):
+        font, glyph, color, scale, anchor = self.sprites[name]
+        return (glyph, tuple(color), self.cell_size, scale, anchor)
+
+    def _rasterize(self, name):
+        key = self._key(name)
+        self.keys[name] = key
+        if key in self.cache or key in self._glyphs:
+            return
+        font, glyph, color, scale, anchor = self.sprites[name]
+        surf, _ = font.render(glyph, color, size=self.cell_size)
+        if scale:
+            surf = pygame.transform.scale(surf, (self.cell_size, self.cell_size))
+        self._glyphs[key] = surf
+        self._pack()
+
+    def _pack(self):
+        # Lay every glyph out left to right on a single strip.
+        glyphs = {}
+        if self.surface is not None:
+            for key, (area, _) in self.cache.items():
+                glyphs[key] = self.surface.subsurface(area).copy()
+        glyphs.update(self._glyphs)
+        self._glyphs = {}
+
+        width = sum(s.get_width() for s in glyphs.values()) or 1
+        height = max((s.get_height() for s in glyphs.values()), default=1)
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        atlas.fill((0, 0, 0, 0))
+
+        self.cache = {}
+        x = 0
+        for key, surf in glyphs.items():
+            w, h = surf.get_size()
+            atlas.blit(surf, (x, 0))
+            cell = key[2]
+            if key[4] == "center":
+                offset = (cell//2 - w//2, cell//2 - h//2)
+            else:
+                offset = (0, 0)
+            self.cache[key] = (pygame.Rect(x, 0, w, h), offset)
+            x += w
+        self.surface = atlas
+
+    def rect(self, name, pos):
+        area, (dx, dy) = self.cache[self.keys[name]]
+        return pygame.Rect(pos[0]*self.cell_size + dx, pos[1]*self.cell_size + dy,
+                           area.width, area.height)
+
+    def draw(self, target, name, pos, origin=(0, 0)):
+        # origin is the pixel position of target's top-left corner on the board
+        area, (dx, dy) = self.cache[self.keys[name]]
+        target.blit(self.surface,
+                    (pos[0]*self.cell_size + dx - origin[0], pos[1]*self.cell_size + dy - origin[1]),
+                    area)
@@ -1,556 +1,642 @@
-import pygame
-import random
-import pygame.freetype
-import time
-import os
-import sys
-
-# ---- init ----
-pygame.init()
-
-# ---- colors ----
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-GREEN = (0, 255, 0)
-CYAN  = (0, 255, 255)
-YELLOW = (255, 255, 0)
-ORANGE = (255, 165, 0)
-GRAY = (169, 169, 169)
-RED = (255, 0, 0)
-HUD_BG = (20, 20, 20, 200)
-
-# ---- constants ----
-GRID_SIZE = 20
-CELL_SIZE = 30
-SCREEN_WIDTH = GRID_SIZE * CELL_SIZE
-SCREEN_HEIGHT = GRID_SIZE * CELL_SIZE
-
-# ---- window ----
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Snake Game - With Pause Menu")
-
-# ---- fonts ----
-apple_font = pygame.freetype.SysFont("segoeuisymbol", CELL_SIZE)
-star_font  = pygame.freetype.SysFont("segoeuisymbol", CELL_SIZE)
-fire_font  = pygame.freetype.SysFont("segoeuisymbol", CELL_SIZE)
-hole_font  = pygame.freetype.SysFont("segoeuisymbol", CELL_SIZE)
-score_font = pygame.freetype.SysFont("Arial", 22)
-menu_title_font = pygame.freetype.SysFont("Arial", 44, bold=True)
-menu_font = pygame.freetype.SysFont("Arial", 28)
-
-# ---- NEW FONTS FOR START MENU ----
-start_big = pygame.freetype.SysFont("Arial", 52, bold=True)
-start_font = pygame.freetype.SysFont("Arial", 32)
-
-# ---- clock ----
-clock = pygame.time.Clock()
-
-# ---- high score file ----
-HIGHSCORE_FILE = "highscore.txt"
-
-def load_high_score():
-    if not os.path.exists(HIGHSCORE_FILE):
-        return 0
-    try:
-        with open(HIGHSCORE_FILE, "r") as f:
-            return int(f.read().strip() or "0")
-    except:
-        return 0
-
-def save_high_score(n):
-    try:
-        with open(HIGHSCORE_FILE, "w") as f:
-            f.write(str(int(n)))
-    except:
-        pass
-
-HIGH_SCORE = load_high_score()
-
-# =================================================================
-#                    🎯 USERNAME INPUT SCREEN
-# =================================================================
-def ask_username():
-    username = ""
-
-    while True:
-        screen.fill(BLACK)
-
-        title, rect = start_big.render("ENTER USERNAME", WHITE)
-        rect.center = (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100)
-        screen.blit(title, rect)
-
-        box = pygame.Rect(SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT//2 - 20, 400, 50)
-        pygame.draw.rect(screen, WHITE, box, 2)
-
-        name_surf, name_rect = start_font.render(username, WHITE)
-        name_rect.center = box.center
-        screen.blit(name_surf, name_rect)
-
-        hint, hrect = start_font.render("Press ENTER to continue", GRAY)
-        hrect.center = (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 60)
-        screen.blit(hint, hrect)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN:
-                    if username.strip():
-                        return username
-                elif event.key == pygame.K_BACKSPACE:
-                    username = username[:-1]
-                else:
-                    if len(username) < 15:
-                        username += event.unicode
-
-        pygame.display.update()
-
-# =================================================================
-#                     🎯 YES/NO QUIT CONFIRM (FIXED HOVER)
-# =================================================================
-def quit_confirm():
-    selected = 0  # keyboard selection fallback: 0 = YES, 1 = NO
-
-    # button rectangles (same layout as elsewhere)
-    yes_rect = pygame.Rect(SCREEN_WIDTH//2 - 80, SCREEN_HEIGHT//2, 160, 50)
-    no_rect  = pygame.Rect(SCREEN_WIDTH//2 - 80, SCREEN_HEIGHT//2 + 70, 160, 50)
-
-    while True:
-        screen.fill(BLACK)
-
-        # title
-        title, rect = start_big.render("QUIT GAME?", RED)
-        rect.center = (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80)
-        screen.blit(title, rect)
-
-        # mouse position and hover checks
-        mx, my = pygame.mouse.get_pos()
-        hover_yes = yes_rect.collidepoint((mx, my))
-        hover_no  = no_rect.collidepoint((mx, my))
-
-        # Determine colors:
-        # If hovering, hover button is green and other is white (grey background).
-        # Otherwise, reflect keyboard selection (selected green, other white).
-        yes_color = GREEN if hover_yes or (not hover_yes and not hover_no and selected == 0) else WHITE
-        no_color  = GREEN if hover_no  or (not hover_yes and not hover_no and selected == 1) else WHITE
-
-        # Draw YES button (background + border) and text
-        pygame.draw.rect(screen, (50,50,50), yes_rect, border_radius=10)
-        pygame.draw.rect(screen, yes_color, yes_rect, 3, border_radius=10)
-        t_yes, r_yes = start_font.render("YES", yes_color)
-        r_yes.center = yes_rect.center
-        screen.blit(t_yes, r_yes)
-
-        # Draw NO button (background + border) and text
-        pygame.draw.rect(screen, (50,50,50), no_rect, border_radius=10)
-        pygame.draw.rect(screen, no_color, no_rect, 3, border_radius=10)
-        t_no, r_no = start_font.render("NO", no_color)
-        r_no.center = no_rect.center
-        screen.blit(t_no, r_no)
-
-        pygame.display.update()
-
-        for event in pygame.event.get():
-
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            # Keyboard navigation still works
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    selected = (selected - 1) % 2
-                elif event.key == pygame.K_DOWN:
-                    selected = (selected + 1) % 2
-                elif event.key == pygame.K_RETURN:
-                    return selected == 0
-
-            # Mouse click: return based on hover
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if hover_yes:
-                    return True
-                if hover_no:
-                    return False
-
-# =================================================================
-#                     ⭐ FIXED START MENU WITH MOUSE ⭐
-# =================================================================
-def start_menu(username):
-    selected = 0
-    options = ["START GAME", "QUIT"]
-
-    btn_w, btn_h = 300, 70
-    start_btn = pygame.Rect(SCREEN_WIDTH//2 - btn_w//2,
-                            SCREEN_HEIGHT//2 - 20,
-                            btn_w, btn_h)
-    quit_btn = pygame.Rect(SCREEN_WIDTH//2 - btn_w//2,
-                           SCREEN_HEIGHT//2 + 80,
-                           btn_w, btn_h)
-
-    while True:
-        screen.fill(BLACK)
-
-        greet, grect = start_big.render(f"Welcome {username}", YELLOW)
-        grect.center = (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 140)
-        screen.blit(greet, grect)
-
-        mx, my = pygame.mouse.get_pos()
-
-        hover_start = start_btn.collidepoint((mx, my))
-        hover_quit  = quit_btn.collidepoint((mx, my))
-
-        pygame.draw.rect(screen, (50,50,50), start_btn, border_radius=12)
-        pygame.draw.rect(screen, GREEN if hover_start else WHITE, start_btn, 3, border_radius=12)
-        t, r = start_font.render("START GAME", GREEN if hover_start else WHITE)
-        r.center = start_btn.center
-        screen.blit(t, r)
-
-        pygame.draw.rect(screen, (50,50,50), quit_btn, border_radius=12)
-        pygame.draw.rect(screen, GREEN if hover_quit else WHITE, quit_btn, 3, border_radius=12)
-        t, r = start_font.render("QUIT", GREEN if hover_quit else WHITE)
-        r.center = quit_btn.center
-        screen.blit(t, r)
-
-        pygame.display.update()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            # KEYBOARD (unchanged)
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    selected = (selected - 1) % 2
-                elif event.key == pygame.K_DOWN:
-                    selected = (selected + 1) % 2
-                elif event.key == pygame.K_RETURN:
-                    if selected == 0:
-                        return "start"
-                    else:
-                        if quit_confirm():
-                            pygame.quit()
-                            sys.exit()
-
-            # MOUSE CLICK
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if hover_start:
-                    return "start"
-                if hover_quit:
-                    if quit_confirm():
-                        pygame.quit()
-                        sys.exit()
-
-# =================================================================
-#        ⚠️⚠️⚠️ FULL GAME CODE — UNTOUCHED ⚠️⚠️⚠️
-# =================================================================
-
-def place_black_holes():
-    while True:
-        b1 = [random.randint(1, GRID_SIZE-2), random.randint(1, GRID_SIZE-2)]
-        b2 = [random.randint(1, GRID_SIZE-2), random.randint(1, GRID_SIZE-2)]
-        if abs(b1[0]-b2[0]) + abs(b1[1]-b2[1]) >= 5:
-            return b1, b2
-
-def draw_grid():
-    for x in range(0, SCREEN_WIDTH, CELL_SIZE):
-        pygame.draw.line(screen, GRAY, (x, 0), (x, SCREEN_HEIGHT))
-    for y in range(0, SCREEN_HEIGHT, CELL_SIZE):
-        pygame.draw.line(screen, GRAY, (0, y), (SCREEN_WIDTH, y))
-
-def draw_snake(snake, direction, boosted):
-    body_color = CYAN if boosted else GREEN
-    for segment in snake[1:]:
-        pygame.draw.rect(screen, body_color,
-                         pygame.Rect(segment[0] * CELL_SIZE, segment[1] * CELL_SIZE, CELL_SIZE, CELL_SIZE))
-
-    head = snake[0]
-    x = head[0] * CELL_SIZE
-    y = head[1] * CELL_SIZE
-    radius = CELL_SIZE // 2
-
-    pygame.draw.rect(screen, body_color, pygame.Rect(x, y, CELL_SIZE, CELL_SIZE))
-
-    if direction == [1, 0]:
-        pygame.draw.circle(screen, body_color, (x + CELL_SIZE, y + CELL_SIZE // 2), radius)
-        left_eye = (x + 3 * CELL_SIZE // 4, y + CELL_SIZE // 3)
-        right_eye = (x + 3 * CELL_SIZE // 4, y + 2 * CELL_SIZE // 3)
-    elif direction == [-1, 0]:
-        pygame.draw.circle(screen, body_color, (x, y + CELL_SIZE // 2), radius)
-        left_eye = (x + CELL_SIZE // 4, y + CELL_SIZE // 3)
-        right_eye = (x + CELL_SIZE // 4, y + 2 * CELL_SIZE // 3)
-    elif direction == [0, 1]:
-        pygame.draw.circle(screen, body_color, (x + CELL_SIZE // 2, y + CELL_SIZE), radius)
-        left_eye = (x + CELL_SIZE // 3, y + 3 * CELL_SIZE // 4)
-        right_eye = (x + 2 * CELL_SIZE // 3, y + 3 * CELL_SIZE // 4)
-    else:
-        pygame.draw.circle(screen, body_color, (x + CELL_SIZE // 2, y), radius)
-        left_eye = (x + CELL_SIZE // 3, y + CELL_SIZE // 4)
-        right_eye = (x + 2 * CELL_SIZE // 3, y + CELL_SIZE // 4)
-
-    pygame.draw.circle(screen, BLACK, left_eye, CELL_SIZE // 8)
-    pygame.draw.circle(screen, BLACK, right_eye, CELL_SIZE // 8)
-
-def draw_apple(pos):
-    surf, rect = apple_font.render("🍎", RED)
-    rect.topleft = (pos[0] * CELL_SIZE, pos[1] * CELL_SIZE)
-    screen.blit(surf, rect)
-
-def draw_specials(obstacle_position, star_position, bh1, bh2):
-    fire_surf, fire_rect = fire_font.render("🔥", ORANGE)
-    fire_rect.center = (obstacle_position[0]*CELL_SIZE + CELL_SIZE//2,
-                        obstacle_position[1]*CELL_SIZE + CELL_SIZE//2)
-    screen.blit(fire_surf, fire_rect)
-
-    star_surf, star_rect = star_font.render("⭐", YELLOW)
-    star_surf = pygame.transform.scale(star_surf, (CELL_SIZE, CELL_SIZE))
-    star_rect.topleft = (star_position[0]*CELL_SIZE, star_position[1]*CELL_SIZE)
-    screen.blit(star_surf, star_rect)
-
-    if bh1 and bh2:
-        h1, r1 = hole_font.render("⚫", BLACK)
-        h1 = pygame.transform.scale(h1, (CELL_SIZE, CELL_SIZE))
-        r1.topleft = (bh1[0]*CELL_SIZE, bh1[1]*CELL_SIZE)
-        screen.blit(h1, r1)
-
-        h2, r2 = hole_font.render("⚫", BLACK)
-        h2 = pygame.transform.scale(h2, (CELL_SIZE, CELL_SIZE))
-        r2.topleft = (bh2[0]*CELL_SIZE, bh2[1]*CELL_SIZE)
-        screen.blit(h2, r2)
-
-def draw_score_and_high(score, high):
-    s, _ = score_font.render(f"Score: {score}", BLACK)
-    screen.blit(s, (8, 6))
-    h, _ = score_font.render(f"High Score: {high}", BLACK)
-    screen.blit(h, (8, 30))
-
-def draw_button(rect, text, hovered=False):
-    bg = (40, 40, 40) if not hovered else (60, 60, 60)
-    border = CYAN if hovered else GRAY
-    pygame.draw.rect(screen, bg, rect, border_radius=8)
-    pygame.draw.rect(screen, border, rect, 2, border_radius=8)
-    t, r = menu_font.render(text, WHITE)
-    r.center = rect.center
-    screen.blit(t, r)
-
-def reset_game_state():
-    snake = [[10, 10], [9, 10], [8, 10]]
-    apple = [random.randint(1, GRID_SIZE-2), random.randint(1, GRID_SIZE-2)]
-    obstacle = [random.randint(1, GRID_SIZE-2), random.randint(1, GRID_SIZE-2)]
-    star = [random.randint(1, GRID_SIZE-2), random.randint(1, GRID_SIZE-2)]
-    direction = [1, 0]
-    return (snake, apple, obstacle, star, direction, 0, False, 0, None, None)
-
-# =================================================================
-#                           🎮 GAME (UNCHANGED)
-# =================================================================
-def game():
-    global HIGH_SCORE
-
-    (snake, apple_position, obstacle_position, star_position, direction,
-     score, boosted, boost_end_time, bh1, bh2) = reset_game_state()
-
-    normal_rate = 5
-    boost_extra = 5
-
-    running = True
-    paused = False
-    menu_active = False
-    confirm_active = False
-    confirm_action = None
-
-    menu_box = pygame.Rect(SCREEN_WIDTH*0.2, SCREEN_HEIGHT*0.2,
-                           SCREEN_WIDTH*0.6, SCREEN_HEIGHT*0.6)
-
-    btn_w, btn_h = 240, 54
-    resume_btn = pygame.Rect(menu_box.centerx - btn_w//2, menu_box.top+120, btn_w, btn_h)
-    restart_btn = pygame.Rect(menu_box.centerx - btn_w//2, menu_box.top+120+74, btn_w, btn_h)
-    quit_btn = pygame.Rect(menu_box.centerx - btn_w//2, menu_box.top+120+148, btn_w, btn_h)
-
-    confirm_box = pygame.Rect((SCREEN_WIDTH-420)//2, (SCREEN_HEIGHT-180)//2, 420, 180)
-    yes_btn = pygame.Rect(confirm_box.centerx - 110, confirm_box.bottom - 60, 100, 42)
-    no_btn = pygame.Rect(confirm_box.centerx + 10, confirm_box.bottom - 60, 100, 42)
-
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                if not paused and not menu_active:
-                    paused = True
-                    menu_active = True
-                    confirm_active = True
-                    confirm_action = "quit"
-                else:
-                    running = False
-
-            elif event.type == pygame.KEYDOWN:
-
-                if event.key == pygame.K_SPACE:
-                    if not menu_active:
-                        paused = True
-                        menu_active = True
-                        confirm_active = False
-                    else:
-                        if not confirm_active:
-                            paused = False
-                            menu_active = False
-
-                elif not menu_active:
-                    if event.key in (pygame.K_w, pygame.K_UP) and direction != [0, 1]:
-                        direction = [0, -1]
-                    elif event.key in (pygame.K_s, pygame.K_DOWN) and direction != [0, -1]:
-                        direction = [0, 1]
-                    elif event.key in (pygame.K_a, pygame.K_LEFT) and direction != [1, 0]:
-                        direction = [-1, 0]
-                    elif event.key in (pygame.K_d, pygame.K_RIGHT) and direction != [-1, 0]:
-                        direction = [1, 0]
-
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and menu_active:
-                mx, my = event.pos
-
-                if confirm_active:
-                    if yes_btn.collidepoint((mx, my)):
-                        if confirm_action == "restart":
-                            (snake, apple_position, obstacle_position, star_position, direction,
-                             score, boosted, boost_end_time, bh1, bh2) = reset_game_state()
-                            paused = False
-                            menu_active = False
-                            confirm_active = False
-                        elif confirm_action == "quit":
-                            pygame.quit()
-                            sys.exit()
-
-                    elif no_btn.collidepoint((mx, my)):
-                        confirm_active = False
-                        confirm_action = None
-
-                else:
-                    if resume_btn.collidepoint((mx,my)):
-                        paused = False
-                        menu_active = False
-                    elif restart_btn.collidepoint((mx,my)):
-                        confirm_active = True
-                        confirm_action = "restart"
-                    elif quit_btn.collidepoint((mx,my)):
-                        confirm_active = True
-                        confirm_action = "quit"
-
-        if not menu_active:
-            head = snake[0]
-            new_head = [head[0] + direction[0], head[1] + direction[1]]
-
-            if new_head in snake or new_head[0] < 0 or new_head[1] < 0 or new_head[0] >= GRID_SIZE or new_head[1] >= GRID_SIZE:
-                break
-
-            snake.insert(0, new_head)
-            ate_apple = False
-
-            if new_head == apple_position:
-                ate_apple = True
-                score += 1
-                if score > HIGH_SCORE:
-                    HIGH_SCORE = score
-                    save_high_score(HIGH_SCORE)
-
-                while True:
-                    cand = [random.randint(1, GRID_SIZE-2), random.randint(1, GRID_SIZE-2)]
-                    if cand not in snake and cand != obstacle_position and cand != star_position:
-                        apple_position = cand
-                        break
-
-            elif new_head == star_position:
-                while True:
-                    cand = [random.randint(1, GRID_SIZE-2), random.randint(1, GRID_SIZE-2)]
-                    if cand not in snake and cand != apple_position and cand != obstacle_position:
-                        star_position = cand
-                        break
-                boosted = True
-                boost_end_time = time.time() + 3
-
-            elif new_head == obstacle_position:
-                break
-
-            if score >= 2 and bh1 is None:
-                bh1, bh2 = place_black_holes()
-
-            if bh1 and bh2:
-                if new_head == bh1:
-                    snake[0] = bh2.copy()
-                    bh1, bh2 = place_black_holes()
-                elif new_head == bh2:
-                    snake[0] = bh1.copy()
-                    bh1, bh2 = place_black_holes()
-
-            if not ate_apple:
-                snake.pop()
-
-            if boosted and time.time() > boost_end_time:
-                boosted = False
-
-        screen.fill(WHITE)
-        draw_grid()
-        draw_snake(snake, direction, boosted)
-        draw_apple(apple_position)
-        draw_specials(obstacle_position, star_position, bh1, bh2)
-        draw_score_and_high(score, HIGH_SCORE)
-
-        if menu_active:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((10,10,10,200))
-            screen.blit(overlay, (0,0))
-
-            pygame.draw.rect(screen, (30,30,30), menu_box, border_radius=12)
-            pygame.draw.rect(screen, (80,80,80), menu_box, 2, border_radius=12)
-
-            t, r = menu_title_font.render("PAUSED", CYAN)
-            r.center = (menu_box.centerx, menu_box.top + 60)
-            screen.blit(t, r)
-
-            mx, my = pygame.mouse.get_pos()
-            draw_button(resume_btn, "Resume", resume_btn.collidepoint((mx,my)))
-            draw_button(restart_btn, "Restart", restart_btn.collidepoint((mx,my)))
-            draw_button(quit_btn, "Quit", quit_btn.collidepoint((mx,my)))
-
-            hint, hr = menu_font.render("Use mouse to click  •  Press SPACE to close", GRAY)
-            hr.center = (menu_box.centerx, quit_btn.bottom + 28)
-            screen.blit(hint, hr)
-
-            if confirm_active:
-                pygame.draw.rect(screen, (18,18,18), confirm_box, border_radius=10)
-                pygame.draw.rect(screen, (90,90,90), confirm_box, 2, border_radius=10)
-
-                msg = ("Restart game? All progress will be lost."
-                       if confirm_action == "restart"
-                       else "Quit the game? Your progress will be lost.")
-                t, _ = menu_font.render(msg, WHITE)
-                tr = t.get_rect(center=(confirm_box.centerx, confirm_box.centery - 20))
-                screen.blit(t, tr)
-
-                draw_button(yes_btn, "Yes", yes_btn.collidepoint((mx,my)))
-                draw_button(no_btn, "No", no_btn.collidepoint((mx,my)))
-
-        pygame.display.flip()
-
-        if not menu_active:
-            if boosted:
-                clock.tick(normal_rate + boost_extra)
-            else:
-                clock.tick(normal_rate)
-        else:
-            clock.tick(30)
-
-    if score > HIGH_SCORE:
-        HIGH_SCORE = score
-        save_high_score(HIGH_SCORE)
-
-    pygame.quit()
-
-# =================================================================
-#                     🎯 PROGRAM START
-# =================================================================
-if __name__ == "__main__":
-    username = ask_username()
-    choice = start_menu(username)
-
-    if choice == "start":
-        game()
+import pygame
+import pygame.freetype
+import argparse
+import os
+import sys
+
+from autopilot import Autopilot
+from hamiltonian import TourPilot
+from input_queue import TurnQueue
+from renderer import BackgroundLayer, ChunkedRenderer, DirtyRenderer, SnakeTiles
+from snake_engine import ATE_APPLE, DIED, WON, SnakeEngine
+from sprite_atlas import SpriteAtlas
+from text_cache import TextCache
+from ui import Button, Panel, wait_events
+
+# ---- init ----
+pygame.init()
+
+# ---- colors ----
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GREEN = (0, 255, 0)
+CYAN  = (0, 255, 255)
+YELLOW = (255, 255, 0)
+ORANGE = (255, 165, 0)
+GRAY = (169, 169, 169)
+RED = (255, 0, 0)
+HUD_BG = (20, 20, 20, 200)
+
+# ---- constants ----
+# SNAKE_GRID_SIZE picks a bigger board; past VIEW_CELLS the window stays
+# VIEW_CELLS wide and a camera follows the head (large-board mode).
+GRID_SIZE = int(os.environ.get("SNAKE_GRID_SIZE", 20))
+# SNAKE_SEED replays a game: same seed + same turns on the same steps.
+SEED = int(os.environ["SNAKE_SEED"]) if os.environ.get("SNAKE_SEED") else None
+CELL_SIZE = 30
+VIEW_CELLS = 20
+LARGE_BOARD = GRID_SIZE > VIEW_CELLS
+SCREEN_WIDTH = min(GRID_SIZE, VIEW_CELLS) * CELL_SIZE
+SCREEN_HEIGHT = min(GRID_SIZE, VIEW_CELLS) * CELL_SIZE
+
+# ---- window ----
+screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+CAPTION = "Snake Game - With Pause Menu"
+pygame.display.set_caption(CAPTION)
+
+# ---- fonts ----
+apple_font = pygame.freetype.SysFont("segoeuisymbol", CELL_SIZE)
+star_font  = pygame.freetype.SysFont("segoeuisymbol", CELL_SIZE)
+fire_font  = pygame.freetype.SysFont("segoeuisymbol", CELL_SIZE)
+hole_font  = pygame.freetype.SysFont("segoeuisymbol", CELL_SIZE)
+score_font = pygame.freetype.SysFont("Arial", 22)
+menu_title_font = pygame.freetype.SysFont("Arial", 44, bold=True)
+menu_font = pygame.freetype.SysFont("Arial", 28)
+
+# ---- NEW FONTS FOR START MENU ----
+start_big = pygame.freetype.SysFont("Arial", 52, bold=True)
+start_font = pygame.freetype.SysFont("Arial", 32)
+
+# ---- rendered text (LRU, keyed on font/text/color/size) ----
+text_cache = TextCache()
+
+# ---- item sprites (rasterized once, blitted every frame) ----
+atlas = SpriteAtlas(CELL_SIZE)
+atlas.add("apple", apple_font, "🍎", RED)
+atlas.add("fire", fire_font, "🔥", ORANGE, anchor="center")
+atlas.add("star", star_font, "⭐", YELLOW, scale=True)
+atlas.add("hole", hole_font, "⚫", BLACK, scale=True)
+
+# ---- snake tiles (head per direction x color, body square per color) ----
+snake_tiles = SnakeTiles(CELL_SIZE)
+
+# ---- background layer (fill + grid, rebuilt only on size/theme change) ----
+background = BackgroundLayer(GRID_SIZE, CELL_SIZE, WHITE, GRAY)
+
+# ---- clock ----
+clock = pygame.time.Clock()
+
+# ---- high score file ----
+HIGHSCORE_FILE = "highscore.txt"
+
+def load_high_score():
+    if not os.path.exists(HIGHSCORE_FILE):
+        return 0
+    try:
+        with open(HIGHSCORE_FILE, "r") as f:
+            return int(f.read().strip() or "0")
+    except:
+        return 0
+
+def save_high_score(n):
+    try:
+        with open(HIGHSCORE_FILE, "w") as f:
+            f.write(str(int(n)))
+    except:
+        pass
+
+HIGH_SCORE = load_high_score()
+
+# =================================================================
+#                    🎯 USERNAME INPUT SCREEN
+# =================================================================
+def ask_username():
+    username = ""
+
+    panel = Panel((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK)
+    panel.add_text(text_cache, start_big, "ENTER USERNAME", WHITE,
+                   (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100))
+    panel.add_text(text_cache, start_font, "Press ENTER to continue", GRAY,
+                   (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 60))
+    box = pygame.Rect(SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT//2 - 20, 400, 50)
+    pygame.draw.rect(panel.surface, WHITE, box, 2)
+    shown = None
+
+    while True:
+        # redraw only when the typed name changed
+        if username != shown:
+            panel.draw(screen)
+            name_surf, name_rect = text_cache.render(start_font, username, WHITE)
+            name_rect.center = box.center
+            screen.blit(name_surf, name_rect)
+            pygame.display.update()
+            shown = username
+
+        for event in wait_events():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN:
+                    if username.strip():
+                        return username
+                elif event.key == pygame.K_BACKSPACE:
+                    username = username[:-1]
+                else:
+                    if len(username) < 15:
+                        username += event.unicode
+
+# =================================================================
+#                     🎯 YES/NO QUIT CONFIRM (FIXED HOVER)
+# =================================================================
+def quit_confirm():
+    selected = 0  # keyboard selection fallback: 0 = YES, 1 = NO
+
+    panel = Panel((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK)
+    panel.add_text(text_cache, start_big, "QUIT GAME?", RED,
+                   (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80))
+
+    # button rectangles (same layout as elsewhere)
+    yes_btn = Button(pygame.Rect(SCREEN_WIDTH//2 - 80, SCREEN_HEIGHT//2, 160, 50),
+                     "YES", start_font, text_cache, WHITE, GREEN, radius=10)
+    no_btn  = Button(pygame.Rect(SCREEN_WIDTH//2 - 80, SCREEN_HEIGHT//2 + 70, 160, 50),
+                     "NO", start_font, text_cache, WHITE, GREEN, radius=10)
+    shown = None
+
+    while True:
+        # mouse position and hover checks
+        mouse = pygame.mouse.get_pos()
+        hover_yes = yes_btn.hovered(mouse)
+        hover_no  = no_btn.hovered(mouse)
+
+        # Determine colors:
+        # If hovering, hover button is green and other is white (grey background).
+        # Otherwise, reflect keyboard selection (selected green, other white).
+        yes_active = hover_yes or (not hover_yes and not hover_no and selected == 0)
+        no_active  = hover_no  or (not hover_yes and not hover_no and selected == 1)
+
+        if (yes_active, no_active) != shown:
+            panel.draw(screen)
+            yes_btn.draw(screen, yes_active)
+            no_btn.draw(screen, no_active)
+            pygame.display.update()
+            shown = (yes_active, no_active)
+
+        for event in wait_events():
+
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+            # Keyboard navigation still works
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_UP:
+                    selected = (selected - 1) % 2
+                elif event.key == pygame.K_DOWN:
+                    selected = (selected + 1) % 2
+                elif event.key == pygame.K_RETURN:
+                    return selected == 0
+
+            # Mouse click: return based on hover
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if yes_btn.hovered(event.pos):
+                    return True
+                if no_btn.hovered(event.pos):
+                    return False
+
+# =================================================================
+#                     ⭐ FIXED START MENU WITH MOUSE ⭐
+# =================================================================
+def start_menu(username):
+    selected = 0
+    options = ["START GAME", "QUIT"]
+
+    panel = Panel((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK)
+    panel.add_text(text_cache, start_big, f"Welcome {username}", YELLOW,
+                   (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 140))
+
+    btn_w, btn_h = 300, 70
+    start_btn = Button(pygame.Rect(SCREEN_WIDTH//2 - btn_w//2,
+                                   SCREEN_HEIGHT//2 - 20,
+                                   btn_w, btn_h),
+                       "START GAME", start_font, text_cache, WHITE, GREEN, radius=12)
+    quit_btn = Button(pygame.Rect(SCREEN_WIDTH//2 - btn_w//2,
+                                  SCREEN_HEIGHT//2 + 80,
+                                  btn_w, btn_h),
+                      "QUIT", start_font, text_cache, WHITE, GREEN, radius=12)
+    shown = None
+
+    while True:
+        mouse = pygame.mouse.get_pos()
+
+        hover_start = start_btn.hovered(mouse)
+        hover_quit  = quit_btn.hovered(mouse)
+
+        if (hover_start, hover_quit) != shown:
+            panel.draw(screen)
+            start_btn.draw(screen, hover_start)
+            quit_btn.draw(screen, hover_quit)
+            pygame.display.update()
+            shown = (hover_start, hover_quit)
+
+        for event in wait_events():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+            # KEYBOARD (unchanged)
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_UP:
+                    selected = (selected - 1) % 2
+                elif event.key == pygame.K_DOWN:
+                    selected = (selected + 1) % 2
+                elif event.key == pygame.K_RETURN:
+                    if selected == 0:
+                        return "start"
+                    else:
+                        if quit_confirm():
+                            pygame.quit()
+                            sys.exit()
+                        shown = None
+
+            # MOUSE CLICK
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if start_btn.hovered(event.pos):
+                    return "start"
+                if quit_btn.hovered(event.pos):
+                    if quit_confirm():
+                        pygame.quit()
+                        sys.exit()
+                    shown = None
+
+# =================================================================
+#                     🖌️ BOARD DRAWING HELPERS
+# =================================================================
+
+def draw_grid():
+    background.draw(screen)
+
+# target: surface to draw on (the window unless given, e.g. an offscreen
+# frame in pixel_render.py)
+def draw_snake(snake, direction, boosted, target=None):
+    snake_tiles.draw(screen if target is None else target, snake, direction, CYAN if boosted else GREEN)
+
+def draw_apple(pos, target=None):
+    atlas.draw(screen if target is None else target, "apple", pos)
+
+def draw_specials(obstacle_position, star_position, bh1, bh2, target=None):
+    target = screen if target is None else target
+    atlas.draw(target, "fire", obstacle_position)
+    atlas.draw(target, "star", star_position)
+
+    if bh1 and bh2:
+        atlas.draw(target, "hole", bh1)
+        atlas.draw(target, "hole", bh2)
+
+def draw_score_and_high(score, high):
+    s, _ = text_cache.render(score_font, f"Score: {score}", BLACK)
+    screen.blit(s, (8, 6))
+    h, _ = text_cache.render(score_font, f"High Score: {high}", BLACK)
+    screen.blit(h, (8, 30))
+
+def score_and_high_rects(score, high):
+    _, s = text_cache.render(score_font, f"Score: {score}", BLACK)
+    _, h = text_cache.render(score_font, f"High Score: {high}", BLACK)
+    return [pygame.Rect(8, 6, s.width, s.height).inflate(4, 4),
+            pygame.Rect(8, 30, h.width, h.height).inflate(4, 4)]
+
+def draw_button(rect, text, hovered=False):
+    bg = (40, 40, 40) if not hovered else (60, 60, 60)
+    border = CYAN if hovered else GRAY
+    pygame.draw.rect(screen, bg, rect, border_radius=8)
+    pygame.draw.rect(screen, border, rect, 2, border_radius=8)
+    t, r = text_cache.render(menu_font, text, WHITE)
+    r.center = rect.center
+    screen.blit(t, r)
+
+# ---- board renderer: dirty rects, or a chunked camera view on large boards ----
+DIRTY_RECTS = True
+if LARGE_BOARD:
+    board = ChunkedRenderer(screen, GRID_SIZE, CELL_SIZE, WHITE, GRAY, atlas,
+                            draw_score_and_high, tiles=snake_tiles)
+else:
+    board = DirtyRenderer(screen, CELL_SIZE, background, atlas,
+                          draw_score_and_high, score_and_high_rects, tiles=snake_tiles)
+
+# ---- frame pacing: render/input at display rate, simulate on a fixed step ----
+DISPLAY_FPS = 60
+MAX_FRAME_TIME = 0.25   # cap on simulated time per frame after a stall
+
+# ---- turbo: simulate unthrottled, draw one frame every turbo_every steps ----
+# T toggles it during a game; game(turbo=True) starts the game in turbo
+# (--turbo on the command line) and turbo_every (--turbo-every N) sets N:
+# 0 draws nothing, for unattended runs; input is then polled every
+# TURBO_BATCH steps. Steps are the same steps the normal pace runs, so a
+# game plays out identically, only sooner.
+TURBO_EVERY = 50
+TURBO_BATCH = 1000
+
+# ---- autopilot: A* to the apple instead of the arrow keys ----
+# P toggles it during a game, game(autopilot=True) (--autopilot) starts
+# with it on; add turbo for a bot game at full speed. Each step's search
+# gets this budget.
+AUTOPILOT_BUDGET_US = 1000
+
+# ---- hamiltonian: follow a tour of the whole board instead ----
+# H toggles it during a game, game(hamiltonian=True) (--hamiltonian)
+# starts with it on; while it is on it drives in place of the A*
+# autopilot. It looks ahead near the black holes, so those steps are slow.
+
+MENU_HINT = "Use mouse to click  •  Press SPACE to close"
+
+# =================================================================
+#                           🎮 GAME LOOP
+# =================================================================
+def game(turbo=False, turbo_every=TURBO_EVERY, autopilot=False, stats=False, hamiltonian=False):
+    # stats: print the seed, turn latency and text cache counters at exit.
+    global HIGH_SCORE
+
+    normal_rate = 5     # simulation steps per second
+    boost_extra = 5     # extra steps per second while boosted
+    boost_seconds = 3
+
+    # The rules live in SnakeEngine; this loop only paces it, feeds it
+    # turns and draws what it holds. The boost is counted in steps.
+    engine = SnakeEngine(GRID_SIZE, boost_ticks=boost_seconds * (normal_rate + boost_extra),
+                         seed=SEED)
+
+    running = True
+    paused = False
+    menu_active = False
+    confirm_active = False
+    confirm_action = None
+
+    menu_box = pygame.Rect(SCREEN_WIDTH*0.2, SCREEN_HEIGHT*0.2,
+                           SCREEN_WIDTH*0.6, SCREEN_HEIGHT*0.6)
+
+    btn_w, btn_h = 240, 54
+    resume_btn = pygame.Rect(menu_box.centerx - btn_w//2, menu_box.top+120, btn_w, btn_h)
+    restart_btn = pygame.Rect(menu_box.centerx - btn_w//2, menu_box.top+120+74, btn_w, btn_h)
+    quit_btn = pygame.Rect(menu_box.centerx - btn_w//2, menu_box.top+120+148, btn_w, btn_h)
+
+    confirm_box = pygame.Rect((SCREEN_WIDTH-420)//2, (SCREEN_HEIGHT-180)//2, 420, 180)
+    yes_btn = pygame.Rect(confirm_box.centerx - 110, confirm_box.bottom - 60, 100, 42)
+    no_btn = pygame.Rect(confirm_box.centerx + 10, confirm_box.bottom - 60, 100, 42)
+
+    # The dimmed board is captured once per pause; only the widgets inside
+    # menu_area are repainted, and only when hover/confirm state changes.
+    dim_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    dim_overlay.fill((10,10,10,200))
+    _, hint_rect = text_cache.render(menu_font, MENU_HINT, GRAY)
+    hint_rect.center = (menu_box.centerx, quit_btn.bottom + 28)
+    menu_area = menu_box.union(confirm_box).union(hint_rect).clip(screen.get_rect())
+    paused_frame = None
+    menu_view = None
+
+    accumulator = 0.0
+    game_over = False
+    turns = TurnQueue()
+    autopilot = autopilot and not hamiltonian
+    pilot = Autopilot(GRID_SIZE, AUTOPILOT_BUDGET_US) if autopilot else None
+    solver = TourPilot(GRID_SIZE) if hamiltonian else None
+
+    def show_modes():
+        modes = [name for name, on in (("TURBO", turbo), ("AUTOPILOT", autopilot),
+                                       ("HAMILTONIAN", hamiltonian)) if on]
+        pygame.display.set_caption(" - ".join([CAPTION] + modes))
+
+    show_modes()
+    clock.tick()
+
+    def advance():
+        # One simulation step; True once the game is over.
+        global HIGH_SCORE
+        if hamiltonian:
+            action = solver.decide(engine)
+        elif autopilot:
+            action = pilot.decide(engine)
+        else:
+            action = turns.pop(engine.direction)
+        events = engine.step(action)
+        if events & (DIED | WON):
+            return True
+        if events & ATE_APPLE and engine.score > HIGH_SCORE:
+            HIGH_SCORE = engine.score
+            save_high_score(HIGH_SCORE)
+        return False
+
+    while running:
+        if turbo and not menu_active:
+            frame_time = clock.tick() / 1000.0
+        else:
+            frame_time = clock.tick(30 if menu_active else DISPLAY_FPS) / 1000.0
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                if not paused and not menu_active:
+                    paused = True
+                    menu_active = True
+                    confirm_active = True
+                    confirm_action = "quit"
+                else:
+                    running = False
+
+            elif event.type == pygame.KEYDOWN:
+
+                if event.key == pygame.K_SPACE:
+                    if not menu_active:
+                        paused = True
+                        menu_active = True
+                        confirm_active = False
+                    else:
+                        if not confirm_active:
+                            paused = False
+                            menu_active = False
+
+                elif event.key == pygame.K_t and not menu_active:
+                    turbo = not turbo
+                    accumulator = 0.0
+                    show_modes()
+
+                elif event.key == pygame.K_p and not menu_active:
+                    autopilot = not autopilot
+                    hamiltonian = False
+                    if autopilot and pilot is None:
+                        pilot = Autopilot(GRID_SIZE, AUTOPILOT_BUDGET_US)
+                    turns.clear()
+                    show_modes()
+
+                elif event.key == pygame.K_h and not menu_active:
+                    hamiltonian = not hamiltonian
+                    autopilot = False
+                    if hamiltonian and solver is None:
+                        solver = TourPilot(GRID_SIZE)
+                    turns.clear()
+                    show_modes()
+
+                elif not menu_active and not autopilot and not hamiltonian:
+                    if event.key in (pygame.K_w, pygame.K_UP):
+                        turns.push([0, -1], engine.direction)
+                    elif event.key in (pygame.K_s, pygame.K_DOWN):
+                        turns.push([0, 1], engine.direction)
+                    elif event.key in (pygame.K_a, pygame.K_LEFT):
+                        turns.push([-1, 0], engine.direction)
+                    elif event.key in (pygame.K_d, pygame.K_RIGHT):
+                        turns.push([1, 0], engine.direction)
+
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and menu_active:
+                mx, my = event.pos
+
+                if confirm_active:
+                    if yes_btn.collidepoint((mx, my)):
+                        if confirm_action == "restart":
+                            engine.reset()
+                            accumulator = 0.0
+                            turns.clear()
+                            paused = False
+                            menu_active = False
+                            confirm_active = False
+                        elif confirm_action == "quit":
+                            pygame.quit()
+                            sys.exit()
+
+                    elif no_btn.collidepoint((mx, my)):
+                        confirm_active = False
+                        confirm_action = None
+
+                else:
+                    if resume_btn.collidepoint((mx,my)):
+                        paused = False
+                        menu_active = False
+                    elif restart_btn.collidepoint((mx,my)):
+                        confirm_active = True
+                        confirm_action = "restart"
+                    elif quit_btn.collidepoint((mx,my)):
+                        confirm_active = True
+                        confirm_action = "quit"
+
+        if not menu_active and turbo:
+            for _ in range(turbo_every or TURBO_BATCH):
+                if advance():
+                    game_over = True
+                    break
+            if game_over:
+                break
+            if not turbo_every:
+                continue
+
+        elif not menu_active:
+            accumulator = min(accumulator + frame_time, MAX_FRAME_TIME)
+            step_time = 1.0 / (normal_rate + (boost_extra if engine.boosted else 0))
+
+            while accumulator >= step_time:
+                accumulator -= step_time
+                if advance():
+                    game_over = True
+                    break
+                step_time = 1.0 / (normal_rate + (boost_extra if engine.boosted else 0))
+
+            if game_over:
+                break
+
+        step_time = 1.0 / (normal_rate + (boost_extra if engine.boosted else 0))
+        snake = engine.snake
+        heading = turns.next_direction(engine.direction)
+        next_head = [snake[0][0] + heading[0], snake[0][1] + heading[1]]
+        items = [("apple", engine.apple), ("fire", engine.obstacle), ("star", engine.star)]
+        if engine.bh1 and engine.bh2:
+            items += [("hole", engine.bh1), ("hole", engine.bh2)]
+        color = CYAN if engine.boosted else GREEN
+        hud = (engine.score, HIGH_SCORE)
+        growing = next_head == engine.apple
+
+        if not menu_active:
+            if paused_frame is not None or not DIRTY_RECTS:
+                paused_frame = None
+                board.invalidate()
+            board.present(board.render(snake, heading, color, items, hud,
+                                       progress=accumulator / step_time,
+                                       growing=growing, steps=engine.steps))
+            continue
+
+        # ---- paused: freeze the dimmed board once, then redraw widgets on change ----
+        if paused_frame is None:
+            board.invalidate()
+            board.render(snake, heading, color, items, hud,
+                         progress=accumulator / step_time, growing=growing,
+                         steps=engine.steps)
+            screen.blit(dim_overlay, (0, 0))
+            paused_frame = screen.copy()
+            menu_view = None
+
+        mx, my = pygame.mouse.get_pos()
+        view = (confirm_active, confirm_action,
+                resume_btn.collidepoint((mx,my)), restart_btn.collidepoint((mx,my)),
+                quit_btn.collidepoint((mx,my)), yes_btn.collidepoint((mx,my)),
+                no_btn.collidepoint((mx,my)))
+        if view == menu_view:
+            continue
+
+        screen.blit(paused_frame, menu_area, menu_area)
+
+        pygame.draw.rect(screen, (30,30,30), menu_box, border_radius=12)
+        pygame.draw.rect(screen, (80,80,80), menu_box, 2, border_radius=12)
+
+        t, r = text_cache.render(menu_title_font, "PAUSED", CYAN)
+        r.center = (menu_box.centerx, menu_box.top + 60)
+        screen.blit(t, r)
+
+        draw_button(resume_btn, "Resume", resume_btn.collidepoint((mx,my)))
+        draw_button(restart_btn, "Restart", restart_btn.collidepoint((mx,my)))
+        draw_button(quit_btn, "Quit", quit_btn.collidepoint((mx,my)))
+
+        hint, hr = text_cache.render(menu_font, MENU_HINT, GRAY)
+        hr.center = (menu_box.centerx, quit_btn.bottom + 28)
+        screen.blit(hint, hr)
+
+        if confirm_active:
+            pygame.draw.rect(screen, (18,18,18), confirm_box, border_radius=10)
+            pygame.draw.rect(screen, (90,90,90), confirm_box, 2, border_radius=10)
+
+            msg = ("Restart game? All progress will be lost."
+                   if confirm_action == "restart"
+                   else "Quit the game? Your progress will be lost.")
+            t, _ = text_cache.render(menu_font, msg, WHITE)
+            tr = t.get_rect(center=(confirm_box.centerx, confirm_box.centery - 20))
+            screen.blit(t, tr)
+
+            draw_button(yes_btn, "Yes", yes_btn.collidepoint((mx,my)))
+            draw_button(no_btn, "No", no_btn.collidepoint((mx,my)))
+
+        if menu_view is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(menu_area)
+        menu_view = view
+
+    if engine.score > HIGH_SCORE:
+        HIGH_SCORE = engine.score
+        save_high_score(HIGH_SCORE)
+
+    if stats:
+        print(f"seed {engine.seed}, {engine.steps} steps")
+        print(turns.summary())
+        print("text cache: {hits} hits, {misses} misses, {entries} entries".format(**text_cache.stats()))
+    pygame.quit()
+
+# =================================================================
+#                     🎯 PROGRAM START
+# =================================================================
+def non_negative_int(text):
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"{text} is negative")
+    return value
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Snake")
+    parser.add_argument("--turbo", action="store_true", help="start the game in turbo mode")
+    parser.add_argument("--turbo-every", type=non_negative_int, default=TURBO_EVERY, metavar="N",
+                        help="steps per drawn frame in turbo (0 draws nothing)")
+    parser.add_argument("--autopilot", action="store_true", help="start with the A* autopilot on")
+    parser.add_argument("--hamiltonian", action="store_true", help="start with the tour pilot on")
+    parser.add_argument("--stats", action="store_true", help="print the seed, turn latency and text cache at exit")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    username = ask_username()
+    choice = start_menu(username)
+
+    if choice == "start":
+        game(args.turbo, args.turbo_every, args.autopilot, args.stats, args.hamiltonian)
@@ -0,0 +1,54 @@
+import numpy as np
+
+from batch_env import BatchSnakeEnv
+from snake_engine import ATE_APPLE, DIED, DIRECTIONS, GOT_STAR, TELEPORTED, WON, SnakeEngine
+
+# =================================================================
+#                     🧪 BATCH ENV REGRESSION TESTS
+# =================================================================
+# Every game of a seeded BatchSnakeEnv is copied into a SnakeEngine before
+# each step and both take the same action: events, score, boost and body
+# have to agree. Spawns come from different generators, so the new items
+# themselves are not compared, only what the step did.
+
+def engine_copy(env, game):
+    size = env.grid_size
+    def cell(i):
+        return None if i < 0 else [int(i % size), int(i // size)]
+    engine = SnakeEngine(size, env.boost_ticks, seed=0)
+    engine.set_snake(env.snake(game))
+    engine.apple = cell(env.apple[game])
+    engine.obstacle = cell(env.obstacle[game])
+    engine.star = cell(env.star[game])
+    engine.bh1 = cell(env.bh1[game])
+    engine.bh2 = cell(env.bh2[game])
+    engine.direction = DIRECTIONS[env.direction[game]]
+    engine.score = int(env.score[game])
+    engine.boosted = bool(env.boosted[game])
+    engine.boost_end = int(env.boost_end[game])
+    engine.steps = int(env.ticks[game])
+    return engine
+
+def test_batch_steps_match_the_engine():
+    seen = 0
+    for grid_size in (6, 8, 20):
+        env = BatchSnakeEnv(32, grid_size, seed=1)
+        rng = np.random.default_rng(2)
+        for t in range(400):
+            actions = rng.integers(-1, 4, env.num_games).astype(np.int8)
+            engines = [engine_copy(env, g) for g in range(env.num_games)]
+            events = env.step(actions)
+            for g, engine in enumerate(engines):
+                action = int(actions[g])
+                result = engine.step(None if action < 0 else action)
+                seen |= int(events[g])
+                if events[g] & (DIED | WON):
+                    # the batch game has already been reset
+                    assert result & (DIED | WON) == events[g] & (DIED | WON), (grid_size, t, g)
+                    continue
+                assert result == events[g], (grid_size, t, g)
+                assert engine.score == env.score[g]
+                assert engine.boosted == env.boosted[g]
+                assert [list(c) for c in engine.snake] == env.snake(g), (grid_size, t, g)
+    for event in (ATE_APPLE, GOT_STAR, TELEPORTED, DIED):
+        assert seen & event
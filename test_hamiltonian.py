@@ -0,0 +1,38 @@
+from hamiltonian import TourPilot, hamiltonian_cycle
+from snake_engine import DIED, TELEPORTED, WON, SnakeEngine
+
+# =================================================================
+#                     🧪 HAMILTONIAN TOUR TESTS
+# =================================================================
+# Every tour is a closed walk over the interior, around any fire cell. The
+# pilot plays seeded 6x6 games under the full rules (fire, star, black
+# holes that jump after every teleport) and has to clear each of them.
+
+def test_tours_cover_the_interior():
+    for size in range(6, 11):
+        for fire in [-1] + [y * size + x for y in range(1, size - 1) for x in range(1, size - 1)]:
+            order, pos = hamiltonian_cycle(size, fire)
+            prev = order[-1]
+            for k, i in enumerate(order):
+                assert abs(i % size - prev % size) + abs(i // size - prev // size) == 1, (size, fire, k)
+                assert pos[i] == k
+                prev = i
+            for y in range(1, size - 1):
+                for x in range(1, size - 1):
+                    assert (pos[y * size + x] < 0) == (y * size + x == fire), (size, fire, x, y)
+
+def test_pilot_clears_small_boards_with_holes():
+    grid_size = 6
+    for seed in range(4):
+        engine = SnakeEngine(grid_size)
+        engine.reset(seed)
+        pilot = TourPilot(grid_size, seed=seed)
+        teleports = 0
+        while engine.steps < 20000:
+            events = engine.step(pilot.decide(engine))
+            teleports += bool(events & TELEPORTED)
+            if events & (DIED | WON):
+                break
+        assert engine.won, (seed, engine.length, engine.steps)
+        assert teleports, seed
+        assert engine.bh1_i < 0
@@ -0,0 +1,105 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pygame.freetype
+
+from autopilot import Autopilot
+from renderer import BackgroundLayer, ChunkedRenderer, DirtyRenderer, SnakeTiles
+from snake_engine import DIED, WON, SnakeEngine
+from sprite_atlas import SpriteAtlas
+
+# =================================================================
+#                     🧪 RENDERER REGRESSION TESTS
+# =================================================================
+# The incremental renderers must put the same pixels on screen as a full
+# redraw of the same game state. An autopilot plays real games (apples,
+# stars, fire and teleports) and every frame is checked against a
+# renderer drawing it from scratch.
+
+CELL = 8
+GREEN = (0, 200, 0)
+CYAN = (0, 200, 200)
+
+pygame.init()
+pygame.freetype.init()
+FONT = pygame.freetype.Font(None, CELL)
+
+def make_atlas():
+    atlas = SpriteAtlas(CELL)
+    atlas.add("apple", FONT, "A", (220, 0, 0))
+    atlas.add("fire", FONT, "F", (255, 140, 0), anchor="center")
+    atlas.add("star", FONT, "S", (230, 200, 0), scale=True)
+    atlas.add("hole", FONT, "O", (0, 0, 0), scale=True)
+    return atlas
+
+def scene(engine):
+    items = [("apple", engine.apple), ("fire", engine.obstacle), ("star", engine.star)]
+    if engine.bh1 and engine.bh2:
+        items += [("hole", engine.bh1), ("hole", engine.bh2)]
+    color = CYAN if engine.boosted else GREEN
+    return engine.snake, engine.direction, color, items
+
+def frames(grid_size, steps_per_frame, count, seed=0):
+    # Engine positions every steps_per_frame steps of autopilot play,
+    # restarting on a game over.
+    engine = SnakeEngine(grid_size, seed=seed)
+    pilot = Autopilot(grid_size)
+    game = seed
+    for _ in range(count):
+        for _ in range(steps_per_frame):
+            if engine.step(pilot.decide(engine)) & (DIED | WON):
+                game += 1
+                engine.reset(game)
+        yield engine
+
+def pixels(surface):
+    return pygame.image.tobytes(surface, "RGB")
+
+def dirty_mismatches(grid_size, steps_per_frame, count):
+    size = (grid_size * CELL, grid_size * CELL)
+    atlas, tiles = make_atlas(), SnakeTiles(CELL)
+    background = BackgroundLayer(grid_size, CELL, (255, 255, 255), (200, 200, 200))
+    live, fresh = pygame.Surface(size), pygame.Surface(size)
+    board = DirtyRenderer(live, CELL, background, atlas, lambda: None, lambda: [], tiles)
+    full = DirtyRenderer(fresh, CELL, background, atlas, lambda: None, lambda: [], tiles)
+    bad = 0
+    for engine in frames(grid_size, steps_per_frame, count):
+        snake, direction, color, items = scene(engine)
+        board.render(snake, direction, color, items, (), steps=engine.steps)
+        full.invalidate()
+        full.render(snake, direction, color, items, ())
+        bad += pixels(live) != pixels(fresh)
+    return bad
+
+def chunked_mismatches(grid_size, steps_per_frame, count):
+    view = (12 * CELL, 12 * CELL)       # smaller than the board: the camera moves
+    atlas, tiles = make_atlas(), SnakeTiles(CELL)
+    live, fresh = pygame.Surface(view), pygame.Surface(view)
+    args = (grid_size, CELL, (255, 255, 255), (200, 200, 200), atlas, lambda: None)
+    board = ChunkedRenderer(live, *args, tiles=tiles, chunk_cells=4)
+    bad = 0
+    for engine in frames(grid_size, steps_per_frame, count):
+        snake, direction, color, items = scene(engine)
+        board.render(snake, direction, color, items, (), steps=engine.steps)
+        ChunkedRenderer(fresh, *args, tiles=tiles, chunk_cells=4).render(snake, direction, color, items, ())
+        bad += pixels(live) != pixels(fresh)
+    return bad
+
+def test_dirty_frames_match_full_redraw():
+    # Normal pace: one engine step per frame.
+    assert dirty_mismatches(12, 1, 1500) == 0
+
+def test_dirty_turbo_frames_match_full_redraw():
+    # Several steps per frame can take the head back over the cell it was
+    # drawn on last frame; the diff must still come out right.
+    assert dirty_mismatches(12, 10, 600) == 0
+    assert dirty_mismatches(12, 50, 300) == 0
+
+def test_chunked_frames_match_full_redraw():
+    assert chunked_mismatches(24, 1, 800) == 0
+
+def test_chunked_turbo_frames_match_full_redraw():
+    assert chunked_mismatches(24, 10, 400) == 0
+    assert chunked_mismatches(24, 50, 200) == 0
@@ -0,0 +1,39 @@
+from collections import OrderedDict
+
+# =================================================================
+#                     🔤 TEXT SURFACE CACHE
+# =================================================================
+# HUD numbers, menu titles and button labels are redrawn every frame but
+# only change now and then. Rendered surfaces are kept in an LRU keyed on
+# (font, text, color, size); hits/misses show whether a steady-state frame
+# is doing any rasterization at all.
+
+class TextCache:
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, size=0):
+        key = (font, text, tuple(color), size)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        else:
+            self.misses += 1
+            entry = font.render(text, color, size=size)
+            self.entries[key] = entry
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        # Callers move the rect around, so never hand out the cached one.
+        surf, rect = entry
+        return surf, rect.copy()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries)}
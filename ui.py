@@ -0,0 +1,57 @@
+import pygame
+
+# =================================================================
+#                     🪟 RETAINED-MODE MENU UI
+# =================================================================
+# Menu screens block on input instead of spinning: wait_events() sleeps
+# until something happens (or WAIT_MS passes), static parts of a screen
+# are baked once into a Panel, and buttons keep their geometry and label
+# surfaces. A screen only repaints when its visible state changes.
+
+WAIT_MS = 250   # upper bound on how long a menu sleeps without input
+
+def wait_events(timeout=WAIT_MS):
+    first = pygame.event.wait(timeout)
+    if first.type == pygame.NOEVENT:
+        return []
+    return [first] + pygame.event.get()
+
+class Button:
+    def __init__(self, rect, label, font, text_cache, idle_color, active_color,
+                 bg=(50, 50, 50), radius=10, border=3):
+        self.rect = rect
+        self.bg = bg
+        self.radius = radius
+        self.border = border
+        self.colors = {False: idle_color, True: active_color}
+        self.labels = {}
+        for active, color in self.colors.items():
+            surf, r = text_cache.render(font, label, color)
+            r.center = rect.center
+            self.labels[active] = (surf, r)
+
+    def hovered(self, pos):
+        return self.rect.collidepoint(pos)
+
+    def draw(self, surface, active):
+        pygame.draw.rect(surface, self.bg, self.rect, border_radius=self.radius)
+        pygame.draw.rect(surface, self.colors[active], self.rect, self.border,
+                         border_radius=self.radius)
+        surf, r = self.labels[active]
+        surface.blit(surf, r)
+
+class Panel:
+    # Background fill plus any text that never changes, baked once.
+    def __init__(self, size, fill):
+        self.surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self.surface.fill(fill)
+
+    def add_text(self, text_cache, font, text, color, center):
+        surf, r = text_cache.render(font, text, color)
+        r.center = center
+        self.surface.blit(surf, r)
+
+    def draw(self, surface):
+        surface.blit(self.surface, (0, 0))
@@ -0,0 +1,191 @@
+import multiprocessing as mp
+import os
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from batch_env import BatchSnakeEnv
+from snake_engine import ATE_APPLE, BOOST_TICKS, DIED, WON
+
+# =================================================================
+#                     🧵 MULTIPROCESS VECTOR ENVIRONMENT
+# =================================================================
+# K games split across worker processes, each running a BatchSnakeEnv over
+# its slice. Actions, observations (board() grids), rewards, done flags and
+# event flags all live in shared-memory arrays: the parent writes actions
+# in place, workers write results in place, and the pipes only carry a
+# one-word command and an ack. step_async() / step_wait() let the learner
+# work while the workers simulate.
+#
+# Reward is +1 for an apple and -1 for a death; finished games are reset
+# by their worker, so the observation after a done is the new game's.
+
+def _attach(name, shape, dtype):
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def _worker(conn, specs, start, stop, grid_size, seed, boost_ticks):
+    blocks = {}
+    arrays = {}
+    for key, (name, shape, dtype) in specs.items():
+        blocks[key], arrays[key] = _attach(name, shape, dtype)
+    actions = arrays["actions"][start:stop]
+    obs = arrays["obs"][start:stop]
+    rewards = arrays["rewards"][start:stop]
+    dones = arrays["dones"][start:stop]
+    events = arrays["events"][start:stop]
+
+    env = BatchSnakeEnv(stop - start, grid_size, boost_ticks=boost_ticks, seed=seed)
+    try:
+        while True:
+            cmd = conn.recv()
+            if cmd == "step":
+                events[:] = env.step(actions)
+                rewards[:] = (events & ATE_APPLE) != 0
+                rewards[(events & DIED) != 0] = -1.0
+                dones[:] = (events & (DIED | WON)) != 0
+                env.board(obs)
+            elif cmd == "reset":
+                env.reset(seed)
+                env.board(obs)
+                rewards[:] = 0.0
+                dones[:] = False
+                events[:] = 0
+            elif cmd == "close":
+                break
+            conn.send(cmd)
+    finally:
+        for shm in blocks.values():
+            shm.close()
+        conn.close()
+
+class VectorSnakeEnv:
+    def __init__(self, num_games, num_workers=None, grid_size=20, seed=None,
+                 boost_ticks=BOOST_TICKS):
+        self.num_games = num_games
+        self.num_workers = max(1, min(num_workers or os.cpu_count() or 1, num_games))
+        self.grid_size = grid_size
+
+        layout = {
+            "actions": ((num_games,), np.int8),
+            "obs": ((num_games, grid_size, grid_size), np.uint8),
+            "rewards": ((num_games,), np.float32),
+            "dones": ((num_games,), np.bool_),
+            "events": ((num_games,), np.uint8),
+        }
+        self.blocks = {}
+        specs = {}
+        for key, (shape, dtype) in layout.items():
+            nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            self.blocks[key] = shm
+            setattr(self, key, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+            specs[key] = (shm.name, shape, dtype)
+        self.actions[:] = -1
+
+        seeds = np.random.SeedSequence(seed).spawn(self.num_workers)
+        bounds = np.linspace(0, num_games, self.num_workers + 1).astype(int)
+        self.conns = []
+        self.procs = []
+        for i in range(self.num_workers):
+            parent, child = mp.Pipe()
+            proc = mp.Process(target=_worker, daemon=True,
+                              args=(child, specs, bounds[i], bounds[i + 1],
+                                    grid_size, seeds[i], boost_ticks))
+            proc.start()
+            child.close()
+            self.conns.append(parent)
+            self.procs.append(proc)
+        self.waiting = False
+        self.closed = False
+
+    def _send(self, cmd):
+        for conn in self.conns:
+            conn.send(cmd)
+
+    def _wait(self):
+        for conn in self.conns:
+            conn.recv()
+
+    def reset(self):
+        self._send("reset")
+        self._wait()
+        return self.obs
+
+    def step_async(self, actions=None):
+        # Actions go straight into shared memory; -1 keeps the direction.
+        if actions is None:
+            self.actions[:] = -1
+        else:
+            self.actions[:] = actions
+        self._send("step")
+        self.waiting = True
+
+    def step_wait(self):
+        # The returned arrays are the shared buffers themselves: copy them
+        # if they must survive the next step.
+        self._wait()
+        self.waiting = False
+        return self.obs, self.rewards, self.dones, self.events
+
+    def step(self, actions=None):
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self):
+        if self.closed:
+            return
+        if self.waiting:
+            self._wait()
+        self._send("close")
+        for proc in self.procs:
+            proc.join()
+        for conn in self.conns:
+            conn.close()
+        for key, shm in self.blocks.items():
+            delattr(self, key)
+            shm.close()
+            shm.unlink()
+        self.closed = True
+
+# =================================================================
+#                     ⏱️ SCALING BENCHMARK
+# =================================================================
+# Fixed games per worker (weak scaling): with W workers on W free cores
+# the rate should grow close to W times the one-worker rate. The async
+# run overlaps a stand-in learner (building the next actions) with the
+# workers' step.
+
+def benchmark(num_workers, games_per_worker=4096, steps=200, grid_size=20, seed=0):
+    env = VectorSnakeEnv(games_per_worker * num_workers, num_workers, grid_size, seed)
+    rng = np.random.default_rng(seed)
+    try:
+        env.reset()
+        start = time.perf_counter()
+        for _ in range(steps):
+            env.step(rng.integers(-1, 4, size=env.num_games, dtype=np.int8))
+        sync = env.num_games * steps / (time.perf_counter() - start)
+
+        actions = rng.integers(-1, 4, size=env.num_games, dtype=np.int8)
+        start = time.perf_counter()
+        for _ in range(steps):
+            env.step_async(actions)
+            actions = rng.integers(-1, 4, size=env.num_games, dtype=np.int8)
+            env.step_wait()
+        async_rate = env.num_games * steps / (time.perf_counter() - start)
+    finally:
+        env.close()
+    return sync, async_rate
+
+if __name__ == "__main__":
+    cores = os.cpu_count() or 1
+    counts = [int(a) for a in sys.argv[1:]] or sorted({1, 2, 4, 8, 16, 32, cores} & set(range(1, cores + 1)))
+    base = None
+    print(f"{cores} cores, 4096 games per worker, 20x20")
+    print("workers        step (sync)       step_async/wait   scaling")
+    for workers in counts:
+        sync, async_rate = benchmark(workers)
+        base = base or sync
+        print(f"{workers:7d}   {sync:14,.0f}/s   {async_rate:14,.0f}/s   {sync / base:6.2f}x")